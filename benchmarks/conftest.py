@@ -0,0 +1,125 @@
+"""
+Shared fixtures of the benchmarks. Payloads are generated once per size and reused by all benchmarks of that size.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+import ornitho
+from ornitho import Observation
+from ornitho.testing import MockBiolovisionServer, synthetic_sightings
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+# Number of sightings per page, like the pages sent by Biolovision
+PAGE_SIZE = 1000
+
+# Number of sightings per form
+FORM_SIZE = 100
+
+
+def pytest_addoption(parser: Any) -> None:
+    parser.addoption(
+        "--bench-sizes",
+        default="1000,100000",
+        help="Comma separated numbers of sightings, e.g. 1000,100000,1000000 (1M needs about 4 GB of memory)",
+    )
+
+
+def pytest_generate_tests(metafunc: Any) -> None:
+    if "size" in metafunc.fixturenames:
+        sizes = [
+            int(size) for size in metafunc.config.getoption("bench_sizes").split(",")
+        ]
+        metafunc.parametrize(
+            "size",
+            sizes,
+            ids=[
+                f"{size // 1000000}M" if size >= 1000000 else f"{size // 1000}k"
+                for size in sizes
+            ],
+            indirect=True,
+            scope="session",
+        )
+
+
+@pytest.fixture(scope="session")
+def size(request: Any) -> int:
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def sightings(size: int) -> List[Dict[str, Any]]:
+    """Distinct raw sightings"""
+    return synthetic_sightings(size, seed=0)
+
+
+@pytest.fixture(scope="session")
+def forms(sightings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Raw forms holding copies of the sightings, so flattening does not alter the sightings"""
+    return [
+        {
+            "@id": str(i // FORM_SIZE + 1),
+            "time_start": "06:00:00",
+            "time_stop": "07:00:00",
+            "full_form": "1",
+            "sightings": [dict(sighting) for sighting in sightings[i : i + FORM_SIZE]],
+        }
+        for i in range(0, len(sightings), FORM_SIZE)
+    ]
+
+
+@pytest.fixture(scope="session")
+def observations(sightings: List[Dict[str, Any]]) -> List[Observation]:
+    return [Observation.create_from_ornitho_json(sighting) for sighting in sightings]
+
+
+def paginate(
+    responses: List[Any],
+) -> Dict[Optional[str], Tuple[Any, Optional[str]]]:
+    """Chain responses by pagination keys, the last one has no pagination key"""
+    keys: List[Optional[str]] = [None] + [f"pk{i}" for i in range(1, len(responses))]
+    return {
+        key: (response, keys[i + 1] if i + 1 < len(keys) else None)
+        for i, (key, response) in enumerate(zip(keys, responses))
+    }
+
+
+@pytest.fixture(scope="session")
+def sighting_pages(
+    sightings: List[Dict[str, Any]],
+) -> Dict[Optional[str], Tuple[Any, Optional[str]]]:
+    """Decoded search responses of PAGE_SIZE sightings, keyed by their pagination key"""
+    return paginate(
+        [
+            {"data": {"sightings": sightings[i : i + PAGE_SIZE]}}
+            for i in range(0, len(sightings), PAGE_SIZE)
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def form_pages(
+    forms: List[Dict[str, Any]],
+) -> Dict[Optional[str], Tuple[Any, Optional[str]]]:
+    """Decoded search responses of PAGE_SIZE / FORM_SIZE forms, keyed by their pagination key"""
+    per_page = PAGE_SIZE // FORM_SIZE
+    return paginate(
+        [
+            {"data": {"forms": forms[i : i + per_page]}}
+            for i in range(0, len(forms), per_page)
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_server(sightings: List[Dict[str, Any]]) -> Any:
+    """Local Biolovision stand-in, serving the sightings in pages of PAGE_SIZE"""
+    with MockBiolovisionServer(page_size=PAGE_SIZE) as server:
+        server.add_sightings(sightings)
+        yield server
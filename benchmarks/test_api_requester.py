@@ -0,0 +1,74 @@
+from typing import Any, Dict, Optional, Tuple
+from unittest import mock
+
+import pytest
+
+from ornitho import APIRequester
+
+pytest.importorskip("pytest_benchmark")
+
+# Mock server benchmarks transfer about 1 kB JSON per sighting, larger sizes are only run in-process
+MAX_MOCK_SERVER_SIZE = 100000
+
+
+def fake_request_raw(pages: Dict[Optional[str], Tuple[Any, Optional[str]]]) -> Any:
+    """Return the decoded page of the requested pagination key, without any I/O"""
+
+    def request_raw(pagination_key: Optional[str] = None, **kwargs: Any) -> Any:
+        return pages[pagination_key]
+
+    return request_raw
+
+
+def test_request_sighting_pages(benchmark, size, sighting_pages):
+    with APIRequester() as requester, mock.patch.object(
+        requester, "request_raw", fake_request_raw(sighting_pages)
+    ):
+        data, pk = benchmark(
+            requester.request,
+            method="post",
+            url="observations/search",
+            body={"period_choice": "all"},
+            request_all=True,
+        )
+    assert len(data) == size
+
+
+def test_request_form_pages(benchmark, size, form_pages):
+    with APIRequester() as requester, mock.patch.object(
+        requester, "request_raw", fake_request_raw(form_pages)
+    ):
+        data, pk = benchmark(
+            requester.request,
+            method="post",
+            url="observations/search",
+            body={"period_choice": "all"},
+            request_all=True,
+        )
+    assert len(data) == size
+
+
+def test_flatten_form(benchmark, size, forms):
+    def flatten():
+        return [
+            sighting for form in forms for sighting in APIRequester.flatten_form(form)
+        ]
+
+    assert len(benchmark(flatten)) == size
+
+
+def test_request_mock_server(benchmark, size, mock_server):
+    if size > MAX_MOCK_SERVER_SIZE:
+        pytest.skip(f"Mock server benchmarks are limited to {MAX_MOCK_SERVER_SIZE}")
+    with APIRequester(api_base=mock_server.api_base) as requester:
+        data, pk = benchmark.pedantic(
+            requester.request,
+            kwargs={
+                "method": "post",
+                "url": "observations/search",
+                "body": {"period_choice": "all"},
+                "request_all": True,
+            },
+            rounds=3,
+        )
+    assert len(data) == size
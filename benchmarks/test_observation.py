@@ -0,0 +1,69 @@
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from ornitho import Form, ModificationType, Observation
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_create_from_ornitho_json(benchmark, size, sightings):
+    def create():
+        return [
+            Observation.create_from_ornitho_json(sighting) for sighting in sightings
+        ]
+
+    assert len(benchmark(create)) == size
+
+
+def test_create_and_access_properties(benchmark, size, sightings):
+    def create_and_access():
+        coord_lat = 0.0
+        for sighting in sightings:
+            observation = Observation.create_from_ornitho_json(sighting)
+            observation.timing
+            observation.details
+            observation.species
+            coord_lat += observation.coord_lat
+        return coord_lat
+
+    assert benchmark(create_and_access) > 0
+
+
+def test_raw_data_trim_field_ids_form(benchmark, size, sightings):
+    form = Form.create_from_ornitho_json(
+        {"@id": "1", "full_form": "1", "sightings": sightings}
+    )
+    form.observations
+    raw_data = benchmark.pedantic(form.raw_data_trim_field_ids, rounds=3)
+    assert len(raw_data["sightings"]) == size
+
+
+def test_diff_ids(benchmark, size):
+    changes = [
+        {
+            "id_sighting": str(id_),
+            "id_universal": f"28_{id_}",
+            "modification_type": "deleted" if id_ % 10 == 0 else "updated",
+        }
+        for id_ in range(1, size + 1)
+    ]
+    with mock.patch.object(Observation, "request", return_value=changes):
+        updated, deleted = benchmark(Observation.diff_ids, date=datetime(2020, 1, 1))
+    assert len(updated) + len(deleted) == size
+
+
+def test_diff_retrieve_observations(benchmark, size, observations):
+    ids = [observation.id_ for observation in observations]
+    # Chunks are received in another order than the diff
+    chunks = [observations[i : i + 1000] for i in range(0, size, 1000)][::-1]
+    with mock.patch.object(
+        Observation, "diff_ids", return_value=(ids, [])
+    ), mock.patch.object(
+        Observation, "iter_retrieve", side_effect=lambda *args, **kwargs: iter(chunks)
+    ):
+        diff = benchmark(
+            Observation.diff, date=datetime(2020, 1, 1), retrieve_observations=True
+        )
+    assert diff[ModificationType.ONLY_MODIFIED] == observations
@@ -6,6 +6,7 @@ An ornitho API client
 :copyright: (c) 2019 by DDA
 :license: MIT, see LICENSE for more details.
 """
+
 import logging
 import os
 from typing import Callable, Optional
@@ -24,7 +25,22 @@ from ornitho.api_exception import (
     ServiceUnavailableException,
 )
 from ornitho.api_requester import APIRequester
+from ornitho.bulk_create import BulkCreateReport
+from ornitho.catalog import Catalog
+from ornitho.checkpoint import Checkpoint
+from ornitho.form_upload import FormUpload
+from ornitho.identity_map import IdentityMap, identity_map
+from ornitho.instrumentation import (
+    Hooks,
+    MetricsCollector,
+    OpenTelemetryAdapter,
+    PrometheusAdapter,
+    RequestEvent,
+    hooks,
+)
+from ornitho.mirror import ObservationMirror
 from ornitho.model import (
+    CompactModel,
     Detail,
     Entity,
     EstimationCode,
@@ -50,7 +66,16 @@ from ornitho.model import (
     Species,
     TaxonomicGroup,
     TerritorialUnit,
+    compact_model,
+)
+from ornitho.rate_limiter import (
+    RateLimiter,
+    RedisRateLimiter,
+    SQLiteRateLimiter,
+    get_rate_limiter,
 )
+from ornitho.retry_policy import RetryPolicy
+from ornitho.session_registry import SessionRegistry, session_registry
 
 __version__ = "0.3.0"
 __license__ = "MIT"
@@ -77,8 +102,37 @@ cache_redis_host: str = "localhost"
 cache_redis_port: int = 6379
 cache_redis_db: int = 0
 
+session_pooling: bool = True
+pool_connections: int = 10
+pool_maxsize: int = 10
+
+identity_map_enabled: bool = False
+identity_map_maxsize: int = 10000
+identity_map_ttl: Optional[int] = 600
+
+retry_policy: RetryPolicy = RetryPolicy()
+
+rate_limit: Optional[float] = None
+rate_limit_burst: int = 1
+max_in_flight: Optional[int] = None
+rate_limit_backend: str = "memory"
+rate_limit_name: str = "ornitho_rate_limit"
+rate_limit_lease_timeout: float = 300.0
+
+json_backend: str = "auto"
+stream_chunk_size: int = 65536
+
 log_level = os.environ.get("ORNITHO_LOG_LEVEL") or logging.WARNING
 logging.basicConfig(
     level=log_level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
+# Strings in logged request bodies and parameters are truncated to this length
+log_body_max_length: int = 80
+# Directory, to which the full request and response payloads are written for debugging. Disabled if None
+log_payload_dir: Optional[str] = os.environ.get("ORNITHO_LOG_PAYLOAD_DIR") or None
+
+
+def shutdown() -> None:
+    """Close all pooled sessions. A later request opens a new one."""
+    session_registry.close()
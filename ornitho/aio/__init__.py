@@ -0,0 +1,15 @@
+# flake8: noqa
+"""
+Asynchronous counterparts of the API requester and the model requests, based on aiohttp
+"""
+
+from ornitho.aio.api_requester import AsyncAPIRequester
+from ornitho.aio.model import (
+    create_in_ornitho,
+    delete,
+    gather_get,
+    get,
+    list_,
+    refresh,
+    search,
+)
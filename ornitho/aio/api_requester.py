@@ -0,0 +1,358 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union, cast
+
+from requests import Request, Response
+from requests.structures import CaseInsensitiveDict
+from requests_oauthlib import OAuth1
+
+import ornitho
+from ornitho import api_exception
+from ornitho.api_requester import BaseAPIRequester
+from ornitho.instrumentation import Hooks
+from ornitho.rate_limiter import RateLimiter, get_rate_limiter
+from ornitho.retry_policy import RetryPolicy
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = cast(Any, None)
+
+
+class AsyncAPIRequester(BaseAPIRequester):
+    """Class for making asynchronous API requests
+    Requests are signed with OAuth1 and sent with aiohttp. URL building, response decoding, error handling and the
+    retry decisions are shared with the synchronous APIRequester via BaseAPIRequester. At most max_concurrency
+    requests are in flight at the same time.
+    """
+
+    def __init__(
+        self,
+        consumer_key: Optional[str] = None,
+        consumer_secret: Optional[str] = None,
+        user_email: Optional[str] = None,
+        user_pw: Optional[str] = None,
+        api_base: Optional[str] = None,
+        max_concurrency: int = 10,
+        retry_policy: Optional[RetryPolicy] = None,
+        hooks: Optional[Hooks] = None,
+    ) -> None:
+        """Async API requester constructor
+        :param consumer_key: Optional Consumer Key, overrides field from ornitho module (ornitho.consumer_key)
+        :param consumer_secret: Optional Consumer Secret, overrides field from ornitho module (ornitho.consumer_secret)
+        :param user_email: Optional User Mail, overrides field from ornitho module (ornitho.user_email)
+        :param user_pw: Optional User Password, overrides field from ornitho module (ornitho.user_pw)
+        :param api_base: Optional API base url, overrides field from ornitho module (ornitho.api_base)
+        :param max_concurrency: Maximum number of concurrent requests. Default: 10
+        :param retry_policy: Optional retry policy, overrides field from ornitho module (ornitho.retry_policy)
+        :param hooks: Optional instrumentation hooks, overrides field from ornitho module (ornitho.hooks)
+        :type consumer_key: Optional[str]
+        :type consumer_secret: Optional[str]
+        :type user_email: Optional[str]
+        :type user_pw: Optional[str]
+        :type api_base: Optional[str]
+        :type max_concurrency: int
+        :type retry_policy: Optional[RetryPolicy]
+        :type hooks: Optional[Hooks]
+        """
+        if aiohttp is None:  # pragma: no cover
+            raise RuntimeError(
+                "Async dependency is not installed. Please install 'aiohttp'"
+            )
+        super(AsyncAPIRequester, self).__init__(
+            consumer_key=consumer_key,
+            consumer_secret=consumer_secret,
+            user_email=user_email,
+            user_pw=user_pw,
+            api_base=api_base,
+            retry_policy=retry_policy,
+            hooks=hooks,
+        )
+        self.auth: OAuth1 = OAuth1(
+            client_key=self.consumer_key,
+            client_secret=self.consumer_secret,
+        )
+        self.max_concurrency: int = max_concurrency
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        """Used by an async with-statement"""
+        return self
+
+    async def __aexit__(self, *args):
+        """Used by an async with-statement"""
+        await self.close()
+
+    async def close(self):
+        """Close the aiohttp session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        self._semaphore = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        pagination_key: Optional[str] = None,
+        short_version: bool = False,
+        request_all: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        retries: int = 0,
+        idempotent: bool = True,
+    ) -> Tuple[Union[bytes, List[Dict[str, str]]], Optional[str]]:
+        """Make requests to the API, see APIRequester.request
+        :param method: HTTP Method e.g. 'GET'
+        :param url: API URL to call
+        :param pagination_key: Additional pagination key, to get the next page
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+            Default: 'False'
+        :param request_all:  Indicates, if all pages should be returned. May result in many API calls. Default: 'False'
+        :param params: Additional URL parameters.
+        :param body: Request body
+        :param retries: Indicates how many retries should be performed
+        :param idempotent: Indicates, if the request can be repeated without side effects. Else it is only retried, if
+            the server did not process it, see RetryPolicy. Default: 'True'
+        :type method: str
+        :type url: str
+        :type pagination_key: str
+        :type short_version: bool
+        :type request_all: bool
+        :type params: Dict[str, Any]
+        :type body: Dict[str, Any]
+        :type retries: int
+        :type idempotent: bool
+        :return: Tuple of raw data list and pagination key
+        :rtype: Tuple[Union[bytes, List[Dict[str, str]]], Optional[str]]
+        """
+        data: List[Dict[str, str]] = []
+        first_pk: Optional[str] = None
+        first_page = True
+        async for page, pk in self.iter_pages(
+            method=method,
+            url=url,
+            pagination_key=pagination_key,
+            short_version=short_version,
+            request_all=request_all,
+            params=params,
+            body=body,
+            retries=retries,
+            idempotent=idempotent,
+        ):
+            if first_page:
+                if isinstance(page, bytes):
+                    return page, pk
+                first_pk = pk
+                first_page = False
+            data.extend(cast(List[Dict[str, str]], page))
+        return data, first_pk
+
+    async def iter_pages(
+        self,
+        method: str,
+        url: str,
+        pagination_key: Optional[str] = None,
+        short_version: bool = False,
+        request_all: bool = True,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        retries: int = 0,
+        idempotent: bool = True,
+    ) -> AsyncIterator[Tuple[Union[bytes, List[Dict[str, str]]], Optional[str]]]:
+        """Make requests to the API and yield every page as soon as it is received, see APIRequester.iter_pages
+        :param method: HTTP Method e.g. 'GET'
+        :param url: API URL to call
+        :param pagination_key: Additional pagination key, to get the next page
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+            Default: 'False'
+        :param request_all: Indicates, if all following pages should be requested. Default: 'True'
+        :param params: Additional URL parameters.
+        :param body: Request body
+        :param retries: Indicates how many retries should be performed
+        :param idempotent: Indicates, if the request can be repeated without side effects. Else it is only retried, if
+            the server did not process it, see RetryPolicy. Default: 'True'
+        :type method: str
+        :type url: str
+        :type pagination_key: str
+        :type short_version: bool
+        :type request_all: bool
+        :type params: Dict[str, Any]
+        :type body: Dict[str, Any]
+        :type retries: int
+        :type idempotent: bool
+        :return: Async iterator of raw data lists and pagination keys
+        :rtype: AsyncIterator[Tuple[Union[bytes, List[Dict[str, str]]], Optional[str]]]
+        :raise APIException: Received bytes on a following page
+        """
+        first_page = True
+        page = 0
+        while True:
+            responds, pk = await self.request_raw(
+                method=method.lower(),
+                url=url,
+                pagination_key=pagination_key,
+                short_version=short_version,
+                params=params,
+                body=body,
+                retries=retries,
+                idempotent=idempotent,
+            )
+            if isinstance(responds, bytes):
+                if not first_page:
+                    raise api_exception.APIException(
+                        "Received bytes content, where json was expected"
+                    )
+                yield responds, pk
+                return
+            data = self.extract_data(responds)
+            ornitho.logger.info("Received %s data objects", len(data))
+            if self.hooks.active:
+                self.emit_page(method, url, page, len(data), pk)
+            yield data, pk
+
+            if not (pk and request_all and len(data) > 0):
+                return
+            pagination_key = pk
+            first_page = False
+            page += 1
+
+    async def request_raw(
+        self,
+        method: str,
+        url: str,
+        pagination_key: Optional[str] = None,
+        short_version: bool = False,
+        params: Dict[str, Any] = None,
+        body: Dict[str, Any] = None,
+        retries: int = 0,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: bool = True,
+    ) -> Tuple[Any, Any]:
+        """Make direct request to the API, see APIRequester.request_raw
+        :param method: HTTP Method e.g. 'GET'
+        :param url: API URL to call
+        :param pagination_key: Additional pagination key, to get the next page
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+            Default: 'False'
+        :param params: Additional URL parameters.
+        :param body: Request body
+        :param retries: Indicates how many retries should be performed, at least retry_policy.max_retries are performed
+        :param retry_policy: Optional retry policy, overrides the policy of the requester
+        :param idempotent: Indicates, if the request can be repeated without side effects. Else it is only retried, if
+            the server did not process it, see RetryPolicy. Default: 'True'
+        :type method: str
+        :type url: str
+        :type pagination_key: str
+        :type short_version: bool
+        :type params: Dict[str, Any]
+        :type body: Dict[str, Any]
+        :type retries: int
+        :type retry_policy: Optional[RetryPolicy]
+        :type idempotent: bool
+        :return: Tuple of raw response data and pagination key
+        :rtype: Tuple[Any, Any]
+        """
+        abs_url, data = self.prepare_request(
+            method=method,
+            url=url,
+            pagination_key=pagination_key,
+            short_version=short_version,
+            params=params,
+            body=body,
+        )
+        attempts = self.attempts(
+            method, abs_url, data, retries, retry_policy, idempotent
+        )
+        while True:
+            attempts.begin()
+            try:
+                raw_response = await self.send(method, abs_url, data)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as ex:
+                delay = attempts.failed(ex)
+                if delay is None:
+                    raise
+            else:
+                delay = attempts.received(raw_response)
+                if delay is None:
+                    break
+            await asyncio.sleep(delay)
+
+        return self.handle_response(method, raw_response)
+
+    @staticmethod
+    async def enter(rate_limiter: RateLimiter) -> Optional[str]:
+        """Wait for a free in-flight slot of the rate limiter in the default executor, see RateLimiter.enter
+        If the waiting task is cancelled, a slot granted afterwards is freed again.
+        :param rate_limiter: Rate limiter
+        :type rate_limiter: RateLimiter
+        :return: Lease of the slot, which has to be passed to leave()
+        :rtype: Optional[str]
+        """
+        future = asyncio.get_running_loop().run_in_executor(None, rate_limiter.enter)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(
+                lambda done: (
+                    rate_limiter.leave(done.result())
+                    if not done.cancelled() and done.exception() is None
+                    else None
+                )
+            )
+            raise
+
+    async def send(self, method: str, abs_url: str, data: Optional[str]) -> Response:
+        """Sign and send a request, waiting for a free slot if max_concurrency requests are in flight
+        The request is throttled by the configured rate limiter (ornitho.rate_limit, ornitho.max_in_flight). Waiting
+        for a free in-flight slot of the rate limiter is done in the default executor, so the event loop keeps
+        running.
+        :param method: HTTP Method e.g. 'GET'
+        :param abs_url: Absolute url, including all URL parameters
+        :param data: JSON body
+        :type method: str
+        :type abs_url: str
+        :type data: Optional[str]
+        :return: Received response, converted to a requests response
+        :rtype: Response
+        """
+        if self.session is None:
+            self.session = aiohttp.ClientSession(skip_auto_headers=("Content-Type",))
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        prepared = Request(
+            method, abs_url, data=data, headers=self.request_headers()
+        ).prepare()
+        self.auth(prepared)
+        headers = {
+            key: value.decode("utf-8") if isinstance(value, bytes) else value
+            for key, value in prepared.headers.items()
+        }
+
+        rate_limiter = get_rate_limiter()
+        async with self._semaphore:
+            lease = None
+            if rate_limiter is not None:
+                lease = await self.enter(rate_limiter)
+            try:
+                if rate_limiter is not None:
+                    await asyncio.sleep(rate_limiter.reserve())
+                async with self.session.request(
+                    cast(str, prepared.method),
+                    cast(str, prepared.url),
+                    data=prepared.body,
+                    headers=headers,
+                ) as aio_response:
+                    response = Response()
+                    response.status_code = aio_response.status
+                    response.reason = cast(str, aio_response.reason)
+                    response.headers = CaseInsensitiveDict(aio_response.headers)
+                    response._content = await aio_response.read()
+                    response.encoding = aio_response.charset or "utf-8"
+                    response.url = str(aio_response.url)
+                    response.request = prepared
+            finally:
+                if rate_limiter is not None:
+                    rate_limiter.leave(lease)
+        return response
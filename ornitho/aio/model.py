@@ -0,0 +1,258 @@
+import asyncio
+from datetime import date, datetime
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from ornitho.aio.api_requester import AsyncAPIRequester
+from ornitho.api_exception import ObjectNotFoundException
+from ornitho.model.abstract import (
+    BaseModel,
+    CreateableModel,
+    DeletableModel,
+    ListableModel,
+    SearchableModel,
+)
+
+# Create generic variables that can be a model class, or any subclass.
+T = TypeVar("T", bound=BaseModel)
+L = TypeVar("L", bound=ListableModel)
+S = TypeVar("S", bound=SearchableModel)
+
+
+async def get(
+    requester: AsyncAPIRequester,
+    model: Type[T],
+    id_: Union[int, str],
+    short_version: bool = False,
+    retries: int = 0,
+) -> T:
+    """Retrieve Object from Biolovision with given ID, see BaseModel.get
+    :param requester: Async requester, which is used to send the request
+    :param model: Model class
+    :param id_: Unique identifier
+    :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+    :param retries: Indicates how many retries should be performed
+    :type requester: AsyncAPIRequester
+    :type model: Type[T]
+    :type id_: Union[int, str]
+    :type short_version: bool
+    :type retries: int
+    :return: Instance, retrieved from Biolovision with given ID
+    :rtype: T
+    """
+    instance = model(id_)
+    await refresh(requester, instance, short_version=short_version, retries=retries)
+    return instance
+
+
+async def gather_get(
+    requester: AsyncAPIRequester,
+    model: Type[T],
+    ids: Iterable[Union[int, str]],
+    short_version: bool = False,
+    retries: int = 0,
+) -> List[T]:
+    """Retrieve several objects concurrently, bounded by the requester's max_concurrency
+    :param requester: Async requester, which is used to send the requests
+    :param model: Model class
+    :param ids: Unique identifiers
+    :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+    :param retries: Indicates how many retries should be performed
+    :type requester: AsyncAPIRequester
+    :type model: Type[T]
+    :type ids: Iterable[Union[int, str]]
+    :type short_version: bool
+    :type retries: int
+    :return: Instances in the order of the given ids
+    :rtype: List[T]
+    """
+    return await asyncio.gather(
+        *[
+            get(requester, model, id_, short_version=short_version, retries=retries)
+            for id_ in ids
+        ]
+    )
+
+
+async def refresh(
+    requester: AsyncAPIRequester,
+    instance: T,
+    short_version: bool = False,
+    retries: int = 0,
+) -> T:
+    """Refresh local model, see BaseModel.refresh
+    :param requester: Async requester, which is used to send the request
+    :param instance: Instance to refresh
+    :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+    :param retries: Indicates how many retries should be performed
+    :type requester: AsyncAPIRequester
+    :type instance: T
+    :type short_version: bool
+    :type retries: int
+    :return: Refreshed Object
+    :rtype: T
+    :raise ObjectNotFoundException: No or more than one objects retrieved
+    :raise TypeError: Model uses its own refresh method, e.g. Form, Field or FieldOption, which is not supported
+    """
+    if type(instance).refresh is not BaseModel.refresh:
+        raise TypeError(
+            f"{type(instance).__name__} implements its own refresh, which is not supported by ornitho.aio. "
+            "Use the synchronous method instead"
+        )
+    data, pk = await requester.request(
+        method="GET",
+        url=instance.instance_url(),
+        short_version=short_version,
+        retries=retries,
+    )
+    if len(data) != 1:
+        raise ObjectNotFoundException(
+            f"Get {len(data)} objects for {instance.instance_url()}"
+        )
+    data = cast(List[Dict[str, Any]], data)
+    if "id" in data[0] and data[0]["id"] is None:
+        raise ObjectNotFoundException(
+            f"Object with nulled fields retrieved: {instance.instance_url()}"
+        )
+    instance._previous = instance._raw_data
+    instance._raw_data = data[0]
+    instance._refreshed = True
+    return instance
+
+
+async def list_(
+    requester: AsyncAPIRequester,
+    model: Type[L],
+    request_all: bool = False,
+    pagination_key: Optional[str] = None,
+    short_version: bool = False,
+    retries: int = 0,
+    **kwargs: Union[str, int, float, bool, date],
+) -> Tuple[List[L], Optional[str]]:
+    """Retrieves a (paged) list of instances from Biolovison, see ListableModel.list
+    :param requester: Async requester, which is used to send the requests
+    :param model: Model class
+    :param request_all: Indicates, if all instances should be retrieved (may result in many API calls)
+    :param pagination_key: Pagination key, which can be used to retrieve the next page
+    :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+    :param retries: Indicates how many retries should be performed
+    :param kwargs: Additional filter values
+    :type requester: AsyncAPIRequester
+    :type model: Type[L]
+    :type request_all: bool
+    :type pagination_key: Optional[str]
+    :type short_version: bool
+    :type retries: int
+    :type kwargs: Union[str, int, float, bool, date]
+    :return: Tuple of instances and pagination key
+    :rtype: Tuple[List[L], Optional[str]]
+    """
+    response, pk = await requester.request(
+        method="get",
+        url=model.ENDPOINT,
+        request_all=request_all,
+        pagination_key=pagination_key,
+        short_version=short_version,
+        params=kwargs,
+        retries=retries,
+    )
+    return [
+        model.create_from_ornitho_json(ele)
+        for ele in cast(List[Dict[str, Any]], response)
+    ], pk
+
+
+async def search(
+    requester: AsyncAPIRequester,
+    model: Type[S],
+    request_all: bool = False,
+    pagination_key: Optional[str] = None,
+    short_version: bool = False,
+    retries: int = 0,
+    **kwargs: Union[str, int, float, bool, date, datetime, List[Any]],
+) -> Tuple[List[S], Optional[str]]:
+    """Search for instances at Biolovision via POST search, see SearchableModel.search
+    :param requester: Async requester, which is used to send the requests
+    :param model: Model class
+    :param request_all: Indicates, if all instances should be retrieved (may result in many API calls)
+    :param pagination_key: Pagination key, which can be used to retrieve the next page
+    :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+    :param retries: Indicates how many retries should be performed
+    :param kwargs: Search values
+    :type requester: AsyncAPIRequester
+    :type model: Type[S]
+    :type request_all: bool
+    :type pagination_key: Optional[str]
+    :type short_version: bool
+    :type retries: int
+    :type kwargs: Union[str, int, float, bool, date, datetime, list]
+    :return: Tuple of instances and pagination key
+    :rtype: Tuple[List[S], Optional[str]]
+    """
+    response, pk = await requester.request(
+        method="post",
+        url="%s/search" % model.ENDPOINT,
+        request_all=request_all,
+        pagination_key=pagination_key,
+        short_version=short_version,
+        body=kwargs,
+        retries=retries,
+    )
+    return [
+        model.create_from_ornitho_json(ele)
+        for ele in cast(List[Dict[str, Any]], response)
+    ], pk
+
+
+async def create_in_ornitho(
+    requester: AsyncAPIRequester,
+    model: Type[CreateableModel],
+    data: Dict[str, Any],
+    retries: int = 0,
+) -> int:
+    """Create an instance on ornitho, see CreateableModel.create_in_ornitho
+    :param requester: Async requester, which is used to send the request
+    :param model: Model class
+    :param data: Data
+    :param retries: Indicates how many retries should be performed
+    :type requester: AsyncAPIRequester
+    :type model: Type[CreateableModel]
+    :type data: Dict[str, Any]
+    :type retries: int
+    :return: Ornitho ID of the created object
+    :rtype: int
+    """
+    url = model.CREATE_ENDPOINT if model.CREATE_ENDPOINT is not None else model.ENDPOINT
+    response, pk = await requester.request(
+        method="post",
+        url=url,
+        body={"data": data},
+        retries=retries,
+        idempotent=False,
+    )
+    return cast(List[Dict[str, Any]], response)[0]["id"][0]
+
+
+async def delete(
+    requester: AsyncAPIRequester, instance: DeletableModel, retries: int = 0
+) -> None:
+    """Delete an instance on ornitho, see DeletableModel.delete
+    :param requester: Async requester, which is used to send the request
+    :param instance: Instance to delete
+    :param retries: Indicates how many retries should be performed
+    :type requester: AsyncAPIRequester
+    :type instance: DeletableModel
+    :type retries: int
+    """
+    url = f"{instance.DELETE_ENDPOINT if instance.DELETE_ENDPOINT is not None else instance.ENDPOINT}/{instance.id_}"
+    await requester.request(method=instance.DELETE_METHOD, url=url, retries=retries)
@@ -1,30 +1,152 @@
 import json
-from copy import deepcopy
+import logging
+import time
+from copy import copy
 from datetime import date, datetime
-from json.decoder import JSONDecodeError
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
 from urllib.parse import urlencode
 
 from requests import Response
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
 from requests_oauthlib import OAuth1Session
 
 import ornitho
-from ornitho import api_exception
+from ornitho import api_exception, json_decoder
+from ornitho.instrumentation import Hooks, RequestEvent, endpoint_name
+from ornitho.payload_log import Summary, dump_payload, response_extension, tee_payload
+from ornitho.rate_limiter import RateLimiter, get_rate_limiter
+from ornitho.retry_policy import RetryPolicy
+from ornitho.session_registry import SessionRegistry, session_registry
 
-try:
-    import requests_cache
 
-    class CachedOAuthSession(
-        requests_cache.CacheMixin, OAuth1Session
-    ):  # pragma: no cover
-        """Session with features from both CachedSession and OAuth1Session"""
+class RequestAttempts(object):
+    """Retry decisions and instrumentation of the attempts of one request
 
-except ImportError:  # pragma: no cover
-    requests_cache = cast(Any, None)
+    Shared by APIRequester.send and AsyncAPIRequester.request_raw, which only differ in how a request is sent and how
+    they wait between the attempts. Call begin() directly before each attempt and failed() or received() with its
+    outcome. Both return the delay before the next attempt or None, if there is none.
+    """
 
+    def __init__(
+        self,
+        requester: "BaseAPIRequester",
+        method: str,
+        abs_url: str,
+        data: Optional[str],
+        retries: int = 0,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: bool = True,
+    ) -> None:
+        """Request attempts constructor
+        :param requester: Requester sending the request
+        :param method: HTTP Method e.g. 'GET'
+        :param abs_url: Absolute url, including all URL parameters
+        :param data: JSON body
+        :param retries: Indicates how many retries should be performed, at least retry_policy.max_retries are performed
+        :param retry_policy: Optional retry policy, overrides the policy of the requester
+        :param idempotent: Indicates, if the request can be repeated without side effects. Else it is only retried, if
+            the server did not process it, see RetryPolicy. Default: 'True'
+        :type requester: BaseAPIRequester
+        :type method: str
+        :type abs_url: str
+        :type data: Optional[str]
+        :type retries: int
+        :type retry_policy: Optional[RetryPolicy]
+        :type idempotent: bool
+        """
+        self.requester: "BaseAPIRequester" = requester
+        self.method: str = method
+        self.abs_url: str = abs_url
+        self.request_bytes: int = len(data.encode("utf-8")) if data else 0
+        self.policy: RetryPolicy = (
+            retry_policy or requester.retry_policy or ornitho.retry_policy
+        )
+        self.retries: int = max(retries, self.policy.max_retries)
+        self.idempotent: bool = idempotent
+        self.attempt: int = 0
+        self.event: Optional[RequestEvent] = None
+        self.started: float = 0.0
 
-class APIRequester(object):
-    """Class for making API requests"""
+    def begin(self) -> None:
+        """Start an attempt, emitting the before_request event"""
+        self.event = None
+        hooks = self.requester.hooks
+        if hooks.active:
+            self.event = RequestEvent(
+                self.method,
+                endpoint_name(self.abs_url, self.requester.api_base),
+                attempt=self.attempt,
+                request_bytes=self.request_bytes,
+            )
+            hooks.emit("before_request", self.event)
+        self.started = time.perf_counter()
+
+    def failed(self, exception: Exception) -> Optional[float]:
+        """Finish an attempt, which raised a connection error or timeout
+        :param exception: Raised exception
+        :type exception: Exception
+        :return: Delay in seconds before the next attempt or None, if the exception should be raised
+        :rtype: Optional[float]
+        """
+        if self.event is not None:
+            self.event.latency = time.perf_counter() - self.started
+            self.event.exception = exception
+            self.requester.hooks.emit("after_response", self.event)
+        if self.attempt >= self.retries or not self.policy.is_retryable_exception(
+            exception, idempotent=self.idempotent
+        ):
+            return None
+        return self.retry(type(exception).__name__, self.policy.delay(self.attempt))
+
+    def received(self, response: Response, stream: bool = False) -> Optional[float]:
+        """Finish an attempt, which received a response
+        :param response: Received response
+        :param stream: Indicates, if the body is downloaded while it is read
+        :type response: Response
+        :type stream: bool
+        :return: Delay in seconds before the next attempt or None, if the response was successful
+        :rtype: Optional[float]
+        :raise APIHttpException: Response contains an error, which is not retried
+        """
+        if self.event is not None:
+            self.event.received(
+                response, time.perf_counter() - self.started, stream=stream
+            )
+            self.requester.hooks.emit("after_response", self.event)
+        if 200 <= response.status_code < 300:
+            return None
+        if self.attempt >= self.retries or not self.policy.is_retryable_status(
+            response.status_code, idempotent=self.idempotent
+        ):
+            self.requester.handle_error_response(response)
+        return self.retry(
+            str(response.status_code), self.policy.delay(self.attempt, response)
+        )
+
+    def retry(self, reason: str, delay: float) -> float:
+        """Record a retry, emitting the on_retry event
+        :param reason: Reason of the retry, e.g. the HTTP status
+        :param delay: Delay in seconds before the next attempt
+        :type reason: str
+        :type delay: float
+        :return: Delay in seconds before the next attempt
+        :rtype: float
+        """
+        self.policy.record(reason)
+        if self.event is not None:
+            self.event.reason = reason
+            self.event.delay = delay
+            self.requester.hooks.emit("on_retry", self.event)
+        ornitho.logger.warning(
+            f"Response {reason}. {self.retries - self.attempt} left! Retry in {delay:.1f}s..."
+        )
+        self.attempt += 1
+        return delay
+
+
+class BaseAPIRequester(object):
+    """Credentials, URL building, response decoding and error handling shared by the synchronous and asynchronous
+    requesters. It does not open a session."""
 
     def __init__(
         self,
@@ -33,18 +155,24 @@ class APIRequester(object):
         user_email: Optional[str] = None,
         user_pw: Optional[str] = None,
         api_base: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hooks: Optional[Hooks] = None,
     ) -> None:
-        """API requester constructor
+        """Base API requester constructor
         :param consumer_key: Optional Consumer Key, overrides field from ornitho module (ornitho.consumer_key)
         :param consumer_secret: Optional Consumer Secret, overrides field from ornitho module (ornitho.consumer_secret)
         :param user_email: Optional User Mail, overrides field from ornitho module (ornitho.user_email)
         :param user_pw: Optional User Password, overrides field from ornitho module (ornitho.user_pw)
         :param api_base: Optional API base url, overrides field from ornitho module (ornitho.api_base)
+        :param retry_policy: Optional retry policy, overrides field from ornitho module (ornitho.retry_policy)
+        :param hooks: Optional instrumentation hooks, overrides field from ornitho module (ornitho.hooks)
         :type consumer_key: Optional[str]
         :type consumer_secret: Optional[str]
         :type user_email: Optional[str]
         :type user_pw: Optional[str]
         :type api_base: Optional[str]
+        :type retry_policy: Optional[RetryPolicy]
+        :type hooks: Optional[Hooks]
         """
         self.consumer_key: Optional[str] = consumer_key or ornitho.consumer_key
         self.consumer_secret: Optional[str] = consumer_secret or ornitho.consumer_secret
@@ -62,101 +190,23 @@ class APIRequester(object):
         if not self.api_base:
             raise RuntimeError("api_base missing!")
 
-        if ornitho.cache_enabled and requests_cache:  # pragma: no cover
-            if ornitho.cache_backend == "redis":
-                import redis
+        self.retry_policy: Optional[RetryPolicy] = retry_policy
+        self.hooks: Hooks = hooks if hooks is not None else ornitho.hooks
 
-                r = redis.StrictRedis(
-                    host=ornitho.cache_redis_host,
-                    port=ornitho.cache_redis_port,
-                    db=ornitho.cache_redis_db,
-                )
-                self.session: OAuth1Session = CachedOAuthSession(
-                    client_key=self.consumer_key,
-                    client_secret=self.consumer_secret,
-                    cache_name=ornitho.cache_name,
-                    backend=ornitho.cache_backend,
-                    expire_after=ornitho.cache_expire_after,
-                    filter_fn=ornitho.cache_filter_fn,
-                    connection=r,
-                )
-            else:
-                self.session = CachedOAuthSession(
-                    client_key=self.consumer_key,
-                    client_secret=self.consumer_secret,
-                    cache_name=ornitho.cache_name,
-                    backend=ornitho.cache_backend,
-                    expire_after=ornitho.cache_expire_after,
-                    filter_fn=ornitho.cache_filter_fn,
-                )
-        else:
-            if ornitho.cache_enabled:  # pragma: no cover
-                ornitho.logger.warning(
-                    "Cache was enabled but caching dependency is not install. Please install 'requests_cache'"
-                )
-            self.session = OAuth1Session(
-                client_key=self.consumer_key, client_secret=self.consumer_secret
-            )
-
-    def __enter__(self):
-        """Used by a with-statement"""
-        return self
-
-    def __exit__(self, *args):
-        """Used by a with-statement"""
-        self.close()
-
-    def close(self):
-        """Close an OAuth1 Session"""
-        self.session.close()
-
-    def request(
-        self,
-        method: str,
-        url: str,
-        pagination_key: Optional[str] = None,
-        short_version: bool = False,
-        request_all: bool = False,
-        params: Optional[Dict[str, Any]] = None,
-        body: Optional[Dict[str, Any]] = None,
-        retries: int = 0,
-    ) -> Tuple[Union[bytes, List[Dict[str, str]]], Optional[str]]:
-        """Make requests to the API
-        If request_all ist set, several requests calls to the API can be made, until all data is retrieved. Else a
-        pagination key will be returned, which can be used to get the next data set.
-        :param method: HTTP Method e.g. 'GET'
-        :param url: API URL to call
-        :param pagination_key: Additional pagination key, to get the next page
-        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
-            Default: 'False'
-        :param request_all:  Indicates, if all pages should be returned. May result in many API calls. Default: 'False'
-        :param params: Additional URL parameters.
-        :param body: Request body
-        :param retries: Indicates how many retries should be performed
-        :type method: str
-        :type url: str
-        :type pagination_key: str
-        :type short_version: bool
-        :type request_all: bool
-        :type params: Dict[str, Any]
-        :type body: Dict[str, Any]
-        :type retries: int
-        :return: Tuple of raw data list and pagination key
-        :rtype: Tuple[List[Dict[str, str]], Optional[str]]
+    @staticmethod
+    def extract_data(responds: Any, flatten_forms: bool = True) -> List[Dict[str, str]]:
+        """Extract the list of data objects from a decoded response
+        Sightings of forms are flattened, each sighting gets its form (without sightings) attached.
+        :param responds: Decoded JSON response
+        :param flatten_forms: Indicates, if the sightings of forms should be returned instead of the forms.
+            Default: 'True'
+        :type responds: Any
+        :type flatten_forms: bool
+        :return: List of raw data objects
+        :rtype: List[Dict[str, str]]
         """
         data: List[Dict[str, str]] = []
-        responds, pk = self.request_raw(
-            method=method.lower(),
-            url=url,
-            pagination_key=pagination_key,
-            short_version=short_version,
-            params=params,
-            body=body,
-            retries=retries,
-        )
-        if isinstance(responds, bytes):
-            return responds, pk
-        elif isinstance(responds, list):
+        if isinstance(responds, list):
             data += responds
         elif isinstance(responds, dict) and "data" in responds.keys():
             if isinstance(responds["data"], dict):
@@ -164,42 +214,51 @@ class APIRequester(object):
                     data += responds["data"]["sightings"]
                 if "forms" in responds["data"]:
                     for form in responds["data"]["forms"]:
-                        day = deepcopy(form["sightings"][0]["date"])
-                        form_copy_wihtout_sightings = deepcopy(form)
-                        form_copy_wihtout_sightings["day"] = day
-                        del form_copy_wihtout_sightings["sightings"]
-                        for sighting in form["sightings"]:
-                            sighting["form"] = form_copy_wihtout_sightings
-                            data.append(sighting)
+                        if flatten_forms:
+                            data += BaseAPIRequester.flatten_form(form)
+                        else:
+                            data.append(form)
             else:
                 data += responds["data"]
         else:
             data.append(responds)
+        return data
 
-        ornitho.logger.info("Received %s data objects" % (len(data)))
-
-        if pk and request_all and len(data) > 0:
-            next_response = self.request(
-                method=method,
-                url=url,
-                pagination_key=pk,
-                short_version=short_version,
-                request_all=request_all,
-                params=params,
-                body=body,
-                retries=retries,
-            )[0]
-            if isinstance(next_response, bytes):
-                raise api_exception.APIException(
-                    "Received bytes content, where json was expected"
-                )
-            data = data + next_response
-        if not pagination_key and len(data) <= 0:
-            ornitho.logger.debug(
-                "No data received! This can be caused by wrong parameter or an error in ornitho."
-            )
+    @staticmethod
+    def flatten_form(form: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the sightings of a form, each sighting gets the form (without sightings) attached
+        The returned sightings are shallow copies, which share one shallow copy of the form header. The form and its
+        sightings are left unchanged.
+        :param form: Raw form data, including its sightings
+        :type form: Dict[str, Any]
+        :return: List of raw sightings
+        :rtype: List[Dict[str, Any]]
+        """
+        sightings = form.get("sightings", [])
+        form_header = {key: value for key, value in form.items() if key != "sightings"}
+        if sightings:
+            form_header["day"] = copy(sightings[0]["date"])
+        return [dict(sighting, form=form_header) for sighting in sightings]
 
-        return data, pk
+    def emit_page(
+        self, method: str, url: str, page: int, records: int, pk: Optional[str]
+    ) -> None:
+        """Emit the on_page event of a received page
+        :param method: HTTP Method e.g. 'GET'
+        :param url: API URL, which was called
+        :param page: Pagination depth, 0 for the first page
+        :param records: Number of data objects of the page
+        :param pk: Pagination key of the following page
+        :type method: str
+        :type url: str
+        :type page: int
+        :type records: int
+        :type pk: Optional[str]
+        """
+        event = RequestEvent(method, endpoint_name(url), page=page)
+        event.records = records
+        event.has_next = pk is not None
+        self.hooks.emit("on_page", event)
 
     @staticmethod
     def handle_error_response(response: Response) -> None:
@@ -236,7 +295,7 @@ class APIRequester(object):
         headers = {"User-Agent": user_agent}
         return headers
 
-    def request_raw(
+    def prepare_request(
         self,
         method: str,
         url: str,
@@ -244,35 +303,24 @@ class APIRequester(object):
         short_version: bool = False,
         params: Dict[str, Any] = None,
         body: Dict[str, Any] = None,
-        retries: int = 0,
-    ) -> Tuple[Any, Any]:
-        """Make direct request to the API
+    ) -> Tuple[str, Optional[str]]:
+        """Build the absolute url and the serialized body of a request
+        Dates and booleans in params and body are converted to the format accepted by the API.
         :param method: HTTP Method e.g. 'GET'
         :param url: API URL to call
         :param pagination_key: Additional pagination key, to get the next page
         :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
-            Default: 'False'
         :param params: Additional URL parameters.
         :param body: Request body
-        :param retries: Indicates how many retries should be performed
         :type method: str
         :type url: str
         :type pagination_key: str
         :type short_version: bool
         :type params: Dict[str, Any]
         :type body: Dict[str, Any]
-        :type retries: int
-        :return: Tuple of raw response data and pagination key
-        :rtype: Tuple[Any, Any]
-        :raise APIConnectionError: Unspecified error while connecting to Biolovision
-        :raise APIException: Response contains unhandled HTTP Code
-        :raise AuthenticationException: Authentication failed, wrong credentials?
-        :raise GatewayTimeoutException: Request took to long, reduce possible response by adding filters
-        :raise BadGatewayException: Unknown Server error, in most cases a retry is successful
-        :raise ServiceUnavailableException: Service unavailable, in most cases a retry is successful
-        :raise ContentTypeException: Unhandled Content Type received or no information about content typ found
+        :return: Tuple of absolute url and JSON body
+        :rtype: Tuple[str, Optional[str]]
         """
-
         params_dict: Dict[str, Any] = {
             "user_email": self.user_email,
             "user_pw": self.user_pw,
@@ -323,58 +371,67 @@ class APIRequester(object):
 
         data = json.dumps(body) if body else None
 
-        headers = self.request_headers()
-        ornitho.logger.info(
-            f"Request to Ornitho api. method={method}, url=/{url}, params={params}, short_version={short_version}, body={body}"
-        )
-        raw_response = self.session.request(method, abs_url, data=data, headers=headers)
-
-        if not 200 <= raw_response.status_code < 300:
-            if retries > 0:
-                ornitho.logger.warning(
-                    f"Response {raw_response.status_code}. {retries} left! Retry..."
-                )
-                return self.request_raw(
-                    method=method,
-                    url=url,
-                    pagination_key=pagination_key,
-                    short_version=short_version,
-                    params=params,
-                    body=body,
-                    retries=retries - 1,
-                )
-            self.handle_error_response(raw_response)
+        if ornitho.logger.isEnabledFor(logging.INFO):
+            ornitho.logger.info(
+                "Request to Ornitho api. method=%s, url=/%s, params=%s, short_version=%s, body=%s",
+                method,
+                url,
+                Summary(params),
+                short_version,
+                Summary(body),
+                extra={
+                    "ornitho_method": method,
+                    "ornitho_url": url,
+                    "ornitho_body_bytes": len(data) if data else 0,
+                },
+            )
+        if data and ornitho.log_payload_dir:
+            dump_payload(method, url, "request", data)
+        return abs_url, data
 
+    @staticmethod
+    def pagination_key(raw_response: Response) -> Optional[str]:
+        """Extract the pagination key of a chunked response
+        :param raw_response: Response, received from the API
+        :type raw_response: Response
+        :return: Pagination key, which can be used to request the following page
+        :rtype: Optional[str]
+        """
         if (
             "pagination_key" in raw_response.headers.keys()
             and "Transfer-Encoding" in raw_response.headers.keys()
             and raw_response.headers["Transfer-Encoding"] == "chunked"
         ):
-            pagination_key = raw_response.headers["pagination_key"] or None
-        else:
-            pagination_key = None
+            return raw_response.headers["pagination_key"] or None
+        return None
 
+    def handle_response(
+        self, method: str, raw_response: Response
+    ) -> Tuple[Any, Optional[str]]:
+        """Decode a successful response and extract its pagination key
+        :param method: HTTP Method e.g. 'GET'
+        :param raw_response: Response, received from the API
+        :type method: str
+        :type raw_response: Response
+        :return: Tuple of raw response data and pagination key
+        :rtype: Tuple[Any, Optional[str]]
+        :raise APIException: Response can't be decoded as JSON
+        :raise ContentTypeException: Unhandled Content Type received or no information about content typ found
+        """
+        pagination_key = self.pagination_key(raw_response)
+        if ornitho.log_payload_dir:
+            dump_payload(
+                method,
+                endpoint_name(raw_response.url or "", self.api_base),
+                "response",
+                raw_response.content,
+                response_extension(raw_response.headers),
+            )
         if method == "delete":
             return raw_response.text, pagination_key
         elif "Content-Type" in raw_response.headers.keys():
             if raw_response.headers["Content-Type"].startswith("application/json"):
-                raw_response_text = raw_response.text
-                # Remove the first JSON Line, which breaks the JSON format
-                # Hopefully there aren't any more success messages
-                # A real WTF moment...
-                # TODO Add other language checks
-                if (
-                    raw_response_text.split("\n")[0]
-                    == "API message : Ihre Beobachtungsdaten wurden erfolgreich übermittelt, vielen Dank!"
-                ):
-                    raw_response_text = "\n".join(raw_response_text.split("\n")[1:])
-                try:
-                    decoded_json_response = json.loads(raw_response_text or "{}")
-                except JSONDecodeError:
-                    raise api_exception.APIException(
-                        f"Cant decode the response as JSON:\n{raw_response_text}"
-                    )
-                return decoded_json_response, pagination_key
+                return json_decoder.loads(raw_response.content), pagination_key
             elif raw_response.headers["Content-Type"] == "application/pdf":
                 return raw_response.content, pagination_key
             elif raw_response.headers["Content-Type"] == "text/html; charset=UTF-8":
@@ -383,3 +440,565 @@ class APIRequester(object):
                 raise api_exception.ContentTypeException(raw_response)
         else:
             raise api_exception.ContentTypeException(raw_response)
+
+    def attempts(
+        self,
+        method: str,
+        abs_url: str,
+        data: Optional[str],
+        retries: int = 0,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: bool = True,
+    ) -> RequestAttempts:
+        """Create the retry state of a request, see RequestAttempts
+        :param method: HTTP Method e.g. 'GET'
+        :param abs_url: Absolute url, including all URL parameters
+        :param data: JSON body
+        :param retries: Indicates how many retries should be performed, at least retry_policy.max_retries are performed
+        :param retry_policy: Optional retry policy, overrides the policy of the requester
+        :param idempotent: Indicates, if the request can be repeated without side effects. Else it is only retried, if
+            the server did not process it, see RetryPolicy. Default: 'True'
+        :type method: str
+        :type abs_url: str
+        :type data: Optional[str]
+        :type retries: int
+        :type retry_policy: Optional[RetryPolicy]
+        :type idempotent: bool
+        :return: Retry state of the request
+        :rtype: RequestAttempts
+        """
+        return RequestAttempts(
+            self, method, abs_url, data, retries, retry_policy, idempotent
+        )
+
+
+class APIRequester(BaseAPIRequester):
+    """Class for making API requests"""
+
+    # Locations of the data objects in a response, used when parsing incrementally
+    STREAM_PREFIXES = frozenset(
+        ["item", "data.item", "data.sightings.item", "data.forms.item.sightings.item"]
+    )
+    # Locations of the objects, whose header is attached to the data objects within, used when parsing incrementally
+    STREAM_PARENTS = frozenset(["data.forms.item"])
+
+    def __init__(
+        self,
+        consumer_key: Optional[str] = None,
+        consumer_secret: Optional[str] = None,
+        user_email: Optional[str] = None,
+        user_pw: Optional[str] = None,
+        api_base: Optional[str] = None,
+        pooled: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hooks: Optional[Hooks] = None,
+    ) -> None:
+        """API requester constructor
+        :param consumer_key: Optional Consumer Key, overrides field from ornitho module (ornitho.consumer_key)
+        :param consumer_secret: Optional Consumer Secret, overrides field from ornitho module (ornitho.consumer_secret)
+        :param user_email: Optional User Mail, overrides field from ornitho module (ornitho.user_email)
+        :param user_pw: Optional User Password, overrides field from ornitho module (ornitho.user_pw)
+        :param api_base: Optional API base url, overrides field from ornitho module (ornitho.api_base)
+        :param pooled: Optional flag, if the shared session from the registry should be used, overrides field from
+            ornitho module (ornitho.session_pooling)
+        :param retry_policy: Optional retry policy, overrides field from ornitho module (ornitho.retry_policy)
+        :param hooks: Optional instrumentation hooks, overrides field from ornitho module (ornitho.hooks)
+        :type consumer_key: Optional[str]
+        :type consumer_secret: Optional[str]
+        :type user_email: Optional[str]
+        :type user_pw: Optional[str]
+        :type api_base: Optional[str]
+        :type pooled: Optional[bool]
+        :type retry_policy: Optional[RetryPolicy]
+        :type hooks: Optional[Hooks]
+        """
+        super(APIRequester, self).__init__(
+            consumer_key=consumer_key,
+            consumer_secret=consumer_secret,
+            user_email=user_email,
+            user_pw=user_pw,
+            api_base=api_base,
+            retry_policy=retry_policy,
+            hooks=hooks,
+        )
+        self.pooled: bool = ornitho.session_pooling if pooled is None else pooled
+        if self.pooled:
+            self.session: OAuth1Session = session_registry.get(
+                self.consumer_key, self.consumer_secret, self.user_email, self.api_base
+            )
+        else:
+            self.session = SessionRegistry.create_session(
+                self.consumer_key, self.consumer_secret
+            )
+
+    def __enter__(self):
+        """Used by a with-statement"""
+        return self
+
+    def __exit__(self, *args):
+        """Used by a with-statement"""
+        self.close()
+
+    def close(self):
+        """Close an OAuth1 Session
+        Shared sessions stay open for reuse, until ornitho.shutdown() is called
+        """
+        if not self.pooled:
+            self.session.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        pagination_key: Optional[str] = None,
+        short_version: bool = False,
+        request_all: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        retries: int = 0,
+        flatten_forms: bool = True,
+        idempotent: bool = True,
+    ) -> Tuple[Union[bytes, List[Dict[str, str]]], Optional[str]]:
+        """Make requests to the API
+        If request_all ist set, several requests calls to the API can be made, until all data is retrieved. Else a
+        pagination key will be returned, which can be used to get the next data set.
+        :param method: HTTP Method e.g. 'GET'
+        :param url: API URL to call
+        :param pagination_key: Additional pagination key, to get the next page
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+            Default: 'False'
+        :param request_all:  Indicates, if all pages should be returned. May result in many API calls. Default: 'False'
+        :param params: Additional URL parameters.
+        :param body: Request body
+        :param retries: Indicates how many retries should be performed
+        :param flatten_forms: Indicates, if the sightings of forms should be returned instead of the forms.
+            Default: 'True'
+        :param idempotent: Indicates, if the request can be repeated without side effects. Else it is only retried, if
+            the server did not process it, see RetryPolicy. Default: 'True'
+        :type method: str
+        :type url: str
+        :type pagination_key: str
+        :type short_version: bool
+        :type request_all: bool
+        :type params: Dict[str, Any]
+        :type body: Dict[str, Any]
+        :type retries: int
+        :type flatten_forms: bool
+        :type idempotent: bool
+        :return: Tuple of raw data list and pagination key
+        :rtype: Tuple[List[Dict[str, str]], Optional[str]]
+        """
+        pages = self.iter_pages(
+            method=method,
+            url=url,
+            pagination_key=pagination_key,
+            short_version=short_version,
+            request_all=request_all,
+            params=params,
+            body=body,
+            retries=retries,
+            flatten_forms=flatten_forms,
+            idempotent=idempotent,
+        )
+        first_page, pk = next(pages)
+        if isinstance(first_page, bytes):
+            return first_page, pk
+        data: List[Dict[str, str]] = first_page
+        for page, _ in pages:
+            data.extend(cast(List[Dict[str, str]], page))
+
+        if not pagination_key and len(data) <= 0:
+            ornitho.logger.debug(
+                "No data received! This can be caused by wrong parameter or an error in ornitho."
+            )
+
+        return data, pk
+
+    def iter_pages(
+        self,
+        method: str,
+        url: str,
+        pagination_key: Optional[str] = None,
+        short_version: bool = False,
+        request_all: bool = True,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        retries: int = 0,
+        flatten_forms: bool = True,
+        idempotent: bool = True,
+    ) -> Iterator[Tuple[Union[bytes, List[Dict[str, str]]], Optional[str]]]:
+        """Make requests to the API and yield every page as soon as it is received
+        Each page is yielded together with its pagination key, which can be used to request the following page. Only
+        the first page may be bytes (e.g. a PDF), all following pages must be JSON.
+        :param method: HTTP Method e.g. 'GET'
+        :param url: API URL to call
+        :param pagination_key: Additional pagination key, to get the next page
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+            Default: 'False'
+        :param request_all: Indicates, if all following pages should be requested. Default: 'True'
+        :param params: Additional URL parameters.
+        :param body: Request body
+        :param retries: Indicates how many retries should be performed
+        :param flatten_forms: Indicates, if the sightings of forms should be returned instead of the forms.
+            Default: 'True'
+        :param idempotent: Indicates, if the request can be repeated without side effects. Else it is only retried, if
+            the server did not process it, see RetryPolicy. Default: 'True'
+        :type method: str
+        :type url: str
+        :type pagination_key: str
+        :type short_version: bool
+        :type request_all: bool
+        :type params: Dict[str, Any]
+        :type body: Dict[str, Any]
+        :type retries: int
+        :type flatten_forms: bool
+        :type idempotent: bool
+        :return: Iterator of raw data lists and pagination keys
+        :rtype: Iterator[Tuple[Union[bytes, List[Dict[str, str]]], Optional[str]]]
+        :raise APIException: Received bytes on a following page
+        """
+        first_page = True
+        page = 0
+        while True:
+            responds, pk = self.request_raw(
+                method=method.lower(),
+                url=url,
+                pagination_key=pagination_key,
+                short_version=short_version,
+                params=params,
+                body=body,
+                retries=retries,
+                idempotent=idempotent,
+            )
+            if isinstance(responds, bytes):
+                if not first_page:
+                    raise api_exception.APIException(
+                        "Received bytes content, where json was expected"
+                    )
+                yield responds, pk
+                return
+            data = self.extract_data(responds, flatten_forms)
+            ornitho.logger.info("Received %s data objects", len(data))
+            if self.hooks.active:
+                self.emit_page(method, url, page, len(data), pk)
+            yield data, pk
+
+            if not (pk and request_all and len(data) > 0):
+                return
+            pagination_key = pk
+            first_page = False
+            page += 1
+
+    def iter_request(
+        self,
+        method: str,
+        url: str,
+        pagination_key: Optional[str] = None,
+        short_version: bool = False,
+        request_all: bool = True,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        retries: int = 0,
+        stream: bool = False,
+    ) -> Iterator[Dict[str, str]]:
+        """Make requests to the API and yield every single data object as soon as its page is received
+        In streaming mode, every data object is yielded as soon as it is decoded, see iter_stream
+        :param method: HTTP Method e.g. 'GET'
+        :param url: API URL to call
+        :param pagination_key: Additional pagination key, to get the next page
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+            Default: 'False'
+        :param request_all: Indicates, if all following pages should be requested. Default: 'True'
+        :param params: Additional URL parameters.
+        :param body: Request body
+        :param retries: Indicates how many retries should be performed
+        :param stream: Indicates, if the responses should be parsed incrementally. Default: 'False'
+        :type method: str
+        :type url: str
+        :type pagination_key: str
+        :type short_version: bool
+        :type request_all: bool
+        :type params: Dict[str, Any]
+        :type body: Dict[str, Any]
+        :type retries: int
+        :type stream: bool
+        :return: Iterator of raw data objects
+        :rtype: Iterator[Dict[str, str]]
+        :raise APIException: Received bytes content
+        """
+        if stream:
+            yield from self.iter_stream(
+                method=method,
+                url=url,
+                pagination_key=pagination_key,
+                short_version=short_version,
+                request_all=request_all,
+                params=params,
+                body=body,
+                retries=retries,
+            )
+            return
+        for page, pk in self.iter_pages(
+            method=method,
+            url=url,
+            pagination_key=pagination_key,
+            short_version=short_version,
+            request_all=request_all,
+            params=params,
+            body=body,
+            retries=retries,
+        ):
+            if isinstance(page, bytes):
+                raise api_exception.APIException(
+                    "Received bytes content, where json was expected"
+                )
+            yield from page
+
+    def iter_stream(
+        self,
+        method: str,
+        url: str,
+        pagination_key: Optional[str] = None,
+        short_version: bool = False,
+        request_all: bool = True,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        retries: int = 0,
+    ) -> Iterator[Dict[str, Any]]:
+        """Make requests to the API, parse the responses incrementally and yield every single data object as soon as
+        it is decoded, so only one data object of a page is held in memory. Data objects are taken from the data list
+        or from data.sightings and data.forms[*].sightings. Sightings of forms are streamed as well, each gets the
+        form header attached like by flatten_form. The header is collected from the members of the form, which precede
+        its sightings, members following them are added to the shared header later. If ornitho.log_payload_dir is set,
+        the received bytes are written to the payload file while they are parsed. Requires the streaming dependency
+        ijson.
+        :param method: HTTP Method e.g. 'GET'
+        :param url: API URL to call
+        :param pagination_key: Additional pagination key, to get the next page
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+            Default: 'False'
+        :param request_all: Indicates, if all following pages should be requested. Default: 'True'
+        :param params: Additional URL parameters.
+        :param body: Request body
+        :param retries: Indicates how many retries should be performed
+        :type method: str
+        :type url: str
+        :type pagination_key: str
+        :type short_version: bool
+        :type request_all: bool
+        :type params: Dict[str, Any]
+        :type body: Dict[str, Any]
+        :type retries: int
+        :return: Iterator of raw data objects
+        :rtype: Iterator[Dict[str, Any]]
+        :raise ContentTypeException: Received no JSON content
+        """
+        page = 0
+        while True:
+            abs_url, data = self.prepare_request(
+                method=method.lower(),
+                url=url,
+                pagination_key=pagination_key,
+                short_version=short_version,
+                params=params,
+                body=body,
+            )
+            raw_response = self.send(
+                method.lower(), abs_url, data, retries=retries, stream=True
+            )
+            try:
+                if not raw_response.headers.get("Content-Type", "").startswith(
+                    "application/json"
+                ):
+                    raise api_exception.ContentTypeException(raw_response)
+                pk = self.pagination_key(raw_response)
+                count = 0
+                chunks = raw_response.iter_content(chunk_size=ornitho.stream_chunk_size)
+                if ornitho.log_payload_dir:
+                    chunks = tee_payload(
+                        chunks,
+                        method.lower(),
+                        endpoint_name(raw_response.url or "", self.api_base),
+                        "response",
+                        response_extension(raw_response.headers),
+                    )
+                for prefix, item, form_header in json_decoder.iter_items(
+                    chunks,
+                    self.STREAM_PREFIXES,
+                    self.STREAM_PARENTS,
+                ):
+                    if form_header is not None:
+                        if "day" not in form_header:
+                            form_header["day"] = copy(item["date"])
+                        item["form"] = form_header
+                    count += 1
+                    yield item
+            finally:
+                raw_response.close()
+            ornitho.logger.info("Received %s data objects", count)
+            if self.hooks.active:
+                self.emit_page(method, url, page, count, pk)
+
+            if not (pk and request_all and count > 0):
+                return
+            pagination_key = pk
+            page += 1
+
+    def request_raw(
+        self,
+        method: str,
+        url: str,
+        pagination_key: Optional[str] = None,
+        short_version: bool = False,
+        params: Dict[str, Any] = None,
+        body: Dict[str, Any] = None,
+        retries: int = 0,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: bool = True,
+    ) -> Tuple[Any, Any]:
+        """Make direct request to the API
+        Failed requests are retried according to the retry policy, waiting between the attempts, see send
+        :param method: HTTP Method e.g. 'GET'
+        :param url: API URL to call
+        :param pagination_key: Additional pagination key, to get the next page
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+            Default: 'False'
+        :param params: Additional URL parameters.
+        :param body: Request body
+        :param retries: Indicates how many retries should be performed, at least retry_policy.max_retries are performed
+        :param retry_policy: Optional retry policy, overrides the policy of the requester
+        :param idempotent: Indicates, if the request can be repeated without side effects. Else it is only retried, if
+            the server did not process it, see RetryPolicy. Default: 'True'
+        :type method: str
+        :type url: str
+        :type pagination_key: str
+        :type short_version: bool
+        :type params: Dict[str, Any]
+        :type body: Dict[str, Any]
+        :type retries: int
+        :type retry_policy: Optional[RetryPolicy]
+        :type idempotent: bool
+        :return: Tuple of raw response data and pagination key
+        :rtype: Tuple[Any, Any]
+        :raise ConnectionError: Connection error or timeout, which was not retried
+        :raise APIConnectionError: Unspecified error while connecting to Biolovision
+        :raise APIException: Response contains unhandled HTTP Code
+        :raise AuthenticationException: Authentication failed, wrong credentials?
+        :raise GatewayTimeoutException: Request took to long, reduce possible response by adding filters
+        :raise BadGatewayException: Unknown Server error, in most cases a retry is successful
+        :raise ServiceUnavailableException: Service unavailable, in most cases a retry is successful
+        :raise ContentTypeException: Unhandled Content Type received or no information about content typ found
+        """
+        abs_url, data = self.prepare_request(
+            method=method,
+            url=url,
+            pagination_key=pagination_key,
+            short_version=short_version,
+            params=params,
+            body=body,
+        )
+
+        raw_response = self.send(
+            method,
+            abs_url,
+            data,
+            retries=retries,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
+        )
+        return self.handle_response(method, raw_response)
+
+    def send(
+        self,
+        method: str,
+        abs_url: str,
+        data: Optional[str],
+        retries: int = 0,
+        retry_policy: Optional[RetryPolicy] = None,
+        stream: bool = False,
+        idempotent: bool = True,
+    ) -> Response:
+        """Send a prepared request, retrying it according to the retry policy
+        Each attempt is throttled by the configured rate limiter (ornitho.rate_limit, ornitho.max_in_flight). The
+        in-flight slot of a streamed response is held until the response is closed, as its body is downloaded later.
+        :param method: HTTP Method e.g. 'GET'
+        :param abs_url: Absolute url, including all URL parameters
+        :param data: JSON body
+        :param retries: Indicates how many retries should be performed, at least retry_policy.max_retries are performed
+        :param retry_policy: Optional retry policy, overrides the policy of the requester
+        :param stream: Indicates, if the body should be downloaded while it is read. Default: 'False'
+        :param idempotent: Indicates, if the request can be repeated without side effects. Else it is only retried, if
+            the server did not process it, see RetryPolicy. Default: 'True'
+        :type method: str
+        :type abs_url: str
+        :type data: Optional[str]
+        :type retries: int
+        :type retry_policy: Optional[RetryPolicy]
+        :type stream: bool
+        :type idempotent: bool
+        :return: Successful response
+        :rtype: Response
+        :raise ConnectionError: Connection error or timeout, which was not retried
+        :raise APIHttpException: Response contains an error, which was not retried
+        """
+        headers = self.request_headers()
+        rate_limiter = get_rate_limiter()
+        attempts = self.attempts(
+            method, abs_url, data, retries, retry_policy, idempotent
+        )
+        while True:
+            lease = rate_limiter.acquire() if rate_limiter else None
+            held = False
+            try:
+                attempts.begin()
+                try:
+                    raw_response = self.session.request(
+                        method, abs_url, data=data, headers=headers, stream=stream
+                    )
+                except (RequestsConnectionError, Timeout) as ex:
+                    delay = attempts.failed(ex)
+                    if delay is None:
+                        raise
+                else:
+                    try:
+                        delay = attempts.received(raw_response, stream=stream)
+                    finally:
+                        if stream and not 200 <= raw_response.status_code < 300:
+                            # Release the connection of a streamed error response, its body is kept for the exception
+                            raw_response.content
+                            raw_response.close()
+                    if delay is None:
+                        if stream and rate_limiter is not None:
+                            self.release_on_close(raw_response, rate_limiter, lease)
+                            held = True
+                        return raw_response
+            finally:
+                if rate_limiter is not None and not held:
+                    rate_limiter.release(lease)
+            time.sleep(delay)
+
+    @staticmethod
+    def release_on_close(
+        response: Response, rate_limiter: RateLimiter, lease: Optional[str]
+    ) -> None:
+        """Hold the in-flight slot of a streamed response until the response is closed
+        :param response: Streamed response
+        :param rate_limiter: Rate limiter, which granted the slot
+        :param lease: Lease of the slot
+        :type response: Response
+        :type rate_limiter: RateLimiter
+        :type lease: Optional[str]
+        """
+        close = response.close
+        released = False
+
+        def close_and_release() -> None:
+            nonlocal released
+            try:
+                close()
+            finally:
+                if not released:
+                    released = True
+                    rate_limiter.release(lease)
+
+        response.close = close_and_release  # type: ignore
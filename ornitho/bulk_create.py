@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union, cast
+
+import ornitho
+
+if TYPE_CHECKING:
+    from ornitho.model.observation import Observation
+
+
+class BulkCreateReport(object):
+    """Creation of many observations in chunks, sent concurrently, with a report of the failed chunks
+
+    Each observation is serialised once, when the report is created. Chunks are sent in parallel (still subject to
+    the configured rate limiter). The IDs returned by Biolovision are assigned to the observations of each successful
+    chunk. Failed chunks are kept with their exception and can be sent again with retry(), which sends only them.
+    """
+
+    def __init__(
+        self, observations: List["Observation"], chunk_size: int = 100
+    ) -> None:
+        """Bulk create report constructor
+        :param observations: Observations to create
+        :param chunk_size: Number of observations sent with one request. Default: 100
+        :type observations: List[Observation]
+        :type chunk_size: int
+        """
+        self.chunks: List[List["Observation"]] = [
+            observations[i : i + chunk_size]
+            for i in range(0, len(observations), chunk_size)
+        ]
+        self.payloads: List[List[Dict[str, Any]]] = [
+            [observation.raw_data_trim_field_ids() for observation in chunk]
+            for chunk in self.chunks
+        ]
+        self.pending: Set[int] = set(range(len(self.chunks)))
+        self.failures: Dict[int, Exception] = dict()
+
+    def send(self, max_in_flight: int = 4, retries: int = 0) -> "BulkCreateReport":
+        """Send all chunks, which were not created yet
+        :param max_in_flight: Maximum number of parallel requests. Default: 4
+        :param retries: Indicates how many retries should be performed per chunk
+        :type max_in_flight: int
+        :type retries: int
+        :return: This report
+        :rtype: BulkCreateReport
+        """
+        from ornitho.model.observation import Observation
+
+        indices = sorted(self.pending)
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            futures = [
+                (
+                    index,
+                    executor.submit(
+                        Observation.create_many_in_ornitho,
+                        data={"sightings": self.payloads[index]},
+                        retries=retries,
+                    ),
+                )
+                for index in indices
+            ]
+            for index, future in futures:
+                exception = future.exception()
+                if exception is not None:
+                    self.failures[index] = cast(Exception, exception)
+                    continue
+                ids = future.result()
+                chunk = self.chunks[index]
+                if len(ids) == len(chunk):
+                    for observation, id_ in zip(chunk, ids):
+                        observation._id = int(id_)
+                else:
+                    ornitho.logger.warning(
+                        f"Received {len(ids)} IDs for a chunk of {len(chunk)} observations, IDs are not assigned"
+                    )
+                self.failures.pop(index, None)
+                self.pending.discard(index)
+        return self
+
+    def retry(self, max_in_flight: int = 4, retries: int = 0) -> "BulkCreateReport":
+        """Send the failed chunks again, see send
+        :param max_in_flight: Maximum number of parallel requests. Default: 4
+        :param retries: Indicates how many retries should be performed per chunk
+        :type max_in_flight: int
+        :type retries: int
+        :return: This report
+        :rtype: BulkCreateReport
+        """
+        return self.send(max_in_flight=max_in_flight, retries=retries)
+
+    @property
+    def succeeded(self) -> bool:
+        """Indicates, if all chunks were created"""
+        return not self.pending
+
+    @property
+    def created(self) -> List["Observation"]:
+        """Observations of all created chunks"""
+        return [
+            observation
+            for index, chunk in enumerate(self.chunks)
+            if index not in self.pending
+            for observation in chunk
+        ]
+
+    @property
+    def failed(self) -> List["Observation"]:
+        """Observations of all chunks, which were not created"""
+        return [
+            observation
+            for index in sorted(self.pending)
+            for observation in self.chunks[index]
+        ]
+
+    @property
+    def ids(self) -> List[Optional[Union[int, str]]]:
+        """IDs of all observations, in order of the given observations. None, if the observation was not created."""
+        return [observation.id_ for chunk in self.chunks for observation in chunk]
@@ -0,0 +1,265 @@
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
+
+import ornitho
+from ornitho.api_requester import APIRequester
+from ornitho.model.abstract import ListableModel
+from ornitho.model.family import Family
+from ornitho.model.field import Field
+from ornitho.model.field_option import FieldOption
+from ornitho.model.local_admin_unit import LocalAdminUnit
+from ornitho.model.species import Species
+from ornitho.model.taxo_group import TaxonomicGroup
+from ornitho.model.territorial_unit import TerritorialUnit
+
+# Version of the snapshot file format, snapshots with another version are not read
+CATALOG_VERSION = 1
+
+# Reference tables held by the catalog, keyed by their endpoint
+CATALOG_MODELS: Dict[str, Type[ListableModel]] = {
+    model.ENDPOINT: model
+    for model in (
+        TaxonomicGroup,
+        Family,
+        Species,
+        TerritorialUnit,
+        LocalAdminUnit,
+        Field,
+    )
+}
+
+
+class Catalog(object):
+    """Preloaded reference data (species, families, taxonomic groups, territorial units, local admin units and
+    fields with their options), indexed for lookups without API calls
+
+    The catalog is loaded from Biolovision once and can be persisted to a local snapshot file.
+    """
+
+    def __init__(
+        self,
+        tables: Dict[str, List[Dict[str, Any]]],
+        field_options: Dict[str, List[Dict[str, Any]]],
+        created: Optional[datetime] = None,
+    ) -> None:
+        """Catalog constructor
+        :param tables: Raw data of each reference table, keyed by endpoint
+        :param field_options: Raw data of the options of each field, keyed by field ID
+        :param created: Time the data was retrieved from Biolovision. Default: now
+        :type tables: Dict[str, List[Dict[str, Any]]]
+        :type field_options: Dict[str, List[Dict[str, Any]]]
+        :type created: Optional[datetime]
+        """
+        self.tables: Dict[str, List[Dict[str, Any]]] = tables
+        self.field_options: Dict[str, List[Dict[str, Any]]] = field_options
+        self.created: datetime = created or datetime.now().astimezone()
+
+        self._by_id: Dict[str, Dict[Union[int, str], Any]] = dict()
+        for endpoint, model in CATALOG_MODELS.items():
+            instances = [
+                model.create_from_ornitho_json(data)
+                for data in self.tables.get(endpoint, [])
+            ]
+            self._by_id[endpoint] = {
+                cast(Union[int, str], instance.id_): instance for instance in instances
+            }
+
+        self._field_options_by_id: Dict[str, FieldOption] = dict()
+        self._field_options_by_name: Dict[Tuple[Optional[int], str], FieldOption] = (
+            dict()
+        )
+        for id_field, options in self.field_options.items():
+            options_of_field = [
+                FieldOption.create_from_ornitho_json(option) for option in options
+            ]
+            for field_option in options_of_field:
+                self._field_options_by_id[str(field_option.id_)] = field_option
+                self._field_options_by_name[(int(id_field), field_option.name)] = (
+                    field_option
+                )
+                self._field_options_by_name.setdefault(
+                    (None, field_option.name), field_option
+                )
+            field = self._by_id[Field.ENDPOINT].get(int(id_field))
+            if field is not None:
+                field._options = options_of_field
+
+        self._species_by_latin_name: Dict[str, Species] = dict()
+        self._species_by_german_name: Dict[str, Species] = dict()
+        self._species_by_euring_id: Dict[int, Species] = dict()
+        self._species_by_dda_id: Dict[int, Species] = dict()
+        for species in self._by_id[Species.ENDPOINT].values():
+            data = species._raw_data
+            if data.get("latin_name"):
+                latin_name = self._name_key(data["latin_name"])
+                self._species_by_latin_name[latin_name] = species
+            if data.get("german_name"):
+                german_name = self._name_key(data["german_name"])
+                self._species_by_german_name[german_name] = species
+            euring_id = self._text_id(data.get("euring_id_species"))
+            if euring_id is not None:
+                self._species_by_euring_id[euring_id] = species
+            dda_id = self._text_id(data.get("dda_id_species"))
+            if dda_id is not None:
+                self._species_by_dda_id[dda_id] = species
+
+    def __len__(self) -> int:
+        """Number of reference objects, without field options"""
+        return sum(len(instances) for instances in self._by_id.values())
+
+    @staticmethod
+    def _name_key(name: str) -> str:
+        """Normalize a species name for the name indexes, ignoring case and the hyphenation marks ('|')"""
+        return name.replace("|", "").casefold()
+
+    @staticmethod
+    def _text_id(value: Any) -> Optional[int]:
+        """Extract an ID given as plain value or as '#text' element"""
+        if isinstance(value, dict):
+            value = value.get("#text")
+        return int(value) if value is not None and str(value).isdigit() else None
+
+    @classmethod
+    def fetch(cls, retries: int = 0) -> "Catalog":
+        """Retrieve all reference tables from Biolovision
+        :param retries: Indicates how many retries should be performed per request
+        :type retries: int
+        :return: New catalog
+        :rtype: Catalog
+        """
+        tables: Dict[str, List[Dict[str, Any]]] = dict()
+        field_options: Dict[str, List[Dict[str, Any]]] = dict()
+        with APIRequester() as requester:
+            for endpoint in CATALOG_MODELS.keys():
+                response, pk = requester.request(
+                    method="get", url=endpoint, request_all=True, retries=retries
+                )
+                tables[endpoint] = response  # type: ignore
+            for field in tables[Field.ENDPOINT]:
+                response, pk = requester.request(
+                    method="get", url=f"fields/{field['id']}", retries=retries
+                )
+                field_options[str(field["id"])] = response  # type: ignore
+        return cls(tables=tables, field_options=field_options)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Catalog":
+        """Read a catalog from a snapshot file
+        :param path: Path of the snapshot file
+        :type path: str
+        :return: Catalog
+        :rtype: Catalog
+        :raise ValueError: Snapshot was written with another catalog version
+        """
+        with open(path, "r", encoding="utf-8") as snapshot_file:
+            snapshot = json.load(snapshot_file)
+        if snapshot.get("version") != CATALOG_VERSION:
+            raise ValueError(
+                f"Catalog snapshot {path} has version {snapshot.get('version')}, expected {CATALOG_VERSION}"
+            )
+        return cls(
+            tables=snapshot["tables"],
+            field_options=snapshot["field_options"],
+            created=datetime.fromisoformat(snapshot["created"]),
+        )
+
+    def save(self, path: str) -> None:
+        """Write the catalog to a snapshot file. The file is replaced atomically.
+        :param path: Path of the snapshot file
+        :type path: str
+        """
+        snapshot = {
+            "version": CATALOG_VERSION,
+            "ornitho_version": ornitho.__version__,
+            "created": self.created.isoformat(),
+            "tables": self.tables,
+            "field_options": self.field_options,
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as snapshot_file:
+            json.dump(snapshot, snapshot_file)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def from_snapshot(
+        cls, path: str, max_age: Optional[timedelta] = None, retries: int = 0
+    ) -> "Catalog":
+        """Read the catalog from a snapshot file, or retrieve and save it, if the file is missing, outdated or was
+        written with another catalog version
+        :param path: Path of the snapshot file
+        :param max_age: Maximum age of the snapshot. Default: None, snapshots never expire
+        :param retries: Indicates how many retries should be performed per request
+        :type path: str
+        :type max_age: Optional[timedelta]
+        :type retries: int
+        :return: Catalog
+        :rtype: Catalog
+        """
+        if os.path.exists(path):
+            try:
+                catalog = cls.from_file(path)
+            except ValueError as ex:
+                ornitho.logger.warning(f"{ex}. Retrieving catalog again...")
+            else:
+                if (
+                    max_age is None
+                    or datetime.now().astimezone() - catalog.created <= max_age
+                ):
+                    return catalog
+        catalog = cls.fetch(retries=retries)
+        catalog.save(path)
+        return catalog
+
+    def taxo_group(self, id_: int) -> Optional[TaxonomicGroup]:
+        """Taxonomic group with the given ID"""
+        return self._by_id[TaxonomicGroup.ENDPOINT].get(id_)
+
+    def family(self, id_: int) -> Optional[Family]:
+        """Family with the given ID"""
+        return self._by_id[Family.ENDPOINT].get(id_)
+
+    def species(self, id_: int) -> Optional[Species]:
+        """Species with the given ID"""
+        return self._by_id[Species.ENDPOINT].get(id_)
+
+    def species_by_latin_name(self, latin_name: str) -> Optional[Species]:
+        """Species with the given latin name, ignoring case and hyphenation marks"""
+        return self._species_by_latin_name.get(self._name_key(latin_name))
+
+    def species_by_german_name(self, german_name: str) -> Optional[Species]:
+        """Species with the given german name, ignoring case and hyphenation marks, e.g. 'Stock|ente'"""
+        return self._species_by_german_name.get(self._name_key(german_name))
+
+    def species_by_euring_id(self, euring_id: int) -> Optional[Species]:
+        """Species with the given EURING ID"""
+        return self._species_by_euring_id.get(euring_id)
+
+    def species_by_dda_id(self, dda_id: int) -> Optional[Species]:
+        """Species with the given DDA ID"""
+        return self._species_by_dda_id.get(dda_id)
+
+    def territorial_unit(self, id_: int) -> Optional[TerritorialUnit]:
+        """Territorial unit with the given ID"""
+        return self._by_id[TerritorialUnit.ENDPOINT].get(id_)
+
+    def local_admin_unit(self, id_: int) -> Optional[LocalAdminUnit]:
+        """Local admin unit with the given ID"""
+        return self._by_id[LocalAdminUnit.ENDPOINT].get(id_)
+
+    def field(self, id_: int) -> Optional[Field]:
+        """Field with the given ID, its options are set from the catalog"""
+        return self._by_id[Field.ENDPOINT].get(id_)
+
+    def field_option(self, id_: str) -> Optional[FieldOption]:
+        """Field option with the given ID, e.g. '2_3'"""
+        return self._field_options_by_id.get(id_)
+
+    def field_option_by_name(
+        self, name: str, id_field: Optional[int] = None
+    ) -> Optional[FieldOption]:
+        """Field option with the given name
+        Without a field ID, the first option with that name is returned. Names are only unique within a field.
+        """
+        return self._field_options_by_name.get((id_field, name))
@@ -0,0 +1,95 @@
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+# Version of the checkpoint file format, checkpoints with another version are not read
+CHECKPOINT_VERSION = 2
+
+
+class Checkpoint(object):
+    """Progress of a paginated request, persisted to a local file
+
+    Pagination keys of Biolovision can only be used once, so a page can't be requested again after it was received.
+    Therefore the checkpoint stores the records of the received page together with the pagination key of the
+    following page, which was not sent yet, the number of records emitted before the page and the number of records
+    of the page, which were consumed. It is written, when a page is received and when the iteration is closed. A
+    resumed iteration emits the remaining records of the stored page first and continues with the stored pagination
+    key. If the process dies without closing the iteration, the records of the stored page consumed since the page was
+    received are emitted again. The file is removed, when the last page was consumed.
+    """
+
+    def __init__(self, path: str, query: Dict[str, Any]) -> None:
+        """Checkpoint constructor
+        :param path: Path of the checkpoint file
+        :param query: Description of the request, e.g. method, URL and filter values
+        :type path: str
+        :type query: Dict[str, Any]
+        """
+        self.path: str = path
+        # Normalized via JSON, so dates are compared in the same format as they are stored
+        self.query: Dict[str, Any] = json.loads(json.dumps(query, default=str))
+
+    def load(
+        self, pagination_key: Optional[str] = None
+    ) -> Tuple[Optional[str], int, List[Any], int]:
+        """Read the progress from the checkpoint file
+        :param pagination_key: Pagination key to start with, if there is no checkpoint file
+        :type pagination_key: Optional[str]
+        :return: Tuple of pagination key of the page following the stored page, number of records emitted before the
+            stored page, records of the stored page and number of consumed records of the stored page
+        :rtype: Tuple[Optional[str], int, List[Any], int]
+        :raise ValueError: Checkpoint file was written for another query or with another version
+        """
+        if not os.path.exists(self.path):
+            return pagination_key, 0, [], 0
+        with open(self.path, encoding="utf-8") as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Checkpoint version {checkpoint.get('version')} is not supported, expected {CHECKPOINT_VERSION}"
+            )
+        if checkpoint["query"] != self.query:
+            raise ValueError(
+                f"Checkpoint {self.path} was written for another query: {checkpoint['query']}"
+            )
+        return (
+            checkpoint["pagination_key"],
+            checkpoint["records_emitted"],
+            checkpoint["page"],
+            checkpoint["page_consumed"],
+        )
+
+    def save(
+        self,
+        pagination_key: Optional[str],
+        records_emitted: int,
+        page: Optional[List[Any]] = None,
+        page_consumed: int = 0,
+    ) -> None:
+        """Write the progress to the checkpoint file. The file is replaced atomically.
+        :param pagination_key: Pagination key of the page following the given page, which was not requested yet
+        :param records_emitted: Number of records emitted before the given page
+        :param page: Records of the received page
+        :param page_consumed: Number of records of the page, which were consumed
+        :type pagination_key: Optional[str]
+        :type records_emitted: int
+        :type page: Optional[List[Any]]
+        :type page_consumed: int
+        """
+        checkpoint: Dict[str, Any] = {
+            "version": CHECKPOINT_VERSION,
+            "query": self.query,
+            "pagination_key": pagination_key,
+            "records_emitted": records_emitted,
+            "page": page or [],
+            "page_consumed": page_consumed,
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file, default=str)
+        os.replace(tmp_path, self.path)
+
+    def remove(self) -> None:
+        """Remove the checkpoint file, if it exists"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
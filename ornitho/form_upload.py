@@ -0,0 +1,207 @@
+import json
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+
+import ornitho
+from ornitho.api_exception import APIException
+
+if TYPE_CHECKING:
+    from ornitho.model.form import Form
+    from ornitho.model.observation import Observation
+
+# Version of the journal file format, journals with another version are not read
+JOURNAL_VERSION = 1
+
+
+def observation_guid(data: Dict[str, Any]) -> Optional[str]:
+    """Return the GUID of raw observation data, without requesting missing fields
+    :param data: Raw observation data
+    :type data: Dict[str, Any]
+    :return: GUID or None
+    :rtype: Optional[str]
+    """
+    observers = data.get("observers") or [{}]
+    guid = observers[0].get("guid")
+    return str(guid).lower() if guid else None
+
+
+class FormUpload(object):
+    """Resumable upload of a form with its observations, journaled to a local file
+
+    The journal records the form ID, the GUID of every observation and each chunk with its GUIDs, before and after it
+    was sent. The form is created once and its ID is journaled at once. Chunks of observations are sent in parallel.
+    Afterwards a single Form.refresh verifies, which GUIDs landed in the form. If the upload was interrupted or
+    chunks failed, running it again with the same journal and observations sends only the missing observations.
+    The journal is removed, when all observations were verified.
+    """
+
+    def __init__(
+        self,
+        journal: str,
+        observations: List["Observation"],
+        chunk_size: int = 128,
+        max_in_flight: int = 4,
+        retries: int = 0,
+    ) -> None:
+        """Form upload constructor
+        :param journal: Path of the journal file
+        :param observations: Observations of the form, in the same order on each run
+        :param chunk_size: Number of observations sent with one request. Default: 128
+        :param max_in_flight: Maximum number of parallel requests. Default: 4
+        :param retries: Indicates how many retries should be performed per request
+        :type journal: str
+        :type observations: List[Observation]
+        :type chunk_size: int
+        :type max_in_flight: int
+        :type retries: int
+        """
+        self.journal: str = journal
+        self.observations: List["Observation"] = observations
+        self.chunk_size: int = chunk_size
+        self.max_in_flight: int = max_in_flight
+        self.retries: int = retries
+        self._lock = threading.Lock()
+        self._by_guid: Dict[str, "Observation"] = dict()
+        self._state: Dict[str, Any] = {
+            "version": JOURNAL_VERSION,
+            "form_id": None,
+            "guids": [],
+            "chunks": [],
+        }
+
+    def load(self) -> Dict[str, Any]:
+        """Read the journal and assign the journaled GUIDs to the observations
+        Observations without GUID get a new one, which is journaled.
+        :return: Journal
+        :rtype: Dict[str, Any]
+        :raise ValueError: Journal was written with another version or for other observations
+        """
+        if os.path.exists(self.journal):
+            with open(self.journal, encoding="utf-8") as journal_file:
+                state = json.load(journal_file)
+            if state.get("version") != JOURNAL_VERSION:
+                raise ValueError(
+                    f"Journal version {state.get('version')} is not supported, expected {JOURNAL_VERSION}"
+                )
+            if len(state["guids"]) != len(self.observations):
+                raise ValueError(
+                    f"Journal {self.journal} was written for {len(state['guids'])} observations, "
+                    f"got {len(self.observations)}"
+                )
+            self._state = state
+        else:
+            self._state["guids"] = [
+                observation_guid(observation._raw_data) or str(uuid.uuid4())
+                for observation in self.observations
+            ]
+        for observation, guid in zip(self.observations, self._state["guids"]):
+            current_guid = observation_guid(observation._raw_data)
+            if current_guid is not None and current_guid != guid.lower():
+                raise ValueError(
+                    f"Observation has GUID {current_guid}, but the journal expects {guid}"
+                )
+            observation.guid = uuid.UUID(guid)
+            self._by_guid[guid.lower()] = observation
+        return self._state
+
+    def save(self) -> None:
+        """Write the journal. The file is replaced atomically."""
+        with self._lock:
+            tmp_path = f"{self.journal}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as journal_file:
+                json.dump(self._state, journal_file)
+            os.replace(tmp_path, self.journal)
+
+    def remove(self) -> None:
+        """Remove the journal, if it exists"""
+        if os.path.exists(self.journal):
+            os.remove(self.journal)
+
+    def _send_chunk(self, form: "Form", chunk: Dict[str, Any]) -> None:
+        """Send one journaled chunk to the form and journal its success"""
+        observations = [self._by_guid[guid.lower()] for guid in chunk["guids"]]
+        form.add_observations(
+            observations, chunk_size=len(observations), retries=self.retries
+        )
+        with self._lock:
+            chunk["state"] = "sent"
+        self.save()
+
+    @staticmethod
+    def landed_guids(form: "Form") -> Set[str]:
+        """Return the GUIDs of all observations of a refreshed form
+        :param form: Refreshed form
+        :type form: Form
+        :return: Set of GUIDs (lower case)
+        :rtype: Set[str]
+        """
+        guids = set()
+        for data in form._raw_data.get("sightings", []):
+            guid = observation_guid(data)
+            if guid is not None:
+                guids.add(guid)
+        return guids
+
+    def run(self, create_form: Callable[[], "Form"]) -> "Form":
+        """Create the form, if the journal holds no form ID yet, and send all observations, which did not land in the
+        form yet
+        :param create_form: Function creating the empty form in ornitho, e.g. calling Form.create_empty
+        :type create_form: Callable[[], Form]
+        :return: Refreshed form
+        :rtype: Form
+        :raise APIException: Observations are missing in the form after sending them. The journal is kept.
+        """
+        from ornitho.model.form import Form
+
+        state = self.load()
+        if state["form_id"] is None:
+            state["form_id"] = create_form().id_
+            self.save()
+            missing = list(state["guids"])
+        else:
+            form = Form(state["form_id"])
+            form.refresh(retries=self.retries)
+            landed = self.landed_guids(form)
+            missing = [guid for guid in state["guids"] if guid.lower() not in landed]
+            ornitho.logger.info(
+                f"Resuming upload of form {state['form_id']}, {len(missing)} observations are missing"
+            )
+        form = Form(state["form_id"])
+
+        chunks = []
+        for i in range(0, len(missing), self.chunk_size):
+            chunk = {
+                "index": len(state["chunks"]),
+                "guids": missing[i : i + self.chunk_size],
+                "state": "sending",
+            }
+            state["chunks"].append(chunk)
+            chunks.append(chunk)
+        self.save()
+
+        failures: List[BaseException] = []
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            futures = [
+                executor.submit(self._send_chunk, form, chunk) for chunk in chunks
+            ]
+            for future in futures:
+                exception = future.exception()
+                if exception is not None:
+                    ornitho.logger.warning(
+                        f"Sending observations to form {state['form_id']} failed: {exception}"
+                    )
+                    failures.append(exception)
+
+        form.refresh(retries=self.retries)
+        landed = self.landed_guids(form)
+        still_missing = [guid for guid in state["guids"] if guid.lower() not in landed]
+        if still_missing:
+            raise APIException(
+                f"{len(still_missing)} observations are missing in form {state['form_id']} "
+                f"({len(failures)} chunks failed), run the upload again to resume"
+            )
+        self.remove()
+        return form
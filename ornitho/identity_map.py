@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple, Type, TypeVar, Union
+
+import ornitho
+
+# Create a generic variable for the mapped instances
+T = TypeVar("T")
+
+
+class IdentityMap(object):
+    """Thread-safe map of shared model instances, keyed by model class and ID
+
+    Referenced entities (e.g. the species of an observation) are created and refreshed once and then shared by every
+    object referencing them. The least recently used entries are evicted, if more than ornitho.identity_map_maxsize
+    instances are held, and entries older than ornitho.identity_map_ttl seconds are created again.
+    """
+
+    def __init__(self) -> None:
+        """Identity map constructor"""
+        self._instances: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        """Number of mapped instances"""
+        return len(self._instances)
+
+    @staticmethod
+    def key(model: type, id_: Union[int, str]) -> Tuple[type, Union[int, str]]:
+        """Build the map key, IDs given as digit strings are treated as integers
+        :param model: Model class
+        :param id_: Unique identifier
+        :type model: type
+        :type id_: Union[int, str]
+        :return: Map key
+        :rtype: Tuple[type, Union[int, str]]
+        """
+        if isinstance(id_, str) and id_.isdigit():
+            id_ = int(id_)
+        return model, id_
+
+    def get(self, model: Type[T], id_: Union[int, str]) -> Optional[T]:
+        """Return the mapped instance, if present and not expired
+        :param model: Model class
+        :param id_: Unique identifier
+        :type model: Type[T]
+        :type id_: Union[int, str]
+        :return: Mapped instance or None
+        :rtype: Optional[T]
+        """
+        key = self.key(model, id_)
+        with self._lock:
+            entry = self._instances.get(key)
+            if entry is None:
+                return None
+            created, instance = entry
+            if (
+                ornitho.identity_map_ttl is not None
+                and time.monotonic() - created > ornitho.identity_map_ttl
+            ):
+                del self._instances[key]
+                return None
+            self._instances.move_to_end(key)
+            return instance
+
+    def add(self, model: Type[T], id_: Union[int, str], instance: T) -> T:
+        """Map an instance. If another thread mapped one in the meantime, that one is returned instead
+        :param model: Model class
+        :param id_: Unique identifier
+        :param instance: Instance to map
+        :type model: Type[T]
+        :type id_: Union[int, str]
+        :type instance: T
+        :return: Mapped instance
+        :rtype: T
+        """
+        key = self.key(model, id_)
+        with self._lock:
+            entry = self._instances.get(key)
+            if entry is not None:
+                return entry[1]
+            self._instances[key] = (time.monotonic(), instance)
+            while len(self._instances) > ornitho.identity_map_maxsize:
+                self._instances.popitem(last=False)
+            return instance
+
+    def get_or_create(
+        self, model: Type[T], id_: Union[int, str], factory: Callable[[], T]
+    ) -> T:
+        """Return the mapped instance or create and map it with the given factory
+        If the identity map is disabled (ornitho.identity_map_enabled), the factory is always called.
+        :param model: Model class
+        :param id_: Unique identifier
+        :param factory: Callable creating the instance, e.g. lambda: Species.get(id_)
+        :type model: Type[T]
+        :type id_: Union[int, str]
+        :type factory: Callable[[], T]
+        :return: Shared instance
+        :rtype: T
+        """
+        if not ornitho.identity_map_enabled:
+            return factory()
+        instance = self.get(model, id_)
+        if instance is not None:
+            self.hits += 1
+            return instance
+        self.misses += 1
+        return self.add(model, id_, factory())
+
+    def clear(self) -> None:
+        """Remove all mapped instances"""
+        with self._lock:
+            self._instances.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Identity map used by all models, if ornitho.identity_map_enabled is set
+identity_map = IdentityMap()
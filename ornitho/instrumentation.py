@@ -0,0 +1,517 @@
+import bisect
+import math
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import ornitho
+
+# Names of the instrumentation events
+EVENTS = ("before_request", "after_response", "on_retry", "on_page")
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    math.inf,
+)
+
+
+def endpoint_name(url: str, api_base: Optional[str] = None) -> str:
+    """Return the endpoint of a URL, with numeric IDs replaced by '{id}', e.g. 'observations/{id}'
+    :param url: Absolute or relative API URL
+    :param api_base: API base, which is removed from absolute URLs
+    :type url: str
+    :type api_base: Optional[str]
+    :return: Endpoint, which can be used as metric label
+    :rtype: str
+    """
+    path = url.split("?", 1)[0]
+    if api_base and path.startswith(api_base):
+        path = path[len(api_base) :]
+    return "/".join(
+        "{id}" if segment.isdigit() else segment
+        for segment in path.strip("/").split("/")
+    )
+
+
+class RequestEvent(object):
+    """Instrumentation data of a request attempt or a received page, passed to the hooks
+
+    before_request and after_response receive one event per attempt, on_retry receives the event of the failed
+    attempt with reason and delay. on_page receives a separate event for every page of a paginated request.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        attempt: int = 0,
+        page: int = 0,
+        request_bytes: int = 0,
+    ) -> None:
+        """Request event constructor
+        :param method: HTTP Method e.g. 'GET'
+        :param endpoint: Endpoint, see endpoint_name
+        :param attempt: Number of retries before this attempt. Default: 0
+        :param page: Pagination depth, 0 for the first page. Default: 0
+        :param request_bytes: Size of the request body in bytes. Default: 0
+        :type method: str
+        :type endpoint: str
+        :type attempt: int
+        :type page: int
+        :type request_bytes: int
+        """
+        self.method: str = method.upper()
+        self.endpoint: str = endpoint
+        self.attempt: int = attempt
+        self.page: int = page
+        self.request_bytes: int = request_bytes
+        # Set after the response was received
+        self.status: Optional[int] = None
+        self.response_bytes: Optional[int] = None
+        self.latency: Optional[float] = None
+        self.exception: Optional[BaseException] = None
+        # Set for retries
+        self.reason: Optional[str] = None
+        self.delay: Optional[float] = None
+        # Set for pages
+        self.records: Optional[int] = None
+        self.has_next: Optional[bool] = None
+
+    def __repr__(self) -> str:
+        """Unambiguous string representation"""
+        return (
+            f"{self.__class__.__name__}(method={self.method}, endpoint={self.endpoint}, attempt={self.attempt}, "
+            f"page={self.page}, status={self.status}, latency={self.latency})"
+        )
+
+    def received(self, response: Any, latency: float, stream: bool = False) -> None:
+        """Record the received response
+        :param response: Response, received from the API
+        :param latency: Seconds between sending the request and receiving the response
+        :param stream: Indicates, if the body was not downloaded yet. Default: 'False'
+        :type response: Response
+        :type latency: float
+        :type stream: bool
+        """
+        self.status = response.status_code
+        self.latency = latency
+        length = response.headers.get("Content-Length")
+        if length is not None:
+            self.response_bytes = int(length)
+        elif not stream:
+            self.response_bytes = len(response.content)
+
+    @property
+    def label(self) -> str:
+        """Status code or exception name, e.g. '200' or 'ConnectionError'"""
+        if self.status is not None:
+            return str(self.status)
+        return type(self.exception).__name__ if self.exception else "unknown"
+
+
+class Hooks(object):
+    """Thread-safe registry of instrumentation callbacks
+
+    Callbacks are called with a RequestEvent for the events before_request, after_response, on_retry and on_page.
+    Exceptions raised by a callback are logged and do not affect the request. Requesters only build events, if at
+    least one callback is registered.
+    """
+
+    def __init__(self) -> None:
+        """Hooks constructor"""
+        self._lock = threading.Lock()
+        self._callbacks: Dict[str, Tuple[Callable[[RequestEvent], Any], ...]] = {
+            event: () for event in EVENTS
+        }
+
+    @property
+    def active(self) -> bool:
+        """Indicates, if any callback is registered"""
+        return any(self._callbacks.values())
+
+    def register(
+        self, event: str, callback: Callable[[RequestEvent], Any]
+    ) -> Callable[[RequestEvent], Any]:
+        """Register a callback for an event
+        :param event: 'before_request', 'after_response', 'on_retry' or 'on_page'
+        :param callback: Function called with the RequestEvent
+        :type event: str
+        :type callback: Callable[[RequestEvent], Any]
+        :return: The callback
+        :rtype: Callable[[RequestEvent], Any]
+        :raise ValueError: Unknown event
+        """
+        if event not in EVENTS:
+            raise ValueError(f"Unknown event '{event}', expected one of {EVENTS}")
+        with self._lock:
+            self._callbacks[event] = self._callbacks[event] + (callback,)
+        return callback
+
+    def unregister(self, event: str, callback: Callable[[RequestEvent], Any]) -> None:
+        """Remove a registered callback, unknown callbacks are ignored
+        :param event: Name of the event
+        :param callback: Registered callback
+        :type event: str
+        :type callback: Callable[[RequestEvent], Any]
+        """
+        with self._lock:
+            self._callbacks[event] = tuple(
+                registered
+                for registered in self._callbacks[event]
+                if registered != callback
+            )
+
+    def add(self, listener: Any) -> Any:
+        """Register every method of the listener, which is named like an event, e.g. a MetricsCollector
+        :param listener: Object with methods named like events
+        :type listener: Any
+        :return: The listener
+        :rtype: Any
+        """
+        for event in EVENTS:
+            if callable(getattr(listener, event, None)):
+                self.register(event, getattr(listener, event))
+        return listener
+
+    def remove(self, listener: Any) -> None:
+        """Remove all methods of a listener added with add
+        :param listener: Added listener
+        :type listener: Any
+        """
+        for event in EVENTS:
+            if callable(getattr(listener, event, None)):
+                self.unregister(event, getattr(listener, event))
+
+    def clear(self) -> None:
+        """Remove all callbacks"""
+        with self._lock:
+            self._callbacks = {event: () for event in EVENTS}
+
+    def emit(self, event: str, request_event: RequestEvent) -> None:
+        """Call all callbacks of an event
+        :param event: Name of the event
+        :param request_event: Event data
+        :type event: str
+        :type request_event: RequestEvent
+        """
+        for callback in self._callbacks[event]:
+            try:
+                callback(request_event)
+            except Exception:
+                ornitho.logger.exception(f"Instrumentation hook for {event} failed")
+
+
+class EndpointMetrics(object):
+    """Aggregated metrics of one method and endpoint"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Endpoint metrics constructor
+        :param buckets: Upper bounds of the latency histogram buckets in seconds, the last one should be infinity
+        :type buckets: Sequence[float]
+        """
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        self.histogram: List[int] = [0] * len(self.buckets)
+        self.count: int = 0
+        self.errors: int = 0
+        self.retries: int = 0
+        self.pages: int = 0
+        self.records: int = 0
+        self.max_page: int = 0
+        self.request_bytes: int = 0
+        self.response_bytes: int = 0
+        self.latency_sum: float = 0.0
+        self.latency_max: float = 0.0
+        self.statuses: Dict[str, int] = dict()
+        self.retry_reasons: Dict[str, int] = dict()
+
+    def __repr__(self) -> str:
+        """Unambiguous string representation"""
+        return (
+            f"{self.__class__.__name__}(count={self.count}, errors={self.errors}, retries={self.retries}, "
+            f"pages={self.pages}, latency_mean={self.latency_mean:.3f})"
+        )
+
+    @property
+    def latency_mean(self) -> float:
+        """Mean latency in seconds"""
+        return self.latency_sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate a latency quantile from the histogram, as upper bound of the bucket containing it
+        :param q: Quantile between 0 and 1, e.g. 0.95
+        :type q: float
+        :return: Latency in seconds, at most the maximum observed latency
+        :rtype: float
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.histogram):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.latency_max)
+        return self.latency_max
+
+
+class MetricsCollector(object):
+    """Thread-safe in-memory metrics, aggregated per method and endpoint
+
+    Add the collector to the hooks, e.g. ornitho.hooks.add(MetricsCollector()). It counts requests, errors, bytes,
+    retries, pages and records and keeps a latency histogram per endpoint.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Metrics collector constructor
+        :param buckets: Upper bounds of the latency histogram buckets in seconds. Default: DEFAULT_BUCKETS
+        :type buckets: Sequence[float]
+        """
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        self._lock = threading.Lock()
+        self._endpoints: Dict[Tuple[str, str], EndpointMetrics] = dict()
+
+    def _metrics(self, event: RequestEvent) -> EndpointMetrics:
+        key = (event.method, event.endpoint)
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = self._endpoints[key] = EndpointMetrics(self.buckets)
+        return metrics
+
+    def after_response(self, event: RequestEvent) -> None:
+        latency = event.latency or 0.0
+        with self._lock:
+            metrics = self._metrics(event)
+            metrics.count += 1
+            if event.status is None or event.status >= 400:
+                metrics.errors += 1
+            metrics.statuses[event.label] = metrics.statuses.get(event.label, 0) + 1
+            metrics.request_bytes += event.request_bytes
+            metrics.response_bytes += event.response_bytes or 0
+            metrics.latency_sum += latency
+            metrics.latency_max = max(metrics.latency_max, latency)
+            metrics.histogram[
+                min(bisect.bisect_left(self.buckets, latency), len(self.buckets) - 1)
+            ] += 1
+
+    def on_retry(self, event: RequestEvent) -> None:
+        reason = event.reason or event.label
+        with self._lock:
+            metrics = self._metrics(event)
+            metrics.retries += 1
+            metrics.retry_reasons[reason] = metrics.retry_reasons.get(reason, 0) + 1
+
+    def on_page(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._metrics(event)
+            metrics.pages += 1
+            metrics.records += event.records or 0
+            metrics.max_page = max(metrics.max_page, event.page)
+
+    def get(self, method: str, endpoint: str) -> Optional[EndpointMetrics]:
+        """Return the metrics of an endpoint
+        :param method: HTTP Method e.g. 'GET'
+        :param endpoint: Endpoint, see endpoint_name
+        :type method: str
+        :type endpoint: str
+        :return: Metrics or None, if no request was made to the endpoint
+        :rtype: Optional[EndpointMetrics]
+        """
+        return self._endpoints.get((method.upper(), endpoint))
+
+    @property
+    def endpoints(self) -> Dict[Tuple[str, str], EndpointMetrics]:
+        """Metrics keyed by method and endpoint"""
+        with self._lock:
+            return dict(self._endpoints)
+
+    def reset(self) -> None:
+        """Remove all collected metrics"""
+        with self._lock:
+            self._endpoints = dict()
+
+    def report(self) -> str:
+        """Format the metrics as table, endpoints with the highest total latency first
+        :return: Report
+        :rtype: str
+        """
+        lines = [
+            f"{'endpoint':<40} {'count':>7} {'errors':>6} {'retries':>7} {'pages':>6} "
+            f"{'total s':>9} {'mean s':>8} {'p95 s':>8} {'MB':>8}"
+        ]
+        for (method, endpoint), metrics in sorted(
+            self.endpoints.items(), key=lambda item: -item[1].latency_sum
+        ):
+            lines.append(
+                f"{method + ' ' + endpoint:<40} {metrics.count:>7} {metrics.errors:>6} {metrics.retries:>7} "
+                f"{metrics.pages:>6} {metrics.latency_sum:>9.3f} {metrics.latency_mean:>8.3f} "
+                f"{metrics.quantile(0.95):>8.3f} {metrics.response_bytes / 1e6:>8.2f}"
+            )
+        return "\n".join(lines)
+
+
+class PrometheusAdapter(object):
+    """Exports the events as Prometheus metrics, requires prometheus_client
+
+    Add the adapter to the hooks, e.g. ornitho.hooks.add(PrometheusAdapter()). Latencies are observed by the
+    histogram <namespace>_request_duration_seconds, labelled by method, endpoint and status.
+    """
+
+    def __init__(
+        self,
+        registry: Any = None,
+        namespace: str = "ornitho",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Prometheus adapter constructor
+        :param registry: Collector registry. Default: prometheus_client.REGISTRY
+        :param namespace: Prefix of the metric names. Default: 'ornitho'
+        :param buckets: Upper bounds of the latency histogram buckets in seconds. Default: DEFAULT_BUCKETS
+        :type registry: Any
+        :type namespace: str
+        :type buckets: Sequence[float]
+        """
+        import prometheus_client
+
+        kwargs: Dict[str, Any] = {"namespace": namespace}
+        if registry is not None:
+            kwargs["registry"] = registry
+        self.duration = prometheus_client.Histogram(
+            "request_duration_seconds",
+            "Duration of Biolovision API requests",
+            ["method", "endpoint", "status"],
+            buckets=buckets,
+            **kwargs,
+        )
+        self.response_bytes = prometheus_client.Counter(
+            "response_bytes",
+            "Bytes received from the Biolovision API",
+            ["method", "endpoint"],
+            **kwargs,
+        )
+        self.retries = prometheus_client.Counter(
+            "request_retries",
+            "Retried Biolovision API requests",
+            ["method", "endpoint", "reason"],
+            **kwargs,
+        )
+        self.pages = prometheus_client.Counter(
+            "pages",
+            "Pages received from the Biolovision API",
+            ["method", "endpoint"],
+            **kwargs,
+        )
+        self.records = prometheus_client.Counter(
+            "records",
+            "Data objects received from the Biolovision API",
+            ["method", "endpoint"],
+            **kwargs,
+        )
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.duration.labels(event.method, event.endpoint, event.label).observe(
+            event.latency or 0.0
+        )
+        if event.response_bytes:
+            self.response_bytes.labels(event.method, event.endpoint).inc(
+                event.response_bytes
+            )
+
+    def on_retry(self, event: RequestEvent) -> None:
+        self.retries.labels(
+            event.method, event.endpoint, event.reason or event.label
+        ).inc()
+
+    def on_page(self, event: RequestEvent) -> None:
+        self.pages.labels(event.method, event.endpoint).inc()
+        if event.records:
+            self.records.labels(event.method, event.endpoint).inc(event.records)
+
+
+class OpenTelemetryAdapter(object):
+    """Exports the events as OpenTelemetry metrics, requires opentelemetry-api
+
+    Add the adapter to the hooks, e.g. ornitho.hooks.add(OpenTelemetryAdapter()). Latencies are recorded by the
+    histogram ornitho.request.duration with the attributes http.request.method, ornitho.endpoint and
+    http.response.status_code or error.type.
+    """
+
+    def __init__(self, meter: Any = None) -> None:
+        """OpenTelemetry adapter constructor
+        :param meter: Meter. Default: meter 'ornitho' of the global meter provider
+        :type meter: Any
+        """
+        if meter is None:
+            from opentelemetry import metrics
+
+            meter = metrics.get_meter("ornitho", ornitho.__version__)
+        self.duration = meter.create_histogram(
+            "ornitho.request.duration",
+            unit="s",
+            description="Duration of Biolovision API requests",
+        )
+        self.response_bytes = meter.create_counter(
+            "ornitho.response.size",
+            unit="By",
+            description="Bytes received from the Biolovision API",
+        )
+        self.retries = meter.create_counter(
+            "ornitho.request.retries", description="Retried Biolovision API requests"
+        )
+        self.pages = meter.create_counter(
+            "ornitho.pages", description="Pages received from the Biolovision API"
+        )
+        self.records = meter.create_counter(
+            "ornitho.records",
+            description="Data objects received from the Biolovision API",
+        )
+
+    @staticmethod
+    def attributes(event: RequestEvent) -> Dict[str, Any]:
+        """Return the attributes of an event
+        :param event: Request event
+        :type event: RequestEvent
+        :return: Attributes
+        :rtype: Dict[str, Any]
+        """
+        attributes: Dict[str, Any] = {
+            "http.request.method": event.method,
+            "ornitho.endpoint": event.endpoint,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        elif event.exception is not None:
+            attributes["error.type"] = type(event.exception).__name__
+        return attributes
+
+    def after_response(self, event: RequestEvent) -> None:
+        attributes = self.attributes(event)
+        self.duration.record(event.latency or 0.0, attributes)
+        if event.response_bytes:
+            self.response_bytes.add(event.response_bytes, attributes)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        attributes = self.attributes(event)
+        attributes["ornitho.retry.reason"] = event.reason or event.label
+        self.retries.add(1, attributes)
+
+    def on_page(self, event: RequestEvent) -> None:
+        attributes = self.attributes(event)
+        self.pages.add(1, attributes)
+        if event.records:
+            self.records.add(event.records, attributes)
+
+
+# Hooks used by all API requesters, unless a requester is given its own
+hooks = Hooks()
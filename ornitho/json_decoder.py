@@ -0,0 +1,187 @@
+import json
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    cast,
+)
+
+import ornitho
+from ornitho import api_exception
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = cast(Any, None)
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = cast(Any, None)
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = cast(Any, None)
+
+# Success messages, which Biolovision sends as first line in front of the JSON document
+BANNERS = tuple(
+    banner.encode("utf-8")
+    for banner in [
+        # TODO Add other language checks
+        "API message : Ihre Beobachtungsdaten wurden erfolgreich übermittelt, vielen Dank!",
+    ]
+)
+
+
+def backend() -> Callable[[bytes], Any]:
+    """Return the JSON decoding function selected by ornitho.json_backend
+    With 'auto', orjson or ujson is used if installed, else the json module of the standard library.
+    :return: Function decoding JSON bytes
+    :rtype: Callable[[bytes], Any]
+    :raise RuntimeError: Selected backend is unknown or not installed
+    """
+    if ornitho.json_backend == "auto":
+        if orjson is not None:
+            return orjson.loads
+        if ujson is not None:
+            return ujson.loads
+        return json.loads
+    elif ornitho.json_backend == "orjson" and orjson is not None:
+        return orjson.loads
+    elif ornitho.json_backend == "ujson" and ujson is not None:
+        return ujson.loads
+    elif ornitho.json_backend == "json":
+        return json.loads
+    raise RuntimeError(
+        f"JSON backend '{ornitho.json_backend}' is unknown or not installed!"
+    )
+
+
+def strip_banner(content: bytes) -> bytes:
+    """Remove a success message in front of the JSON document, only the first line is checked
+    :param content: Raw response body
+    :type content: bytes
+    :return: JSON document
+    :rtype: bytes
+    """
+    for banner in BANNERS:
+        if content.startswith(banner):
+            line_end = content.find(b"\n", len(banner))
+            return content[line_end + 1 :] if line_end >= 0 else b""
+    return content
+
+
+def loads(content: bytes) -> Any:
+    """Decode a JSON response body. An empty body is decoded as empty dictionary.
+    If the selected backend rejects the document, the json module of the standard library is tried, as it accepts
+    some documents (e.g. NaN values or very large integers), which faster backends refuse.
+    :param content: Raw response body
+    :type content: bytes
+    :return: Decoded JSON
+    :rtype: Any
+    :raise APIException: Body can't be decoded as JSON
+    """
+    content = strip_banner(content)
+    if not content.strip():
+        return dict()
+    loads_fn = backend()
+    try:
+        return loads_fn(content)
+    except ValueError:
+        if loads_fn is not json.loads:
+            try:
+                return json.loads(content)
+            except ValueError:
+                pass
+        raise api_exception.APIException(
+            f"Cant decode the response as JSON:\n{content.decode('utf-8', errors='replace')}"
+        )
+
+
+def iter_items(
+    chunks: Iterable[bytes],
+    prefixes: Collection[str],
+    parents: Collection[str] = (),
+) -> Iterator[Tuple[str, Any, Optional[Dict[str, Any]]]]:
+    """Parse a JSON document incrementally and yield every object located at one of the given prefixes, as soon as
+    it is decoded. Only one object is held in memory at a time.
+    Prefixes use the ijson notation, e.g. 'data.sightings.item' for each element of the sightings array in data.
+    Objects located within a parent object, e.g. 'data.forms.item.sightings.item' within 'data.forms.item', are
+    yielded together with the header of their parent, which holds all other members of the parent. The header is
+    shared by all objects of a parent and members, which follow the objects in the document, are added to it later.
+    :param chunks: Parts of the JSON document, e.g. Response.iter_content()
+    :param prefixes: Prefixes of the objects to yield
+    :param parents: Prefixes of the parent objects, whose headers are collected
+    :type chunks: Iterable[bytes]
+    :type prefixes: Collection[str]
+    :type parents: Collection[str]
+    :return: Iterator of tuples of prefix, decoded object and header of its parent or None
+    :rtype: Iterator[Tuple[str, Any, Optional[Dict[str, Any]]]]
+    :raise RuntimeError: ijson is not installed
+    :raise APIException: Document can't be decoded as JSON
+    """
+    if ijson is None:
+        raise RuntimeError(
+            "Streaming dependency is not installed. Please install 'ijson'"
+        )
+    events = ijson.sendable_list()
+    parser = ijson.parse_coro(events, use_float=True)
+    builder = None
+    item_prefix = None
+    # Header of the current parent object and the builder of its current member
+    header: Optional[Dict[str, Any]] = None
+    parent_prefix = None
+    member_builder = None
+    member_prefix = None
+    member_key = None
+    try:
+        for chunk in chunks:
+            parser.send(chunk)
+            for prefix, event, value in events:
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == item_prefix and event == "end_map":
+                        yield cast(str, item_prefix), builder.value, header
+                        builder = None
+                    continue
+                if member_builder is not None:
+                    member_builder.event(event, value)
+                    if prefix == member_prefix and event in ("end_map", "end_array"):
+                        cast(Dict[str, Any], header)[
+                            cast(str, member_key)
+                        ] = member_builder.value
+                        member_builder = None
+                    continue
+                if prefix in prefixes and event == "start_map":
+                    builder = ijson.ObjectBuilder()
+                    item_prefix = prefix
+                    builder.event(event, value)
+                elif header is not None:
+                    if prefix == parent_prefix:
+                        if event == "map_key":
+                            member_key = value
+                            member_prefix = f"{prefix}.{value}"
+                        elif event == "end_map":
+                            header = None
+                    elif (
+                        prefix == member_prefix
+                        and f"{member_prefix}.item" not in prefixes
+                    ):
+                        if event in ("start_map", "start_array"):
+                            member_builder = ijson.ObjectBuilder()
+                            member_builder.event(event, value)
+                        else:
+                            header[cast(str, member_key)] = value
+                elif prefix in parents and event == "start_map":
+                    header = dict()
+                    parent_prefix = prefix
+            del events[:]
+        parser.close()
+    except ijson.JSONError as ex:
+        raise api_exception.APIException(f"Cant decode the response as JSON: {ex}")
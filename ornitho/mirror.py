@@ -0,0 +1,312 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from ornitho.api_requester import APIRequester
+from ornitho.model.abstract import BaseModel
+from ornitho.model.modification_type import ModificationType
+from ornitho.model.observation import Observation
+
+# Columns stored next to the raw data, so the mirror can be queried without decoding every sighting
+MIRROR_COLUMNS = ("id_species", "id_observer", "id_place", "id_form", "timing")
+
+
+class ObservationMirror(object):
+    """Local copy of observations in a SQLite database, kept up to date via Observation.diff
+
+    The mirror is filled once with load(). Afterwards sync() requests the observations, which were modified or deleted
+    since the last synchronisation (the high-water mark), retrieves the modified ones in chunks via search and
+    removes the deleted ones. Observations are read from the database without API calls.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        id_taxo_group: Optional[int] = None,
+        only_protocol: Optional[Union[str, BaseModel]] = None,
+        only_form: Optional[bool] = None,
+        chunk_size: int = 1000,
+        retries: int = 0,
+    ) -> None:
+        """Observation mirror constructor
+        :param path: Path of the SQLite database
+        :param id_taxo_group: Optional taxo group, to which the synchronised observations must belong to
+        :param only_protocol: Synchronise only observations which are part of the given Protocol
+        :param only_form: Synchronise only observations which are part of a form
+        :param chunk_size: Number of IDs retrieved with one search. Default: 1000
+        :param retries: Indicates how many retries should be performed per request
+        :type path: str
+        :type id_taxo_group: Optional[int]
+        :type only_protocol: Optional[Union[str, "Protocol"]]
+        :type only_form: Optional[bool]
+        :type chunk_size: int
+        :type retries: int
+        """
+        self.path: str = path
+        self.id_taxo_group: Optional[int] = id_taxo_group
+        self.only_protocol: Optional[Union[str, BaseModel]] = only_protocol
+        self.only_form: Optional[bool] = only_form
+        self.chunk_size: int = chunk_size
+        self.retries: int = retries
+        with self.transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS observations (id INTEGER PRIMARY KEY, "
+                "id_species INTEGER, id_observer INTEGER, id_place INTEGER, id_form INTEGER, timing INTEGER, "
+                "raw_data TEXT NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS observations_id_species ON observations (id_species)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS observations_timing ON observations (timing)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS mirror_state (key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection with a write transaction, which is committed on exit"""
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for reading"""
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @property
+    def high_water_mark(self) -> Optional[datetime]:
+        """Time of the last load or synchronisation, None if the mirror was never loaded"""
+        with self.connection() as connection:
+            row = connection.execute(
+                "SELECT value FROM mirror_state WHERE key = 'high_water_mark'"
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    @staticmethod
+    def _set_high_water_mark(connection: sqlite3.Connection, value: datetime) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO mirror_state VALUES ('high_water_mark', ?)",
+            (value.isoformat(),),
+        )
+
+    @property
+    def load_filters(self) -> Dict[str, Any]:
+        """Search values of the last load, which define the scope of the mirror. Dates are in the format of the API."""
+        with self.connection() as connection:
+            row = connection.execute(
+                "SELECT value FROM mirror_state WHERE key = 'load_filters'"
+            ).fetchone()
+        return json.loads(row[0]) if row else dict()
+
+    @staticmethod
+    def _set_load_filters(
+        connection: sqlite3.Connection,
+        filters: Dict[str, Union[str, int, float, bool, datetime, list]],
+    ) -> None:
+        def api_format(value: Any) -> Any:
+            if isinstance(value, datetime) and value.tzinfo:
+                value = value.astimezone(datetime.now().astimezone().tzinfo)
+            if isinstance(value, date):
+                return value.strftime("%d.%m.%Y")
+            return str(value)
+
+        connection.execute(
+            "INSERT OR REPLACE INTO mirror_state VALUES ('load_filters', ?)",
+            (json.dumps(filters, default=api_format),),
+        )
+
+    @staticmethod
+    def _upsert(connection: sqlite3.Connection, raw_data: List[Dict[str, Any]]) -> None:
+        rows = []
+        for data in raw_data:
+            values = []
+            for name in ("id_",) + MIRROR_COLUMNS:
+                column = Observation.TABLE_COLUMNS[name]
+                try:
+                    values.append(column.convert(column.extract(data)))
+                except (KeyError, IndexError, TypeError, ValueError):
+                    values.append(None)
+            rows.append(values + [json.dumps(data)])
+        connection.executemany(
+            "INSERT OR REPLACE INTO observations VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+        )
+
+    @staticmethod
+    def _delete(connection: sqlite3.Connection, ids: Iterable[int]) -> None:
+        connection.executemany(
+            "DELETE FROM observations WHERE id = ?", [(id_,) for id_ in ids]
+        )
+
+    def load(self, **kwargs: Union[str, int, float, bool, datetime, list]) -> int:
+        """Fill the mirror with all observations of a search, page by page. Existing observations are replaced.
+        The high-water mark is set to the start of the load, so changes made during the load are synchronised later.
+        The search values are stored and applied to the searches of sync(), so the mirror keeps the loaded scope.
+        :param kwargs: Search values, e.g. period_choice='all'
+        :type kwargs: Union[str, int, float, bool, datetime, list]
+        :return: Number of loaded observations
+        :rtype: int
+        """
+        started = datetime.now().astimezone()
+        count = 0
+        with APIRequester() as requester:
+            for page, _ in requester.iter_pages(
+                method="post",
+                url=f"{Observation.ENDPOINT}/search",
+                body=dict(kwargs),
+                retries=self.retries,
+            ):
+                if isinstance(page, list):
+                    with self.transaction() as connection:
+                        self._upsert(connection, page)
+                    count += len(page)
+        with self.transaction() as connection:
+            self._set_load_filters(connection, kwargs)
+            self._set_high_water_mark(connection, started)
+        return count
+
+    def sync(self) -> Dict[ModificationType, List[int]]:
+        """Apply all modifications since the high-water mark
+        Modified observations are retrieved in chunks of IDs with the search values of load() and replaced, deleted
+        observations are removed. Modified observations, which are no longer returned by the search (e.g. because they
+        don't match the search values of load() anymore), are removed as well. The high-water mark is only
+        moved after all chunks are applied, so an interrupted synchronisation is repeated completely.
+        :return: Dictionary containing the IDs of the updated and deleted observations
+        :rtype: Dict[ModificationType, List[int]]
+        :raise RuntimeError: Mirror was not loaded yet
+        """
+        high_water_mark = self.high_water_mark
+        if high_water_mark is None:
+            raise RuntimeError("Mirror was not loaded yet, call load() first!")
+        started = datetime.now().astimezone()
+        filters = self.load_filters
+        updated_ids, deleted_ids = Observation.diff_ids(
+            date=high_water_mark,
+            id_taxo_group=self.id_taxo_group,
+            only_protocol=self.only_protocol,
+            only_form=self.only_form,
+            retries=self.retries,
+        )
+
+        with APIRequester() as requester:
+            for i in range(0, len(updated_ids), self.chunk_size):
+                chunk = updated_ids[i : i + self.chunk_size]
+                response, _ = requester.request(
+                    method="post",
+                    url=f"{Observation.ENDPOINT}/search",
+                    body={
+                        "period_choice": "all",
+                        **filters,
+                        "id_sightings_list": chunk,
+                    },
+                    request_all=True,
+                    retries=self.retries,
+                )
+                raw_data = response if isinstance(response, list) else []
+                with self.transaction() as connection:
+                    self._upsert(connection, raw_data)
+                    found = {
+                        int(data["observers"][0]["id_sighting"]) for data in raw_data
+                    }
+                    self._delete(connection, [id_ for id_ in chunk if id_ not in found])
+
+        with self.transaction() as connection:
+            self._delete(connection, deleted_ids)
+            self._set_high_water_mark(connection, started)
+        return {
+            ModificationType.ONLY_MODIFIED: updated_ids,
+            ModificationType.ONLY_DELETED: deleted_ids,
+        }
+
+    def __len__(self) -> int:
+        with self.connection() as connection:
+            return connection.execute("SELECT COUNT(*) FROM observations").fetchone()[0]
+
+    def __contains__(self, id_: Any) -> bool:
+        with self.connection() as connection:
+            return (
+                connection.execute(
+                    "SELECT 1 FROM observations WHERE id = ?", (int(id_),)
+                ).fetchone()
+                is not None
+            )
+
+    def get(self, id_: Union[int, str]) -> Optional[Observation]:
+        """Return an observation of the mirror
+        :param id_: ID of the observation
+        :type id_: Union[int, str]
+        :return: Observation or None, if it is not mirrored
+        :rtype: Optional[Observation]
+        """
+        with self.connection() as connection:
+            row = connection.execute(
+                "SELECT raw_data FROM observations WHERE id = ?", (int(id_),)
+            ).fetchone()
+        return Observation.create_from_ornitho_json(json.loads(row[0])) if row else None
+
+    def search(
+        self,
+        id_species: Optional[int] = None,
+        id_observer: Optional[int] = None,
+        id_place: Optional[int] = None,
+        id_form: Optional[int] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> List[Observation]:
+        """Search for observations in the mirror
+        :param id_species: ID of the species
+        :param id_observer: ID of the observer
+        :param id_place: ID of the place
+        :param id_form: ID of the form
+        :param date_from: Earliest timing (inclusive)
+        :param date_to: Latest timing (inclusive)
+        :type id_species: Optional[int]
+        :type id_observer: Optional[int]
+        :type id_place: Optional[int]
+        :type id_form: Optional[int]
+        :type date_from: Optional[datetime]
+        :type date_to: Optional[datetime]
+        :return: Matching observations, ordered by timing
+        :rtype: List[Observation]
+        """
+        conditions = []
+        values: List[Any] = []
+        for name, value in (
+            ("id_species", id_species),
+            ("id_observer", id_observer),
+            ("id_place", id_place),
+            ("id_form", id_form),
+        ):
+            if value is not None:
+                conditions.append(f"{name} = ?")
+                values.append(int(value))
+        if date_from is not None:
+            conditions.append("timing >= ?")
+            values.append(int(date_from.timestamp()))
+        if date_to is not None:
+            conditions.append("timing <= ?")
+            values.append(int(date_to.timestamp()))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self.connection() as connection:
+            rows = connection.execute(
+                f"SELECT raw_data FROM observations{where} ORDER BY timing, id", values
+            ).fetchall()
+        return [
+            Observation.create_from_ornitho_json(json.loads(row[0])) for row in rows
+        ]
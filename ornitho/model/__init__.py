@@ -1,6 +1,6 @@
 # flake8: noqa
 
-from ornitho.model.abstract import BaseModel
+from ornitho.model.abstract import BaseModel, CompactModel, compact_model
 from ornitho.model.access import Access
 from ornitho.model.detail import Detail
 from ornitho.model.entity import Entity
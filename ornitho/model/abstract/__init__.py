@@ -3,8 +3,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from ornitho.model.abstract.base_model import BaseModel
+from ornitho.model.abstract.compact_model import CompactModel, compact_model
 from ornitho.model.abstract.createable_model import CreateableModel
 from ornitho.model.abstract.deletable_model import DeletableModel
 from ornitho.model.abstract.listable_model import ListableModel
+from ornitho.model.abstract.model_iterator import ModelIterator
 from ornitho.model.abstract.searchable_model import SearchableModel
 from ornitho.model.abstract.updateable_model import UpdateableModel
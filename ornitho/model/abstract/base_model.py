@@ -1,9 +1,26 @@
 from abc import ABC
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from ornitho.api_exception import ObjectNotFoundException
 from ornitho.api_requester import APIRequester
 
+if TYPE_CHECKING:
+    from ornitho.model.abstract.compact_model import CompactModel
+
 # Create a generic variable that can be 'BaseModel', or any subclass.
 T = TypeVar("T", bound="BaseModel")
 
@@ -39,19 +56,82 @@ class BaseModel(ABC):
         cls: Type[T],
         id_: Union[int, str],
         short_version: bool = False,
+        retries: int = 0,
     ) -> T:
         """Retrieve Object from Biolovision with given ID
         :param id_: Unique identifier
         :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+        :param retries: Indicates how many retries should be performed
         :type id_: Union[int, str]
         :type short_version: bool
+        :type retries: int
         :return: Instance, retrieved from Biolovision with given ID
         :rtype: T
         """
         instance = cls(id_)
-        instance.refresh(short_version=short_version)
+        instance.refresh(short_version=short_version, retries=retries)
         return instance
 
+    @classmethod
+    def get_many(
+        cls: Type[T],
+        ids: Iterable[Union[int, str]],
+        short_version: bool = False,
+        max_workers: int = 10,
+        retries: int = 0,
+    ) -> Tuple[List[T], Dict[Union[int, str], Exception]]:
+        """Retrieve several objects from Biolovision in parallel
+        Duplicated IDs are retrieved only once. A failing ID does not abort the others, its exception is reported
+        instead, keyed by the ID as given.
+        :param ids: Unique identifiers
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+        :param max_workers: Maximum number of parallel requests. Default: 10
+        :param retries: Indicates how many retries should be performed per ID
+        :type ids: Iterable[Union[int, str]]
+        :type short_version: bool
+        :type max_workers: int
+        :type retries: int
+        :return: Tuple of retrieved instances (in order of the first occurrence of each successfully retrieved ID) and
+            exceptions of failed IDs
+        :rtype: Tuple[List[T], Dict[Union[int, str], Exception]]
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        instances: List[T] = []
+        failures: Dict[Union[int, str], Exception] = dict()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (
+                    id_,
+                    executor.submit(
+                        cls.get, id_, short_version=short_version, retries=retries
+                    ),
+                )
+                for id_ in unique_ids
+            ]
+            for id_, future in futures:
+                exception = future.exception()
+                if exception is None:
+                    instances.append(future.result())
+                else:
+                    failures[id_] = cast(Exception, exception)
+        return instances, failures
+
+    @classmethod
+    def compact(
+        cls, fields: Sequence[str], keep_raw_data: bool = False
+    ) -> Type["CompactModel"]:
+        """Create a compact class for this model, storing the given fields in __slots__, see compact_model
+        :param fields: Names of the properties to store, e.g. ['id_species', 'timing', 'count']
+        :param keep_raw_data: Indicates, if the raw data should be kept, so to_model() needs no request. Default: False
+        :type fields: Sequence[str]
+        :type keep_raw_data: bool
+        :return: Compact class
+        :rtype: Type[CompactModel]
+        """
+        from ornitho.model.abstract.compact_model import compact_model
+
+        return compact_model(cls, fields, keep_raw_data)
+
     @staticmethod
     def request(
         method: str,
@@ -60,6 +140,7 @@ class BaseModel(ABC):
         body: Dict[str, Any] = None,
         short_version: bool = False,
         retries: int = 0,
+        idempotent: bool = True,
     ) -> List[Any]:
         """Send request to Biolovision and returns response
         :param method: HTTP Method (e.g. 'GET', 'POST', ...)
@@ -68,12 +149,14 @@ class BaseModel(ABC):
         :param body: Request body
         :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
         :param retries: Indicates how many retries should be performed
+        :param idempotent: Indicates, if the request can be repeated without side effects, see RetryPolicy
         :type method: str
         :type url: str
         :type params: Dict[str, Any]
         :type body: Dict[str, Any]
         :type short_version: bool
         :type retries: int
+        :type idempotent: bool
         :return: Response map from Biolovision
         :rtype: List[Any]
         """
@@ -85,6 +168,7 @@ class BaseModel(ABC):
                 body=body,
                 short_version=short_version,
                 retries=retries,
+                idempotent=idempotent,
             )
         # noinspection PyTypeChecker
         return response
@@ -0,0 +1,137 @@
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple, Type, Union
+
+from ornitho.model.abstract.base_model import BaseModel
+
+
+class CompactModel(object):
+    """Abstract base class of compact, read-only model representations
+
+    A compact class stores only selected fields of a model in __slots__. Each field is decoded once with the
+    model's property (e.g. into int, datetime or enum values), so neither the raw JSON nor an instance dictionary is
+    kept. Missing fields and fields, which can't be decoded (e.g. a null timing or an empty count of a sparse
+    sighting), are stored as None, no API requests are made. Compact classes are created with
+    compact_model or BaseModel.compact.
+    """
+
+    __slots__ = ("id_",)
+
+    MODEL: Type[BaseModel]
+    FIELDS: Tuple[str, ...] = ()
+    KEEP_RAW_DATA: bool = False
+
+    def __init__(self, id_: Optional[Union[int, str]], **values: Any) -> None:
+        """Compact model constructor
+        :param id_: Unique identifier
+        :param values: Decoded values of all fields
+        :type id_: Optional[Union[int, str]]
+        :type values: Any
+        """
+        self.id_: Optional[Union[int, str]] = id_
+        for field in self.FIELDS:
+            setattr(self, field, values.get(field))
+
+    def __repr__(self) -> str:
+        """Unambiguous string representation"""
+        values = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in ("id_",) + self.FIELDS
+        )
+        return f"{self.__class__.__name__}({values})"
+
+    def __eq__(self, other: Any) -> bool:
+        """Compact instances are equal, if they have the same class and values"""
+        return type(self) is type(other) and self.as_dict() == other.as_dict()
+
+    @classmethod
+    def from_model(cls, instance: BaseModel) -> "CompactModel":
+        """Decode the fields of a model instance
+        :param instance: Model instance
+        :type instance: BaseModel
+        :return: Compact instance
+        :rtype: CompactModel
+        """
+        refreshed = instance._refreshed
+        # Prevents properties from requesting missing fields
+        instance._refreshed = True
+        try:
+            values: Dict[str, Any] = dict()
+            for field in cls.FIELDS:
+                try:
+                    values[field] = getattr(instance, field)
+                except (KeyError, IndexError, TypeError, ValueError):
+                    values[field] = None
+        finally:
+            instance._refreshed = refreshed
+        compact_instance = cls(instance.id_, **values)
+        if cls.KEEP_RAW_DATA:
+            compact_instance._raw_data = instance._raw_data  # type: ignore
+        return compact_instance
+
+    @classmethod
+    def create_from_ornitho_json(cls, data: Dict[str, Any]) -> "CompactModel":
+        """Decode the fields of raw ornitho data
+        :param data: Raw data, e.g. received from APIRequester.iter_request
+        :type data: Dict[str, Any]
+        :return: Compact instance
+        :rtype: CompactModel
+        """
+        return cls.from_model(cls.MODEL.create_from_ornitho_json(data))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the ID and all decoded fields
+        :return: Dictionary of field names and values
+        :rtype: Dict[str, Any]
+        """
+        values = {field: getattr(self, field) for field in self.FIELDS}
+        values["id_"] = self.id_
+        return values
+
+    def to_model(self) -> BaseModel:
+        """Return a full model instance, e.g. to update it
+        If the raw data was kept, the instance is created from it. Else, the instance is retrieved from Biolovision
+        on first access of a property.
+        :return: Model instance
+        :rtype: BaseModel
+        """
+        if self.KEEP_RAW_DATA:
+            return self.MODEL.create_from_ornitho_json(self._raw_data)  # type: ignore
+        return self.MODEL(self.id_)
+
+
+@lru_cache(maxsize=None)
+def _compact_model(
+    model: Type[BaseModel], fields: Tuple[str, ...], keep_raw_data: bool
+) -> Type[CompactModel]:
+    """Create the compact class, cached for each combination of arguments"""
+    fields = tuple(field for field in fields if field != "id_")
+    for field in fields:
+        if not isinstance(getattr(model, field, None), property):
+            raise ValueError(f"{model.__name__} has no property '{field}'")
+    slots = fields + ("_raw_data",) if keep_raw_data else fields
+    return type(
+        f"Compact{model.__name__}",
+        (CompactModel,),
+        {
+            "__slots__": slots,
+            "MODEL": model,
+            "FIELDS": fields,
+            "KEEP_RAW_DATA": keep_raw_data,
+        },
+    )
+
+
+def compact_model(
+    model: Type[BaseModel], fields: Sequence[str], keep_raw_data: bool = False
+) -> Type[CompactModel]:
+    """Create a compact class for a model, storing the given fields in __slots__
+    :param model: Model class
+    :param fields: Names of the properties to store, e.g. ['id_species', 'timing', 'count']
+    :param keep_raw_data: Indicates, if the raw data should be kept, so to_model() needs no request. Default: False
+    :type model: Type[BaseModel]
+    :type fields: Sequence[str]
+    :type keep_raw_data: bool
+    :return: Compact class
+    :rtype: Type[CompactModel]
+    :raise ValueError: Model has no property with the given name
+    """
+    return _compact_model(model, tuple(fields), keep_raw_data)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 from ornitho.model.abstract import BaseModel
 
@@ -15,6 +15,7 @@ class CreateableModel(BaseModel, ABC):
     @classmethod
     def create_in_ornitho(cls: Type[T], data: Dict[str, Any], retries: int = 0) -> int:
         """Create an instance on ornitho
+        Creates are only retried, if the server did not process the request, so no duplicates are created
         :param data: Data
         :param retries: Indicates how many retries should be performed
         :type data: T
@@ -24,9 +25,31 @@ class CreateableModel(BaseModel, ABC):
         """
         url = cls.CREATE_ENDPOINT if cls.CREATE_ENDPOINT is not None else cls.ENDPOINT
         body = {"data": data}
-        response = cls.request(method="post", url=url, body=body, retries=retries)
+        response = cls.request(
+            method="post", url=url, body=body, retries=retries, idempotent=False
+        )
         return response[0]["id"][0]
 
+    @classmethod
+    def create_many_in_ornitho(
+        cls: Type[T], data: Dict[str, Any], retries: int = 0
+    ) -> List[int]:
+        """Create several instances on ornitho with one request
+        Creates are only retried, if the server did not process the request, so no duplicates are created
+        :param data: Data, e.g. {'sightings': [...]}
+        :param retries: Indicates how many retries should be performed
+        :type data: Dict[str, Any]
+        :type retries: int
+        :return: Ornitho IDs of the created objects, in order of the sent data
+        :rtype: List[int]
+        """
+        url = cls.CREATE_ENDPOINT if cls.CREATE_ENDPOINT is not None else cls.ENDPOINT
+        body = {"data": data}
+        response = cls.request(
+            method="post", url=url, body=body, retries=retries, idempotent=False
+        )
+        return response[0]["id"]
+
     @classmethod
     @abstractmethod
     def create(cls: Type[T], **kwargs) -> T:
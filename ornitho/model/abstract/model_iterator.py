@@ -0,0 +1,124 @@
+from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, Type, TypeVar
+
+from ornitho.api_exception import APIException
+from ornitho.checkpoint import Checkpoint
+from ornitho.model.abstract.base_model import BaseModel
+
+# Create a generic variable that can be 'BaseModel', or any subclass.
+T = TypeVar("T", bound=BaseModel)
+
+
+class ModelIterator(Generic[T]):
+    """Iterator creating model instances page by page
+    Pages are only requested, when all instances of the previous page were consumed. Stopping early (e.g. with
+    itertools.islice) therefore does not request the remaining pages.
+    With a checkpoint, each received page is stored in the checkpoint and close() stores the number of instances
+    consumed of the current page, see Checkpoint.
+    """
+
+    def __init__(
+        self,
+        model: Type[T],
+        pages: Iterator[Tuple[Any, Optional[str]]],
+        pagination_key: Optional[str] = None,
+        count: int = 0,
+        checkpoint: Optional[Checkpoint] = None,
+        page: Optional[List[Dict[str, Any]]] = None,
+        page_position: int = 0,
+    ) -> None:
+        """Model iterator constructor
+        :param model: Model class, which is used to create the instances
+        :param pages: Iterator of raw data lists and pagination keys, e.g. from APIRequester.iter_pages
+        :param pagination_key: Pagination key, which was used to request the first page of pages
+        :param count: Number of instances returned before the first page, e.g. by an interrupted iteration
+        :param checkpoint: Checkpoint, in which the progress is stored
+        :param page: Records of a page received before, which are returned before the pages, e.g. from a checkpoint
+        :param page_position: Number of records of the given page, which were already consumed
+        :type model: Type[T]
+        :type pages: Iterator[Tuple[Any, Optional[str]]]
+        :type pagination_key: Optional[str]
+        :type count: int
+        :type checkpoint: Optional[Checkpoint]
+        :type page: Optional[List[Dict[str, Any]]]
+        :type page_position: int
+        """
+        self._model: Type[T] = model
+        self._pages: Iterator[Tuple[Any, Optional[str]]] = pages
+        self._checkpoint: Optional[Checkpoint] = checkpoint
+        self._page_list: List[Dict[str, Any]] = page or []
+        self._page: Iterator[Dict[str, Any]] = iter(self._page_list[page_position:])
+        # A stored page without following pagination key was the last page
+        self._exhausted: bool = bool(page) and pagination_key is None
+        self._requested: bool = False
+        self.pagination_key: Optional[str] = None if page else pagination_key
+        self.next_pagination_key: Optional[str] = pagination_key
+        self.page_position: int = page_position
+        self.count: int = count + page_position
+
+    def __iter__(self) -> "ModelIterator[T]":
+        return self
+
+    def __enter__(self) -> "ModelIterator[T]":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __next__(self) -> T:
+        """Return the next instance, requesting the next page if necessary
+        :return: Next instance
+        :rtype: T
+        :raise APIException: Received bytes content, where json was expected, or a resumed iteration received an
+            empty first page
+        """
+        while True:
+            data = next(self._page, None)
+            if data is not None:
+                break
+            page, pk = self._next_page()
+            if isinstance(page, bytes):
+                raise APIException("Received bytes content, where json was expected")
+            page_list: List[Dict[str, Any]] = page
+            if self._checkpoint is not None:
+                if not self._requested and self.count > 0 and not page_list:
+                    raise APIException(
+                        f"Resuming {self._checkpoint.path} after {self.count} records received an empty page, "
+                        f"the pagination key may have expired. The checkpoint is kept."
+                    )
+                self._checkpoint.save(pk, self.count, page_list)
+            self._requested = True
+            self.pagination_key = self.next_pagination_key
+            self.next_pagination_key = pk
+            self.page_position = 0
+            self._page_list = page_list
+            self._page = iter(page_list)
+        self.page_position += 1
+        self.count += 1
+        return self._model.create_from_ornitho_json(data)
+
+    def _next_page(self) -> Tuple[Any, Optional[str]]:
+        """Return the next page, the checkpoint is removed after the last page"""
+        try:
+            if self._exhausted:
+                raise StopIteration
+            return next(self._pages)
+        except StopIteration:
+            self._exhausted = True
+            if self._checkpoint is not None:
+                self._checkpoint.remove()
+                self._checkpoint = None
+            raise
+
+    def close(self) -> None:
+        """Stop the iteration. With a checkpoint, the number of consumed instances of the current page is stored, so
+        a resumed iteration continues after the last returned instance."""
+        if self._checkpoint is not None and (self._page_list or self._requested):
+            self._checkpoint.save(
+                self.next_pagination_key,
+                self.count - self.page_position,
+                self._page_list,
+                self.page_position,
+            )
+        close = getattr(self._pages, "close", None)
+        if close is not None:
+            close()
@@ -1,9 +1,11 @@
 from abc import ABC
 from datetime import date, datetime
-from typing import List, Optional, Tuple, Type, TypeVar, Union
+from typing import Any, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 
 from ornitho.api_requester import APIRequester
+from ornitho.checkpoint import Checkpoint
 from ornitho.model.abstract import BaseModel
+from ornitho.model.abstract.model_iterator import ModelIterator
 
 # Create a generic variable that can be 'SearchableModel', or any subclass.
 T = TypeVar("T", bound="SearchableModel")
@@ -77,3 +79,68 @@ class SearchableModel(BaseModel, ABC):
             **kwargs
         )
         return object_list
+
+    @classmethod
+    def iter_search(
+        cls: Type[T],
+        pagination_key: Optional[str] = None,
+        short_version: bool = False,
+        retries: int = 0,
+        checkpoint: Optional[str] = None,
+        **kwargs: Union[str, int, float, bool, date, datetime, list]
+    ) -> ModelIterator[T]:
+        """Iterates over all search results at Biolovision via POST search, requesting the pages lazily
+        The iterator exposes the pagination key of the current page, which can be used to resume the iteration.
+        :param pagination_key: Pagination key, which can be used to start at a later page
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+        :param retries: Indicates how many retries should be performed
+        :param checkpoint: Path of a checkpoint file, which stores each received page and the progress, when the
+            iterator is closed. If the file exists, the iteration is resumed after the last consumed record. See
+            Checkpoint.
+        :param kwargs: Search values
+        :type pagination_key: Optional[str]
+        :type short_version: bool
+        :type retries: int
+        :type checkpoint: Optional[str]
+        :type kwargs: Union[str, int, float, bool, date, datetime, list]
+        :return: Iterator of instances
+        :rtype: ModelIterator[T]
+        :raise ValueError: Checkpoint file was written for another query
+        :raise APIException: Resumed iteration received an empty first page, the checkpoint file is kept
+        """
+        count = 0
+        page: List[Any] = []
+        page_position = 0
+        tracker: Optional[Checkpoint] = None
+        if checkpoint:
+            tracker = Checkpoint(
+                checkpoint,
+                {
+                    "method": "post",
+                    "url": "%s/search" % cls.ENDPOINT,
+                    "short_version": short_version,
+                    "body": kwargs,
+                },
+            )
+            pagination_key, count, page, page_position = tracker.load(pagination_key)
+
+        def pages() -> Iterator[Tuple[Any, Optional[str]]]:
+            with APIRequester() as requester:
+                yield from requester.iter_pages(
+                    method="post",
+                    url="%s/search" % cls.ENDPOINT,
+                    pagination_key=pagination_key,
+                    short_version=short_version,
+                    body=kwargs,
+                    retries=retries,
+                )
+
+        return ModelIterator(
+            cls,
+            pages(),
+            pagination_key,
+            count,
+            checkpoint=tracker,
+            page=page,
+            page_position=page_position,
+        )
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from ornitho.identity_map import identity_map
 from ornitho.model.abstract import ListableModel
 from ornitho.model.taxo_group import TaxonomicGroup
 
@@ -34,5 +35,10 @@ class Family(ListableModel):
     @property
     def taxo_group(self) -> TaxonomicGroup:
         if self._taxo_group is None:
-            self._taxo_group = TaxonomicGroup.get(self.id_taxo_group)
+            id_taxo_group = self.id_taxo_group
+            self._taxo_group = identity_map.get_or_create(
+                TaxonomicGroup,
+                id_taxo_group,
+                lambda: TaxonomicGroup.get(id_taxo_group),
+            )
         return self._taxo_group
@@ -18,16 +18,20 @@ class Field(ListableModel):
         self._options: Optional[List[FieldOption]] = None
 
     @classmethod
-    def get(cls, id_: Union[int, str], short_version: bool = False) -> "Field":
+    def get(
+        cls, id_: Union[int, str], short_version: bool = False, retries: int = 0
+    ) -> "Field":
         """Retrieve Object from Biolovision with given ID
         :param id_: Unique identifier
         :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+        :param retries: Indicates how many retries should be performed
         :type id_: Union[int, str]
         :type short_version: bool
+        :type retries: int
         :return: Instance, retrieved from Biolovision with given ID
         :rtype: Field
         """
-        fields = cls.list_all(short_version=short_version)
+        fields = cls.list_all(short_version=short_version, retries=retries)
         for field in fields:
             if field.id_ == id_:
                 return field
@@ -10,12 +10,16 @@ class FieldOption(ListableModel):
     ENDPOINT: str = ""
 
     @classmethod
-    def get(cls, id_: Union[int, str], short_version: bool = False) -> "FieldOption":
+    def get(
+        cls, id_: Union[int, str], short_version: bool = False, retries: int = 0
+    ) -> "FieldOption":
         """Retrieve Object from Biolovision with given ID
         :param id_: Unique identifier
         :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+        :param retries: Indicates how many retries should be performed
         :type id_: str
         :type short_version: bool
+        :type retries: int
         :return: Instance, retrieved from Biolovision with given ID
         :rtype: FieldOption
         """
@@ -25,7 +29,7 @@ class FieldOption(ListableModel):
             else:
                 raise APIException("ID must be string matching (.*)_(.*)")
             response, pagination_key = requester.request(
-                method="GET", url=url, short_version=short_version
+                method="GET", url=url, short_version=short_version, retries=retries
             )
             for option in response:
                 field_option = cls.create_from_ornitho_json(option)
@@ -1,10 +1,11 @@
 from copy import deepcopy
 from datetime import date, time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 import ornitho.model.observation
 from ornitho.api_exception import APIException, ObjectNotFoundException
 from ornitho.api_requester import APIRequester
+from ornitho.form_upload import FormUpload
 from ornitho.model.abstract import CreateableModel, DeletableModel
 from ornitho.model.observation import Observation
 from ornitho.model.place import Place
@@ -62,6 +63,95 @@ class Form(CreateableModel, DeletableModel):
                 raise ObjectNotFoundException(f"Get {data} for {self.instance_url()}")
         return self
 
+    @classmethod
+    def search(
+        cls,
+        request_all: Optional[bool] = False,
+        pagination_key: Optional[str] = None,
+        short_version: bool = False,
+        retries: int = 0,
+        **kwargs: Union[str, int, float, bool, date, list],
+    ) -> Tuple[List["Form"], Optional[str]]:
+        """Search for observations at Biolovision and return their forms, each including its observations
+        Observations, which are not part of a form, are skipped. If the list is chunked, a pagination key ist returned.
+        Parts of a form on several pages are merged into one form. Without request_all, the observations of the last
+        form may continue on the next page.
+        :param request_all: Indicates, if all forms should be retrieved (may result in many API calls)
+        :param pagination_key: Pagination key, which can be used to retrieve the next page
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+        :param retries: Indicates how many retries should be performed
+        :param kwargs: Search values, see Observation.search
+        :type request_all: Optional[bool]
+        :type pagination_key: Optional[str]
+        :type short_version: bool
+        :type retries: int
+        :type kwargs: Union[str, int, float, bool, date, list]
+        :return: Tuple of forms and pagination key
+        :rtype: Tuple[List[Form], Optional[str]]
+        """
+        with APIRequester() as requester:
+            response, pk = requester.request(
+                method="post",
+                url=cls.ENDPOINT,
+                request_all=request_all,
+                pagination_key=pagination_key,
+                short_version=short_version,
+                body=kwargs,
+                retries=retries,
+                flatten_forms=False,
+            )
+        forms = [
+            cls.create_from_ornitho_json(ele)
+            for ele in cls.merge_forms(cast(List[Dict[str, Any]], response))
+        ]
+        return forms, pk
+
+    @staticmethod
+    def merge_forms(raw_forms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge the parts of forms, whose sightings span several pages, into one raw form per ID
+        Elements without sightings are skipped. The given raw forms are not modified.
+        :param raw_forms: Raw forms in order of the pages
+        :type raw_forms: List[Dict[str, Any]]
+        :return: Raw forms, each including the sightings of all its parts
+        :rtype: List[Dict[str, Any]]
+        """
+        merged: Dict[str, Dict[str, Any]] = dict()
+        for raw_form in raw_forms:
+            if "sightings" not in raw_form:
+                continue
+            id_form = raw_form["@id"]
+            if id_form in merged:
+                merged[id_form]["sightings"].extend(raw_form["sightings"])
+            else:
+                merged[id_form] = {**raw_form, "sightings": list(raw_form["sightings"])}
+        return list(merged.values())
+
+    @classmethod
+    def search_all(
+        cls,
+        short_version: bool = False,
+        retries: int = 0,
+        **kwargs: Union[str, int, float, bool, date, list],
+    ) -> List["Form"]:
+        """Search for observations at Biolovision and return all their forms, see Form.search
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+        :param retries: Indicates how many retries should be performed
+        :param kwargs: Search values, see Observation.search
+        :type short_version: bool
+        :type retries: int
+        :type kwargs: Union[str, int, float, bool, date, list]
+        :return: List of forms
+        :rtype: List[Form]
+        """
+        forms, pk = cls.search(
+            request_all=True,
+            pagination_key=None,
+            short_version=short_version,
+            retries=retries,
+            **kwargs,
+        )
+        return forms
+
     @property
     def id_form_universal(self) -> str:
         return self._raw_data["id_form_universal"]
@@ -944,6 +1034,89 @@ class Form(CreateableModel, DeletableModel):
         # Retrieve form again, to get acces to observation ids
         return cls.get(form.id_)
 
+    @classmethod
+    def upload(
+        cls,
+        journal: str,
+        time_start: time,
+        time_stop: time,
+        observations: List[Observation],
+        protocol: Optional[Union[Protocol, str]] = None,
+        comment: str = None,
+        place: Optional[Union[Place, int]] = None,
+        visit_number: Optional[int] = None,
+        sequence_number: Optional[int] = None,
+        full_form: bool = True,
+        protocol_headers: Dict[str, Union[int, str]] = {},
+        chunk_size: int = 128,
+        max_in_flight: int = 4,
+        retries: int = 0,
+        hidde_comment_for_placeholder_observation: str = None,
+    ) -> "Form":
+        """Create a form in ornitho together with its observations, resumable after failures.
+
+        Unlike `create`, the form is not deleted if observations cannot be sent. Progress is
+        journaled to a local file, chunks are sent in parallel and a single `refresh` verifies
+        which observations (by GUID) landed. Calling `upload` again with the same journal and
+        observations sends only the missing ones. See `FormUpload`.
+
+        :param journal: Path of the journal file, removed after a complete upload
+        :param time_start: Start time of the form
+        :param time_stop: Stop time of the form
+        :param observations: Observations of the form, the first one is the template of the placeholder observation
+        :param protocol: Protocol or its name
+        :param comment: Comment of the form
+        :param place: Place or its ID
+        :param visit_number: Visit number of the protocol
+        :param sequence_number: Sequence number of the protocol
+        :param full_form: Indicates, if all species were recorded. Default: 'True'
+        :param protocol_headers: Additional protocol fields, keys starting with 'id_' are sent as references
+        :param chunk_size: Number of observations sent per request. Default: 128
+        :param max_in_flight: Maximum number of parallel requests. Default: 4
+        :param retries: Indicates how many retries should be performed per request
+        :param hidde_comment_for_placeholder_observation: Hidden comment of the placeholder observation
+        :type journal: str
+        :type time_start: time
+        :type time_stop: time
+        :type observations: List[Observation]
+        :type protocol: Optional[Union[Protocol, str]]
+        :type comment: str
+        :type place: Optional[Union[Place, int]]
+        :type visit_number: Optional[int]
+        :type sequence_number: Optional[int]
+        :type full_form: bool
+        :type protocol_headers: Dict[str, Union[int, str]]
+        :type chunk_size: int
+        :type max_in_flight: int
+        :type retries: int
+        :type hidde_comment_for_placeholder_observation: str
+        :return: The refreshed form, including its observations.
+        :rtype: Form
+        :raise APIException: Observations are missing after sending them, the journal is kept
+        """
+        return FormUpload(
+            journal,
+            observations,
+            chunk_size=chunk_size,
+            max_in_flight=max_in_flight,
+            retries=retries,
+        ).run(
+            lambda: cls.create_empty(
+                time_start=time_start,
+                time_stop=time_stop,
+                template_observation=observations[0],
+                protocol=protocol,
+                comment=comment,
+                place=place,
+                visit_number=visit_number,
+                sequence_number=sequence_number,
+                full_form=full_form,
+                protocol_headers=protocol_headers,
+                retries=retries,
+                hidde_comment_for_placeholder_observation=hidde_comment_for_placeholder_observation,
+            )
+        )
+
     def raw_data_trim_field_ids(self) -> Dict[str, Any]:
         raw_data = deepcopy(self._raw_data)
         if self.observations:
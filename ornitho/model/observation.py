@@ -1,12 +1,17 @@
+import itertools
 import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from copy import deepcopy
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
 import ornitho
 import ornitho.model.form
-from ornitho import APIException
+from ornitho import APIException, GatewayTimeoutException, ObjectNotFoundException
+from ornitho.api_requester import APIRequester
+from ornitho.bulk_create import BulkCreateReport
+from ornitho.identity_map import identity_map
 from ornitho.model.abstract import (
     BaseModel,
     CreateableModel,
@@ -25,6 +30,7 @@ from ornitho.model.place import Place
 from ornitho.model.project import Project
 from ornitho.model.relation import Relation, RelationType
 from ornitho.model.species import Species
+from ornitho.table import Column, TableBuilder, raw_value
 
 
 class EstimationCode(Enum):
@@ -69,6 +75,45 @@ class Observation(
     """Representation of on Observation"""
 
     ENDPOINT: str = "observations"
+    # Columns of search_to_table, which are read directly from the raw data. Missing ids are stored as MISSING_INT
+    TABLE_COLUMNS: Dict[str, Column] = {
+        "id_": Column("q", raw_value("observers", 0, "id_sighting"), nullable=False),
+        "id_species": Column(
+            "q",
+            lambda data: data["species"].get("id", data["species"].get("@id")),
+            nullable=False,
+        ),
+        "timing": Column(
+            "q", raw_value("observers", 0, "timing", "@timestamp"), timestamp=True
+        ),
+        "coord_lat": Column("d", raw_value("observers", 0, "coord_lat")),
+        "coord_lon": Column("d", raw_value("observers", 0, "coord_lon")),
+        "altitude": Column("q", raw_value("observers", 0, "altitude")),
+        "count": Column("q", raw_value("observers", 0, "count")),
+        "id_place": Column(
+            "q",
+            lambda data: data["place"].get("id", data["place"].get("@id")),
+            nullable=False,
+        ),
+        "id_observer": Column(
+            "q",
+            lambda data: data["observers"][0].get(
+                "id", data["observers"][0].get("@id")
+            ),
+            nullable=False,
+        ),
+        "id_form": Column("q", raw_value("observers", 0, "id_form"), nullable=False),
+    }
+    TABLE_DEFAULT_COLUMNS: Tuple[str, ...] = (
+        "id_",
+        "id_species",
+        "timing",
+        "coord_lat",
+        "coord_lon",
+        "count",
+        "id_place",
+        "id_observer",
+    )
 
     def __init__(
         self, id_: int = None, modification_type: ModificationType = None
@@ -585,11 +630,16 @@ class Observation(
         """Observed Species"""
         if self._species is None:
             if "@id" in self._raw_data["species"]:
-                self._species = Species.create_from_ornitho_json(
-                    self._raw_data["species"]
+                self._species = identity_map.get_or_create(
+                    Species,
+                    self._raw_data["species"]["@id"],
+                    lambda: Species.create_from_ornitho_json(self._raw_data["species"]),
                 )
             else:
-                self._species = Species.get(self._raw_data["species"]["id"])
+                id_species = self._raw_data["species"]["id"]
+                self._species = identity_map.get_or_create(
+                    Species, id_species, lambda: Species.get(id_species)
+                )
                 self._raw_data["species"] = self._species._raw_data
         return self._species
 
@@ -601,7 +651,10 @@ class Observation(
     @property  # type: ignore
     @check_raw_data("observers")
     def observer(self) -> Observer:
-        """Observing user"""
+        """Observing user
+        Built from the observer record of the sighting, which holds sighting specific values. Therefore it is not
+        shared via the identity map.
+        """
         if self._observer is None:
             self._observer = Observer.create_from_ornitho_json(
                 self._raw_data["observers"][0]
@@ -1216,6 +1269,246 @@ class Observation(
                 {"extended_info": {"direction": {"degree": str(value)}}}
             ]
 
+    @classmethod
+    def get_many(
+        cls,
+        ids: Iterable[Union[int, str]],
+        short_version: bool = False,
+        max_workers: int = 10,
+        retries: int = 0,
+    ) -> Tuple[List["Observation"], Dict[Union[int, str], Exception]]:
+        """Retrieve several observations via search with an ID list, in parallel chunks of 1000 IDs
+        Duplicated IDs are retrieved only once, IDs are compared as integers. A failing chunk does not abort the
+        others, its exception is reported for every ID of the chunk. IDs, which are not found, are reported with an
+        ObjectNotFoundException. Failures are keyed by the first occurrence of the ID as given, like in
+        BaseModel.get_many.
+        :param ids: Unique identifiers
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+        :param max_workers: Maximum number of parallel requests. Default: 10
+        :param retries: Indicates how many retries should be performed per chunk
+        :type ids: Iterable[Union[int, str]]
+        :type short_version: bool
+        :type max_workers: int
+        :type retries: int
+        :return: Tuple of retrieved observations (in order of the first occurrence of each successfully retrieved ID)
+            and exceptions of failed IDs
+        :rtype: Tuple[List[Observation], Dict[Union[int, str], Exception]]
+        """
+        given_ids: Dict[int, Union[int, str]] = dict()
+        for given_id in ids:
+            given_ids.setdefault(int(given_id), given_id)
+        unique_ids = list(given_ids)
+        observations: Dict[int, Observation] = dict()
+        failures: Dict[Union[int, str], Exception] = dict()
+        chunks = [unique_ids[i : i + 1000] for i in range(0, len(unique_ids), 1000)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (
+                    chunk,
+                    executor.submit(
+                        cls.search_all,
+                        short_version=short_version,
+                        retries=retries,
+                        period_choice="all",
+                        id_sightings_list=chunk,
+                    ),
+                )
+                for chunk in chunks
+            ]
+            for chunk, future in futures:
+                exception = future.exception()
+                if exception is None:
+                    for observation in future.result():
+                        if observation.id_ is not None:
+                            observations[int(observation.id_)] = observation
+                else:
+                    for id_ in chunk:
+                        failures[given_ids[id_]] = cast(Exception, exception)
+
+        for id_ in unique_ids:
+            if id_ not in observations and given_ids[id_] not in failures:
+                failures[given_ids[id_]] = ObjectNotFoundException(
+                    f"Observation {id_} not found"
+                )
+        return [
+            observations[id_] for id_ in unique_ids if id_ in observations
+        ], failures
+
+    @classmethod
+    def search_to_table(
+        cls,
+        columns: Iterable[str] = TABLE_DEFAULT_COLUMNS,
+        backend: str = "auto",
+        short_version: bool = False,
+        retries: int = 0,
+        **kwargs: Union[str, int, float, bool, date, datetime, list],
+    ) -> Any:
+        """Search for all observations and collect the given fields as columns, without creating observation objects
+        Every received page is written directly into typed column buffers. Columns of TABLE_COLUMNS are read from the
+        raw data, all other columns via the property of the same name. Missing ids are stored as -1 (MISSING_INT),
+        missing floats as NaN and other missing integers, e.g. timing or count, as nulls (pyarrow), NaT/masked values
+        (numpy) or None (array). The timing column contains unix timestamps (UTC).
+        :param columns: Names of the columns. Default: TABLE_DEFAULT_COLUMNS
+        :param backend: 'auto' (pyarrow, numpy or array, whichever is installed), 'pyarrow', 'numpy' or 'array'
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+        :param retries: Indicates how many retries should be performed
+        :param kwargs: Search values
+        :type columns: Iterable[str]
+        :type backend: str
+        :type short_version: bool
+        :type retries: int
+        :type kwargs: Union[str, int, float, bool, date, datetime, list]
+        :return: pyarrow.Table, dictionary of NumPy arrays or dictionary of array.array/list columns
+        :rtype: Any
+        :raise RuntimeError: Selected backend is unknown or not installed
+        :raise ValueError: Unknown column
+        """
+        builder = TableBuilder(cls, list(columns), cls.TABLE_COLUMNS, backend)
+        with APIRequester() as requester:
+            for page, _ in requester.iter_pages(
+                method="post",
+                url=f"{cls.ENDPOINT}/search",
+                short_version=short_version,
+                body=kwargs,
+                retries=retries,
+            ):
+                builder.append_page(cast(List[Dict[str, Any]], page))
+        return builder.build()
+
+    @staticmethod
+    def split_period(
+        date_from: date, date_to: date, days: int
+    ) -> List[Tuple[date, date]]:
+        """Split a period into consecutive windows of the given number of days, the last one may be shorter
+        :param date_from: First day of the period (inclusive)
+        :param date_to: Last day of the period (inclusive)
+        :param days: Number of days per window
+        :type date_from: date
+        :type date_to: date
+        :type days: int
+        :return: List of first and last day of each window
+        :rtype: List[Tuple[date, date]]
+        """
+        windows = []
+        start = date_from
+        while start <= date_to:
+            end = min(start + timedelta(days=days - 1), date_to)
+            windows.append((start, end))
+            start = end + timedelta(days=1)
+        return windows
+
+    @classmethod
+    def search_partitioned(
+        cls,
+        date_from: date,
+        date_to: date,
+        partition_days: int = 7,
+        split_by: Optional[Dict[str, Iterable[Any]]] = None,
+        max_workers: int = 4,
+        short_version: bool = False,
+        retries: int = 0,
+        **kwargs: Union[str, int, float, bool, date, datetime, list],
+    ) -> List["Observation"]:
+        """Search for all observations of a period by splitting it into smaller searches, which are run in parallel
+        The period is split into windows of partition_days days and, optionally, into one search per value of other
+        filters (e.g. split_by={'id_taxo_group': [1, 2]}). A window, which fails with a GatewayTimeoutException, is
+        split in half and searched again, down to single days. Observations found by several searches are returned
+        once.
+        :param date_from: First day of the period (inclusive)
+        :param date_to: Last day of the period (inclusive)
+        :param partition_days: Number of days searched at once. Default: 7
+        :param split_by: Filter names and values, each combination of values is searched separately
+        :param max_workers: Maximum number of parallel searches. Default: 4
+        :param short_version: Indicates, if a short version with foreign keys should be returned by the API.
+        :param retries: Indicates how many retries should be performed per request
+        :param kwargs: Additional search values
+        :type date_from: date
+        :type date_to: date
+        :type partition_days: int
+        :type split_by: Optional[Dict[str, Iterable[Any]]]
+        :type max_workers: int
+        :type short_version: bool
+        :type retries: int
+        :type kwargs: Union[str, int, float, bool, date, datetime, list]
+        :return: List of observations, ordered by partition
+        :rtype: List[Observation]
+        :raise GatewayTimeoutException: Search of a single day timed out
+        :raise ValueError: A filter of split_by is given as search value as well
+        """
+        overlap = sorted(set(split_by or dict()) & set(kwargs))
+        if overlap:
+            raise ValueError(
+                f"Filters {', '.join(overlap)} are given in split_by and as search values"
+            )
+        if isinstance(date_from, datetime):
+            date_from = date_from.date()
+        if isinstance(date_to, datetime):
+            date_to = date_to.date()
+        kwargs.pop("period_choice", None)
+        split_by = split_by or dict()
+        filter_names = list(split_by.keys())
+        filter_combinations = list(
+            itertools.product(*(list(values) for values in split_by.values()))
+        )
+
+        def search_window(
+            filters: Dict[str, Any], start: date, end: date
+        ) -> List[Observation]:
+            return cls.search_all(
+                short_version=short_version,
+                retries=retries,
+                **kwargs,
+                **filters,
+                period_choice="range",
+                date_from=start,
+                date_to=end,
+            )
+
+        results: List[Tuple[Tuple[int, date], List[Observation]]] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = dict()
+            for index, values in enumerate(filter_combinations):
+                filters = dict(zip(filter_names, values))
+                for start, end in cls.split_period(date_from, date_to, partition_days):
+                    future = executor.submit(search_window, filters, start, end)
+                    pending[future] = (index, filters, start, end)
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index, filters, start, end = pending.pop(future)
+                        exception = future.exception()
+                        if exception is None:
+                            results.append(((index, start), future.result()))
+                        elif (
+                            isinstance(exception, GatewayTimeoutException)
+                            and start < end
+                        ):
+                            middle = start + (end - start) // 2
+                            ornitho.logger.warning(
+                                f"Search from {start} to {end} timed out, splitting it at {middle}"
+                            )
+                            for window_start, window_end in (
+                                (start, middle),
+                                (middle + timedelta(days=1), end),
+                            ):
+                                pending[
+                                    executor.submit(
+                                        search_window, filters, window_start, window_end
+                                    )
+                                ] = (index, filters, window_start, window_end)
+                        else:
+                            raise cast(Exception, exception)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        observations: Dict[Optional[Union[int, str]], Observation] = dict()
+        for _, partition in sorted(results, key=lambda result: result[0]):
+            for observation in partition:
+                observations.setdefault(observation.id_, observation)
+        return list(observations.values())
+
     @classmethod
     def by_observer(
         cls,
@@ -1278,33 +1571,30 @@ class Observation(
         return observations
 
     @classmethod
-    def diff(
+    def diff_ids(
         cls,
         date: datetime,
         modification_type: ModificationType = None,
         id_taxo_group: int = None,
         only_protocol: Union[str, BaseModel] = None,
         only_form: bool = None,
-        retrieve_observations: bool = False,
         retries: int = 0,
-    ) -> Dict[ModificationType, Union[List["Observation"], List[int]]]:
-        """Retrieves observations which changed in between now and a given date
+    ) -> Tuple[List[int], List[int]]:
+        """Retrieves the IDs of observations which changed in between now and a given date
         :param date: Date in the past, to which changed observation should be searched
         :param modification_type: Type of modification.
         :param id_taxo_group: Optional taxo group, to which the observerd species must belong to
         :param only_protocol: Return only observation which are part of the given Protocol (Protocol Instance or Name)
         :param only_form: Return only observation which are part of a form
-        :param retrieve_observations: Indicates if the observation object should be retrieved. Default: False
         :param retries: Indicates how many retries should be performed
         :type date: datetime
         :type modification_type: ModificationType
         :type id_taxo_group: int
         :type only_protocol: Union[str, "Protocol"]
         :type only_form: bool
-        :type retrieve_observations: bool
         :type retries: int
-        :return: Dictionary containing List of Ids/Observations as values and ModificationType as key
-        :rtype: Dict[ModificationType, Union[List["Observation"], List[int]]]
+        :return: Tuple of the IDs of updated and deleted observations
+        :rtype: Tuple[List[int], List[int]]
         """
         url = f"{cls.ENDPOINT}/diff"
         params = dict()
@@ -1335,7 +1625,6 @@ class Observation(
             method="get", url=url, params=params, retries=retries
         )
 
-        updated_observations = []
         updated_observations_id = []
         deleted_observations_id = []
         for obs in changed_observations:
@@ -1343,16 +1632,104 @@ class Observation(
                 updated_observations_id.append(int(obs["id_sighting"]))
             else:
                 deleted_observations_id.append(int(obs["id_sighting"]))
+        return updated_observations_id, deleted_observations_id
+
+    @classmethod
+    def iter_retrieve(
+        cls,
+        ids: List[int],
+        max_workers: int = 10,
+        chunk_size: int = 1000,
+        retries: int = 0,
+    ) -> Iterator[List["Observation"]]:
+        """Retrieves observations via search with ID lists, requesting the chunks in parallel
+        Each chunk is requested with all pages and yielded as soon as it is complete, so chunks may be yielded in
+        another order than the IDs. The first failing chunk raises its exception, pending chunks are cancelled.
+        :param ids: Unique identifiers
+        :param max_workers: Maximum number of parallel requests. Default: 10
+        :param chunk_size: Number of IDs requested with one search. Default: 1000
+        :param retries: Indicates how many retries should be performed per chunk
+        :type ids: List[int]
+        :type max_workers: int
+        :type chunk_size: int
+        :type retries: int
+        :return: Iterator of the observations of each chunk
+        :rtype: Iterator[List[Observation]]
+        """
+        chunks = [ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        if not chunks:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    cls.search_all,
+                    retries=retries,
+                    period_choice="all",
+                    id_sightings_list=chunk,
+                )
+                for chunk in chunks
+            ]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    @classmethod
+    def diff(
+        cls,
+        date: datetime,
+        modification_type: ModificationType = None,
+        id_taxo_group: int = None,
+        only_protocol: Union[str, BaseModel] = None,
+        only_form: bool = None,
+        retrieve_observations: bool = False,
+        retries: int = 0,
+        max_workers: int = 10,
+    ) -> Dict[ModificationType, Union[List["Observation"], List[int]]]:
+        """Retrieves observations which changed in between now and a given date
+        Updated observations are retrieved in parallel chunks of 1000 IDs, see iter_retrieve.
+        :param date: Date in the past, to which changed observation should be searched
+        :param modification_type: Type of modification.
+        :param id_taxo_group: Optional taxo group, to which the observerd species must belong to
+        :param only_protocol: Return only observation which are part of the given Protocol (Protocol Instance or Name)
+        :param only_form: Return only observation which are part of a form
+        :param retrieve_observations: Indicates if the observation object should be retrieved. Default: False
+        :param retries: Indicates how many retries should be performed
+        :param max_workers: Maximum number of parallel requests, if observations are retrieved. Default: 10
+        :type date: datetime
+        :type modification_type: ModificationType
+        :type id_taxo_group: int
+        :type only_protocol: Union[str, "Protocol"]
+        :type only_form: bool
+        :type retrieve_observations: bool
+        :type retries: int
+        :type max_workers: int
+        :return: Dictionary containing List of Ids/Observations as values and ModificationType as key
+        :rtype: Dict[ModificationType, Union[List["Observation"], List[int]]]
+        """
+        updated_observations_id, deleted_observations_id = cls.diff_ids(
+            date,
+            modification_type=modification_type,
+            id_taxo_group=id_taxo_group,
+            only_protocol=only_protocol,
+            only_form=only_form,
+            retries=retries,
+        )
 
+        updated_observations: List[Observation] = []
         if retrieve_observations:
-            observations_chunks = [
-                updated_observations_id[i : i + 1000]
-                for i in range(0, len(updated_observations_id), 1000)
+            retrieved: Dict[Optional[Union[int, str]], Observation] = dict()
+            for observations_chunk in cls.iter_retrieve(
+                updated_observations_id, max_workers=max_workers, retries=retries
+            ):
+                for observation in observations_chunk:
+                    retrieved[observation.id_] = observation
+            # Keep the order of the diff
+            updated_observations = [
+                retrieved[id_] for id_ in updated_observations_id if id_ in retrieved
             ]
-            for observations_chunk in observations_chunks:
-                updated_observations += cls.search(
-                    period_choice="all", id_sightings_list=observations_chunk
-                )[0]
         else:
             updated_observations = [
                 cls(id_=obs_id) for obs_id in updated_observations_id
@@ -1363,6 +1740,54 @@ class Observation(
             ModificationType.ONLY_DELETED: deleted_observations_id,
         }
 
+    @classmethod
+    def iter_diff(
+        cls,
+        date: datetime,
+        modification_type: ModificationType = None,
+        id_taxo_group: int = None,
+        only_protocol: Union[str, BaseModel] = None,
+        only_form: bool = None,
+        retries: int = 0,
+        max_workers: int = 10,
+    ) -> Iterator["Observation"]:
+        """Retrieves observations which changed in between now and a given date and yields them as soon as their
+        chunk is received. Deleted observations are yielded first, without data. The modification_type of each
+        observation is set to ModificationType.ONLY_MODIFIED or ModificationType.ONLY_DELETED.
+        :param date: Date in the past, to which changed observation should be searched
+        :param modification_type: Type of modification.
+        :param id_taxo_group: Optional taxo group, to which the observerd species must belong to
+        :param only_protocol: Return only observation which are part of the given Protocol (Protocol Instance or Name)
+        :param only_form: Return only observation which are part of a form
+        :param retries: Indicates how many retries should be performed
+        :param max_workers: Maximum number of parallel requests. Default: 10
+        :type date: datetime
+        :type modification_type: ModificationType
+        :type id_taxo_group: int
+        :type only_protocol: Union[str, "Protocol"]
+        :type only_form: bool
+        :type retries: int
+        :type max_workers: int
+        :return: Iterator of changed observations
+        :rtype: Iterator[Observation]
+        """
+        updated_observations_id, deleted_observations_id = cls.diff_ids(
+            date,
+            modification_type=modification_type,
+            id_taxo_group=id_taxo_group,
+            only_protocol=only_protocol,
+            only_form=only_form,
+            retries=retries,
+        )
+        for obs_id in deleted_observations_id:
+            yield cls(id_=obs_id, modification_type=ModificationType.ONLY_DELETED)
+        for observations_chunk in cls.iter_retrieve(
+            updated_observations_id, max_workers=max_workers, retries=retries
+        ):
+            for observation in observations_chunk:
+                observation.modification_type = ModificationType.ONLY_MODIFIED
+                yield observation
+
     @classmethod
     def create(  # type: ignore
         cls,
@@ -1479,6 +1904,33 @@ class Observation(
             )
         return observation
 
+    @classmethod
+    def create_many(
+        cls,
+        observations: List["Observation"],
+        chunk_size: int = 100,
+        max_in_flight: int = 4,
+        retries: int = 0,
+    ) -> BulkCreateReport:
+        """Create many observations in ornitho, sending chunks in parallel
+        Observations are built without sending them, e.g. with create(..., create_in_ornitho=False). The IDs assigned
+        by Biolovision are set on the observations. A failing chunk does not abort the others, it is reported instead
+        and can be sent again with BulkCreateReport.retry.
+        :param observations: Observations to create
+        :param chunk_size: Number of observations sent with one request. Default: 100
+        :param max_in_flight: Maximum number of parallel requests. Default: 4
+        :param retries: Indicates how many retries should be performed per chunk
+        :type observations: List[Observation]
+        :type chunk_size: int
+        :type max_in_flight: int
+        :type retries: int
+        :return: Report of created and failed chunks
+        :rtype: BulkCreateReport
+        """
+        return BulkCreateReport(observations, chunk_size=chunk_size).send(
+            max_in_flight=max_in_flight, retries=retries
+        )
+
     def mark_as_exported(self, export_date: Optional[datetime] = None):
         if self.id_ is None:
             self.refresh()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
+from ornitho.identity_map import identity_map
 from ornitho.model.abstract import ListableModel, UpdateableModel
 from ornitho.model.abstract.base_model import BaseModel, check_refresh
 from ornitho.model.local_admin_unit import LocalAdminUnit
@@ -87,7 +89,10 @@ class Place(ListableModel, UpdateableModel):
     @property
     def local_admin_unit(self) -> LocalAdminUnit:
         if self._local_admin_unit is None:
-            self._local_admin_unit = LocalAdminUnit(id_=self.id_commune)
+            id_commune = self.id_commune
+            self._local_admin_unit = identity_map.get_or_create(
+                LocalAdminUnit, id_commune, lambda: LocalAdminUnit(id_=id_commune)
+            )
         return self._local_admin_unit
 
     @property
@@ -192,27 +197,24 @@ class Place(ListableModel, UpdateableModel):
         return obj
 
     @classmethod
-    def diff(
+    def diff_ids(
         cls,
         date: datetime,
         modification_type: ModificationType = None,
         only_protocol: Union[str, BaseModel] = None,
-        retrieve_places: bool = False,
         retries: int = 0,
-    ) -> Dict[ModificationType, Union[List["Place"], List[int]]]:
-        """Retrieves a list of places which changed in between now and a given date
+    ) -> Tuple[List[int], List[int]]:
+        """Retrieves the IDs of places which changed in between now and a given date
         :param date: Date in the past, to which changed places should be searched
         :param modification_type: Type of modification.
         :param only_protocol: Return only observation which are part of the given Protocol (Protocol Instance or Name)
-        :param retrieve_places: Indicates if the place objects should be retrieved. Default: False
         :param retries: Indicates how many retries should be performed
         :type date: datetime
         :type modification_type: ModificationType
         :type only_protocol: Union[str, "Protocol"]
-        :type retrieve_places: bool
         :type retries: int
-        :return: Dictionary containing List of Ids/Places as values and ModificationType as key
-        :rtype: Dict[ModificationType, Union[List["Place"], List[int]]]
+        :return: Tuple of the IDs of updated and deleted places
+        :rtype: Tuple[List[int], List[int]]
         """
         url = f"{cls.ENDPOINT}/diff"
         params = dict()
@@ -238,7 +240,6 @@ class Place(ListableModel, UpdateableModel):
         changed_places = cls.request(
             method="get", url=url, params=params, retries=retries
         )
-        updated_places = []
         updated_places_id = []
         deleted_places_id = []
         for place in changed_places:
@@ -246,10 +247,79 @@ class Place(ListableModel, UpdateableModel):
                 updated_places_id.append(int(place["id_place"]))
             else:
                 deleted_places_id.append(int(place["id_place"]))
+        return updated_places_id, deleted_places_id
+
+    @classmethod
+    def iter_retrieve(
+        cls, ids: List[int], max_workers: int = 10, retries: int = 0
+    ) -> Iterator[Tuple[int, Place]]:
+        """Retrieves places in parallel over the shared session and yields each one as soon as it is received
+        The places API offers no filter for a list of IDs, so each place is requested on its own. The first failing
+        request raises its exception, pending requests are cancelled.
+        :param ids: Unique identifiers
+        :param max_workers: Maximum number of parallel requests. Default: 10
+        :param retries: Indicates how many retries should be performed per place
+        :type ids: List[int]
+        :type max_workers: int
+        :type retries: int
+        :return: Iterator of tuples of requested ID and place
+        :rtype: Iterator[Tuple[int, Place]]
+        """
+        if not ids:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(cls.get, id_, retries=retries): id_ for id_ in ids
+            }
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    @classmethod
+    def diff(
+        cls,
+        date: datetime,
+        modification_type: ModificationType = None,
+        only_protocol: Union[str, BaseModel] = None,
+        retrieve_places: bool = False,
+        retries: int = 0,
+        max_workers: int = 10,
+    ) -> Dict[ModificationType, Union[List["Place"], List[int]]]:
+        """Retrieves a list of places which changed in between now and a given date
+        Updated places are retrieved in parallel, see iter_retrieve.
+        :param date: Date in the past, to which changed places should be searched
+        :param modification_type: Type of modification.
+        :param only_protocol: Return only observation which are part of the given Protocol (Protocol Instance or Name)
+        :param retrieve_places: Indicates if the place objects should be retrieved. Default: False
+        :param retries: Indicates how many retries should be performed
+        :param max_workers: Maximum number of parallel requests, if places are retrieved. Default: 10
+        :type date: datetime
+        :type modification_type: ModificationType
+        :type only_protocol: Union[str, "Protocol"]
+        :type retrieve_places: bool
+        :type retries: int
+        :type max_workers: int
+        :return: Dictionary containing List of Ids/Places as values and ModificationType as key
+        :rtype: Dict[ModificationType, Union[List["Place"], List[int]]]
+        """
+        updated_places_id, deleted_places_id = cls.diff_ids(
+            date,
+            modification_type=modification_type,
+            only_protocol=only_protocol,
+            retries=retries,
+        )
 
         if retrieve_places:
-            for place_id in updated_places_id:
-                updated_places.append(cls.get(place_id))
+            retrieved = dict(
+                cls.iter_retrieve(
+                    updated_places_id, max_workers=max_workers, retries=retries
+                )
+            )
+            # Keep the order of the diff
+            updated_places = [retrieved[place_id] for place_id in updated_places_id]
         else:
             updated_places = [cls(id_=place_id) for place_id in updated_places_id]
         return {
@@ -257,6 +327,45 @@ class Place(ListableModel, UpdateableModel):
             ModificationType.ONLY_DELETED: deleted_places_id,
         }
 
+    @classmethod
+    def iter_diff(
+        cls,
+        date: datetime,
+        modification_type: ModificationType = None,
+        only_protocol: Union[str, BaseModel] = None,
+        retries: int = 0,
+        max_workers: int = 10,
+    ) -> Iterator[Place]:
+        """Retrieves places which changed in between now and a given date and yields them as soon as they are
+        received. Deleted places are yielded first, without data. The modification_type of each place is set to
+        ModificationType.ONLY_MODIFIED or ModificationType.ONLY_DELETED.
+        :param date: Date in the past, to which changed places should be searched
+        :param modification_type: Type of modification.
+        :param only_protocol: Return only observation which are part of the given Protocol (Protocol Instance or Name)
+        :param retries: Indicates how many retries should be performed
+        :param max_workers: Maximum number of parallel requests. Default: 10
+        :type date: datetime
+        :type modification_type: ModificationType
+        :type only_protocol: Union[str, "Protocol"]
+        :type retries: int
+        :type max_workers: int
+        :return: Iterator of changed places
+        :rtype: Iterator[Place]
+        """
+        updated_places_id, deleted_places_id = cls.diff_ids(
+            date,
+            modification_type=modification_type,
+            only_protocol=only_protocol,
+            retries=retries,
+        )
+        for place_id in deleted_places_id:
+            yield cls(id_=place_id, modification_type=ModificationType.ONLY_DELETED)
+        for _, place in cls.iter_retrieve(
+            updated_places_id, max_workers=max_workers, retries=retries
+        ):
+            place.modification_type = ModificationType.ONLY_MODIFIED
+            yield place
+
     @property
     def observations(self) -> List[Observation]:
         """Get the list of observations for this site
@@ -2,6 +2,7 @@ from datetime import date, datetime
 from typing import Dict, List, Optional, Tuple, Union
 
 from ornitho.api_requester import APIRequester
+from ornitho.identity_map import identity_map
 from ornitho.model.abstract import ListableModel
 from ornitho.model.access import Access
 from ornitho.model.entity import Entity
@@ -162,7 +163,10 @@ class Protocol(ListableModel):
     def entity(self) -> Entity:
         """Entity of the protocol"""
         if self._entity is None:
-            self._entity = Entity.get(self.id_entity)
+            id_entity = self.id_entity
+            self._entity = identity_map.get_or_create(
+                Entity, id_entity, lambda: Entity.get(id_entity)
+            )
         return self._entity
 
     @property
@@ -228,6 +228,7 @@ class Site(BaseModel):
                     "id_site": self.id_,
                     "id_observer": observer if type(observer) is int else observer.id_,
                 },
+                idempotent=False,
             )
 
     @staticmethod
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from ornitho.identity_map import identity_map
 from ornitho.model.abstract import ListableModel
 from ornitho.model.abstract.base_model import check_refresh
 from ornitho.model.family import Family
@@ -96,13 +97,21 @@ class Species(ListableModel):
     @property
     def taxo_group(self) -> TaxonomicGroup:
         if self._taxo_group is None:
-            self._taxo_group = TaxonomicGroup.get(self.id_taxo_group)
+            id_taxo_group = self.id_taxo_group
+            self._taxo_group = identity_map.get_or_create(
+                TaxonomicGroup,
+                id_taxo_group,
+                lambda: TaxonomicGroup.get(id_taxo_group),
+            )
         return self._taxo_group
 
     @property
     def family(self) -> Family:
         if self._family is None:
-            self._family = Family.get(self.sempach_id_family)
+            sempach_id_family = self.sempach_id_family
+            self._family = identity_map.get_or_create(
+                Family, sempach_id_family, lambda: Family.get(sempach_id_family)
+            )
         return self._family
 
     # Following Properties appear only when requesting an Observation. Mapping to the species API is done here
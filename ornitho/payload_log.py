@@ -0,0 +1,190 @@
+import itertools
+import os
+import re
+import threading
+import time
+from typing import Any, Iterable, Iterator, Mapping, Optional, Union
+
+import ornitho
+
+# Number of items a list may have to be logged with its contents instead of its length
+MAX_LIST_ITEMS = 3
+# Depth up to which nested dicts are logged with their keys
+MAX_DEPTH = 3
+
+_counter = itertools.count(1)
+_counter_lock = threading.Lock()
+
+
+def summarize(value: Any, max_length: Optional[int] = None, depth: int = 0) -> str:
+    """Render a request body or parameters for the log, without their bulk
+    Lists with more than MAX_LIST_ITEMS items are replaced by their length, dicts nested deeper than MAX_DEPTH by
+    their number of keys and strings longer than max_length are truncated.
+    :param value: Value to render
+    :param max_length: Maximum length of strings. Default: ornitho.log_body_max_length
+    :param depth: Current nesting depth
+    :type value: Any
+    :type max_length: Optional[int]
+    :type depth: int
+    :return: Summary of the value
+    :rtype: str
+    """
+    if max_length is None:
+        max_length = ornitho.log_body_max_length
+    if isinstance(value, dict):
+        if depth >= MAX_DEPTH:
+            return f"{{{len(value)} keys}}"
+        items = ", ".join(
+            f"{key!r}: {summarize(item, max_length, depth + 1)}"
+            for key, item in value.items()
+        )
+        return f"{{{items}}}"
+    if isinstance(value, (list, tuple)):
+        if len(value) > MAX_LIST_ITEMS or depth >= MAX_DEPTH:
+            return f"[{len(value)} items]"
+        items = ", ".join(summarize(item, max_length, depth + 1) for item in value)
+        return f"[{items}]"
+    text = repr(value)
+    if len(text) > max_length:
+        return f"{text[:max_length]}...({len(text)} chars)"
+    return text
+
+
+class Summary(object):
+    """Summary of a value, which is rendered only if the log record is emitted"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        """Summary constructor
+        :param value: Value to summarize, e.g. a request body
+        :type value: Any
+        """
+        self.value = value
+
+    def __str__(self) -> str:
+        return summarize(self.value)
+
+    __repr__ = __str__
+
+
+def dump_payload(
+    method: str,
+    url: str,
+    kind: str,
+    payload: Union[str, bytes],
+    extension: str = "json",
+    directory: Optional[str] = None,
+) -> Optional[str]:
+    """Write a full payload to a new file, if a payload directory is configured
+    :param method: HTTP Method e.g. 'GET'
+    :param url: API URL, used in the file name
+    :param kind: Kind of the payload, e.g. 'request' or 'response'
+    :param payload: Serialized payload
+    :param extension: File extension. Default: json
+    :param directory: Target directory. Default: ornitho.log_payload_dir
+    :type method: str
+    :type url: str
+    :type kind: str
+    :type payload: Union[str, bytes]
+    :type extension: str
+    :type directory: Optional[str]
+    :return: Path of the written file or None, if no directory is configured
+    :rtype: Optional[str]
+    """
+    path = payload_path(method, url, kind, extension, directory)
+    if not path:
+        return None
+    with open(path, "wb") as payload_file:
+        payload_file.write(
+            payload.encode("utf-8") if isinstance(payload, str) else payload
+        )
+    ornitho.logger.debug("Dumped %s payload to %s", kind, path)
+    return path
+
+
+def tee_payload(
+    chunks: Iterable[bytes],
+    method: str,
+    url: str,
+    kind: str,
+    extension: str = "json",
+    directory: Optional[str] = None,
+) -> Iterator[bytes]:
+    """Pass the chunks of a streamed payload through and write each of them to a new file, if a payload directory is
+    configured. The file holds the payload received so far, if the iteration is stopped early.
+    :param chunks: Parts of the payload, e.g. Response.iter_content()
+    :param method: HTTP Method e.g. 'GET'
+    :param url: API URL, used in the file name
+    :param kind: Kind of the payload, e.g. 'response'
+    :param extension: File extension. Default: json
+    :param directory: Target directory. Default: ornitho.log_payload_dir
+    :type chunks: Iterable[bytes]
+    :type method: str
+    :type url: str
+    :type kind: str
+    :type extension: str
+    :type directory: Optional[str]
+    :return: Iterator of the unchanged chunks
+    :rtype: Iterator[bytes]
+    """
+    path = payload_path(method, url, kind, extension, directory)
+    if not path:
+        yield from chunks
+        return
+    with open(path, "wb") as payload_file:
+        for chunk in chunks:
+            payload_file.write(chunk)
+            yield chunk
+    ornitho.logger.debug("Dumped %s payload to %s", kind, path)
+
+
+def payload_path(
+    method: str,
+    url: str,
+    kind: str,
+    extension: str = "json",
+    directory: Optional[str] = None,
+) -> Optional[str]:
+    """Return the path of a new payload file and create its directory, if a payload directory is configured
+    :param method: HTTP Method e.g. 'GET'
+    :param url: API URL, used in the file name
+    :param kind: Kind of the payload, e.g. 'request' or 'response'
+    :param extension: File extension. Default: json
+    :param directory: Target directory. Default: ornitho.log_payload_dir
+    :type method: str
+    :type url: str
+    :type kind: str
+    :type extension: str
+    :type directory: Optional[str]
+    :return: Path of the new file or None, if no directory is configured
+    :rtype: Optional[str]
+    """
+    directory = directory or ornitho.log_payload_dir
+    if not directory:
+        return None
+    with _counter_lock:
+        number = next(_counter)
+    name = re.sub(r"[^A-Za-z0-9_]+", "_", url.split("?")[0]).strip("_")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(
+        directory,
+        f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{number:06d}-{method.lower()}-{name}-{kind}.{extension}",
+    )
+
+
+def response_extension(headers: Mapping[str, Any]) -> str:
+    """Return the file extension matching the content type of a response
+    :param headers: Response headers
+    :type headers: Mapping[str, Any]
+    :return: File extension
+    :rtype: str
+    """
+    content_type = headers.get("Content-Type", "")
+    if content_type.startswith("application/json"):
+        return "json"
+    if content_type == "application/pdf":
+        return "pdf"
+    if content_type.startswith("text/html"):
+        return "html"
+    return "bin"
@@ -0,0 +1,408 @@
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+import ornitho
+
+
+class RateLimiter(object):
+    """Thread-safe client-side rate limiter
+
+    Requests are throttled with a token bucket, which allows bursts of up to burst requests and refills with rate
+    tokens per second. Additionally, at most max_in_flight requests are sent at the same time. The state of this
+    limiter is kept in memory and shared by all threads of the process.
+    """
+
+    # Seconds between two checks for a free in-flight slot, used by the shared limiters
+    POLL_INTERVAL: float = 0.01
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        max_in_flight: Optional[int] = None,
+        lease_timeout: float = 300.0,
+    ) -> None:
+        """Rate limiter constructor
+        :param rate: Maximum number of requests per second, None for no limit
+        :param burst: Number of requests, which can be sent at once after an idle period. Default: 1
+        :param max_in_flight: Maximum number of concurrent requests, None for no limit
+        :param lease_timeout: Seconds after which a shared in-flight slot of a crashed worker is freed. Default: 300
+        :type rate: Optional[float]
+        :type burst: int
+        :type max_in_flight: Optional[int]
+        :type lease_timeout: float
+        """
+        self.rate: Optional[float] = rate
+        self.burst: int = burst
+        self.max_in_flight: Optional[int] = max_in_flight
+        self.lease_timeout: float = lease_timeout
+        self._lock = threading.Lock()
+        self._tokens: float = float(burst)
+        self._updated: Optional[float] = None
+        self._in_flight: Optional[threading.BoundedSemaphore] = (
+            threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        )
+
+    def __repr__(self) -> str:
+        """Unambiguous string representation"""
+        return (
+            f"{self.__class__.__name__}(rate={self.rate}, burst={self.burst}, "
+            f"max_in_flight={self.max_in_flight})"
+        )
+
+    def reserve(self) -> float:
+        """Take a token from the bucket, the request may be sent after the returned delay
+        :return: Seconds to wait before sending the request
+        :rtype: float
+        """
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, self._updated, delay = self.take_token(
+                self._tokens, self._updated, now, self.rate, self.burst
+            )
+        return delay
+
+    @staticmethod
+    def take_token(
+        tokens: float, updated: Optional[float], now: float, rate: float, burst: int
+    ) -> Tuple[float, float, float]:
+        """Refill the bucket and take one token. A negative number of tokens marks requests waiting for a token.
+        :param tokens: Current number of tokens
+        :param updated: Time of the last update, None if the bucket is new
+        :param now: Current time
+        :param rate: Tokens added per second
+        :param burst: Size of the bucket
+        :type tokens: float
+        :type updated: Optional[float]
+        :type now: float
+        :type rate: float
+        :type burst: int
+        :return: Tuple of new number of tokens, update time and seconds to wait
+        :rtype: Tuple[float, float, float]
+        """
+        if updated is not None:
+            tokens = min(float(burst), tokens + (now - updated) * rate)
+        tokens -= 1
+        return tokens, now, max(0.0, -tokens / rate)
+
+    def enter(self) -> Optional[str]:
+        """Wait for a free in-flight slot
+        :return: Lease of the slot, which has to be passed to leave(). None, if the slot is not shared
+        :rtype: Optional[str]
+        """
+        if self._in_flight is not None:
+            self._in_flight.acquire()
+        return None
+
+    def leave(self, lease: Optional[str] = None) -> None:
+        """Free the in-flight slot
+        :param lease: Lease returned by enter()
+        :type lease: Optional[str]
+        """
+        if self._in_flight is not None:
+            self._in_flight.release()
+
+    def acquire(self) -> Optional[str]:
+        """Wait until a request may be sent. Each call has to be followed by release()
+        :return: Lease of the in-flight slot, which has to be passed to release()
+        :rtype: Optional[str]
+        """
+        lease = self.enter()
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return lease
+
+    def release(self, lease: Optional[str] = None) -> None:
+        """Mark a request as finished
+        :param lease: Lease returned by acquire()
+        :type lease: Optional[str]
+        """
+        self.leave(lease)
+
+    @contextmanager
+    def limit(self) -> Iterator[None]:
+        """Context manager wrapping a request with acquire() and release()"""
+        lease = self.acquire()
+        try:
+            yield
+        finally:
+            self.release(lease)
+
+
+class SQLiteRateLimiter(RateLimiter):
+    """Rate limiter sharing its state through a local SQLite database, so it applies to all processes using the
+    same database file. Each in-flight request holds a lease row, which expires after lease_timeout seconds, so
+    slots of crashed workers are freed again."""
+
+    def __init__(
+        self,
+        path: str,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        max_in_flight: Optional[int] = None,
+        lease_timeout: float = 300.0,
+    ) -> None:
+        """SQLite rate limiter constructor
+        :param path: Path of the SQLite database
+        :param rate: Maximum number of requests per second, None for no limit
+        :param burst: Number of requests, which can be sent at once after an idle period. Default: 1
+        :param max_in_flight: Maximum number of concurrent requests, None for no limit
+        :param lease_timeout: Seconds after which the in-flight slot of a crashed worker is freed. Default: 300
+        :type path: str
+        :type rate: Optional[float]
+        :type burst: int
+        :type max_in_flight: Optional[int]
+        :type lease_timeout: float
+        """
+        super(SQLiteRateLimiter, self).__init__(rate, burst, None, lease_timeout)
+        self.max_in_flight = max_in_flight
+        self.path: str = path
+        with self.transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit "
+                "(id INTEGER PRIMARY KEY, tokens REAL, updated REAL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS in_flight (lease TEXT PRIMARY KEY, expires REAL)"
+            )
+            connection.execute(
+                "INSERT OR IGNORE INTO rate_limit (id, tokens, updated) VALUES (1, ?, NULL)",
+                (float(burst),),
+            )
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection with an exclusive write transaction, which is committed on exit"""
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    def reserve(self) -> float:
+        """Take a token from the shared bucket, see RateLimiter.reserve"""
+        if not self.rate:
+            return 0.0
+        with self.transaction() as connection:
+            tokens, updated = connection.execute(
+                "SELECT tokens, updated FROM rate_limit WHERE id = 1"
+            ).fetchone()
+            tokens, updated, delay = self.take_token(
+                tokens, updated, time.time(), self.rate, self.burst
+            )
+            connection.execute(
+                "UPDATE rate_limit SET tokens = ?, updated = ? WHERE id = 1",
+                (tokens, updated),
+            )
+        return delay
+
+    def enter(self) -> Optional[str]:
+        """Wait for a free in-flight slot, shared by all processes. Expired leases are not counted.
+        :return: Lease of the slot, which has to be passed to leave()
+        :rtype: Optional[str]
+        """
+        if not self.max_in_flight:
+            return None
+        lease = uuid.uuid4().hex
+        while True:
+            with self.transaction() as connection:
+                now = time.time()
+                connection.execute("DELETE FROM in_flight WHERE expires <= ?", (now,))
+                (in_flight,) = connection.execute(
+                    "SELECT COUNT(*) FROM in_flight"
+                ).fetchone()
+                if in_flight < self.max_in_flight:
+                    connection.execute(
+                        "INSERT INTO in_flight VALUES (?, ?)",
+                        (lease, now + self.lease_timeout),
+                    )
+                    return lease
+            time.sleep(self.POLL_INTERVAL)
+
+    def leave(self, lease: Optional[str] = None) -> None:
+        """Free the shared in-flight slot
+        :param lease: Lease returned by enter()
+        :type lease: Optional[str]
+        """
+        if not self.max_in_flight or lease is None:
+            return
+        with self.transaction() as connection:
+            connection.execute("DELETE FROM in_flight WHERE lease = ?", (lease,))
+
+
+class RedisRateLimiter(RateLimiter):
+    """Rate limiter sharing its state through Redis (ornitho.cache_redis_host, ornitho.cache_redis_port and
+    ornitho.cache_redis_db), so it applies to all processes and hosts using the same key. In-flight requests are
+    kept in a sorted set scored by the expiry of their lease, so slots of crashed workers are freed again.
+    """
+
+    # Refills the bucket and takes one token atomically, see RateLimiter.take_token
+    TAKE_TOKEN_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2])
+if updated then
+    tokens = math.min(burst, tokens + (now - updated) * rate)
+end
+tokens = tokens - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+if tokens >= 0 then
+    return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+    # Drops expired leases and adds a new one atomically, if there is a free in-flight slot
+    ENTER_SCRIPT = """
+local max_in_flight = tonumber(ARGV[1])
+local now = tonumber(ARGV[2])
+local lease_timeout = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) >= max_in_flight then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now + lease_timeout, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], math.ceil(lease_timeout * 1000))
+return 1
+"""
+
+    def __init__(
+        self,
+        key: str,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        max_in_flight: Optional[int] = None,
+        connection: Any = None,
+        lease_timeout: float = 300.0,
+    ) -> None:
+        """Redis rate limiter constructor
+        :param key: Redis key of the limiter state
+        :param rate: Maximum number of requests per second, None for no limit
+        :param burst: Number of requests, which can be sent at once after an idle period. Default: 1
+        :param max_in_flight: Maximum number of concurrent requests, None for no limit
+        :param connection: Optional Redis connection. Default: connection built from the cache_redis_* settings
+        :param lease_timeout: Seconds after which the in-flight slot of a crashed worker is freed. Default: 300
+        :type key: str
+        :type rate: Optional[float]
+        :type burst: int
+        :type max_in_flight: Optional[int]
+        :type connection: Any
+        :type lease_timeout: float
+        """
+        super(RedisRateLimiter, self).__init__(rate, burst, None, lease_timeout)
+        self.max_in_flight = max_in_flight
+        self.key: str = key
+        if connection is None:
+            import redis
+
+            connection = redis.StrictRedis(
+                host=ornitho.cache_redis_host,
+                port=ornitho.cache_redis_port,
+                db=ornitho.cache_redis_db,
+            )
+        self.connection = connection
+        self._take_token = connection.register_script(self.TAKE_TOKEN_SCRIPT)
+        self._enter = connection.register_script(self.ENTER_SCRIPT)
+
+    def reserve(self) -> float:
+        """Take a token from the shared bucket, see RateLimiter.reserve"""
+        if not self.rate:
+            return 0.0
+        delay = self._take_token(
+            keys=[self.key], args=[self.rate, self.burst, time.time()]
+        )
+        return float(delay)
+
+    def enter(self) -> Optional[str]:
+        """Wait for a free in-flight slot, shared by all processes. Expired leases are not counted.
+        :return: Lease of the slot, which has to be passed to leave()
+        :rtype: Optional[str]
+        """
+        if not self.max_in_flight:
+            return None
+        lease = uuid.uuid4().hex
+        while not int(
+            self._enter(
+                keys=[f"{self.key}:in_flight"],
+                args=[self.max_in_flight, time.time(), self.lease_timeout, lease],
+            )
+        ):
+            time.sleep(self.POLL_INTERVAL)
+        return lease
+
+    def leave(self, lease: Optional[str] = None) -> None:
+        """Free the shared in-flight slot
+        :param lease: Lease returned by enter()
+        :type lease: Optional[str]
+        """
+        if self.max_in_flight and lease is not None:
+            self.connection.zrem(f"{self.key}:in_flight", lease)
+
+
+_rate_limiters: Dict[Tuple[Hashable, ...], RateLimiter] = dict()
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Return the rate limiter for the current settings (ornitho.rate_limit, ornitho.rate_limit_burst,
+    ornitho.max_in_flight, ornitho.rate_limit_backend, ornitho.rate_limit_name and ornitho.rate_limit_lease_timeout),
+    creating it on first use
+    :return: Shared rate limiter or None, if neither a rate nor a maximum of concurrent requests is set
+    :rtype: Optional[RateLimiter]
+    :raise RuntimeError: Unknown rate limit backend
+    """
+    if not ornitho.rate_limit and not ornitho.max_in_flight:
+        return None
+    key = (
+        ornitho.rate_limit,
+        ornitho.rate_limit_burst,
+        ornitho.max_in_flight,
+        ornitho.rate_limit_backend,
+        ornitho.rate_limit_name,
+        ornitho.rate_limit_lease_timeout,
+    )
+    with _rate_limiters_lock:
+        rate_limiter = _rate_limiters.get(key)
+        if rate_limiter is None:
+            if ornitho.rate_limit_backend == "memory":
+                rate_limiter = RateLimiter(
+                    ornitho.rate_limit, ornitho.rate_limit_burst, ornitho.max_in_flight
+                )
+            elif ornitho.rate_limit_backend == "sqlite":
+                rate_limiter = SQLiteRateLimiter(
+                    f"{ornitho.rate_limit_name}.sqlite",
+                    ornitho.rate_limit,
+                    ornitho.rate_limit_burst,
+                    ornitho.max_in_flight,
+                    ornitho.rate_limit_lease_timeout,
+                )
+            elif ornitho.rate_limit_backend == "redis":
+                rate_limiter = RedisRateLimiter(
+                    ornitho.rate_limit_name,
+                    ornitho.rate_limit,
+                    ornitho.rate_limit_burst,
+                    ornitho.max_in_flight,
+                    lease_timeout=ornitho.rate_limit_lease_timeout,
+                )
+            else:
+                raise RuntimeError(
+                    f"Unknown rate limit backend '{ornitho.rate_limit_backend}'!"
+                )
+            _rate_limiters[key] = rate_limiter
+        return rate_limiter
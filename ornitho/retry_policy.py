@@ -0,0 +1,178 @@
+import random
+import threading
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from requests import Response
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    ConnectTimeout,
+)
+from urllib3.exceptions import NewConnectionError
+
+
+class RetryPolicy(object):
+    """Decides which failed requests are retried and how long to wait before the next attempt
+
+    Retries use an exponential backoff (backoff_base * 2 ** attempt, limited by backoff_cap), which is randomized
+    between zero and the computed delay if jitter is set. A Retry-After header sent by the server takes precedence,
+    limited by max_retry_after.
+    Requests, which are not idempotent (e.g. creating sightings), are only retried if the server did not process them:
+    on the statuses in non_idempotent_statuses and on errors while connecting, before anything was sent.
+    Subclasses can override is_retryable_status, is_retryable_exception or delay for other strategies.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 0,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = (429, 502, 503, 504),
+        retry_connection_errors: bool = True,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 300.0,
+        non_idempotent_statuses: Iterable[int] = (429, 503),
+    ) -> None:
+        """Retry policy constructor
+        :param max_retries: Number of retries, used if a call requests fewer retries. Default: 0
+        :param backoff_base: Delay in seconds before the first retry. Default: 0.5
+        :param backoff_cap: Maximum delay in seconds computed by the backoff. Default: 30
+        :param jitter: Indicates, if the delay should be randomized. Default: True
+        :param retry_statuses: HTTP status codes, which are retried. Default: 429, 502, 503, 504
+        :param retry_connection_errors: Indicates, if connection errors and timeouts should be retried. Default: True
+        :param respect_retry_after: Indicates, if a Retry-After header should be used as delay. Default: True
+        :param max_retry_after: Maximum delay in seconds taken from a Retry-After header. Default: 300
+        :param non_idempotent_statuses: HTTP status codes, which are retried for requests, which are not idempotent.
+            They have to be in retry_statuses as well. Default: 429, 503
+        :type max_retries: int
+        :type backoff_base: float
+        :type backoff_cap: float
+        :type jitter: bool
+        :type retry_statuses: Iterable[int]
+        :type retry_connection_errors: bool
+        :type respect_retry_after: bool
+        :type max_retry_after: float
+        :type non_idempotent_statuses: Iterable[int]
+        """
+        self.max_retries: int = max_retries
+        self.backoff_base: float = backoff_base
+        self.backoff_cap: float = backoff_cap
+        self.jitter: bool = jitter
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.retry_connection_errors: bool = retry_connection_errors
+        self.respect_retry_after: bool = respect_retry_after
+        self.max_retry_after: float = max_retry_after
+        self.non_idempotent_statuses: FrozenSet[int] = frozenset(
+            non_idempotent_statuses
+        )
+
+        self._lock = threading.Lock()
+        self.retry_count: int = 0
+        self.retries_by_reason: Dict[str, int] = dict()
+
+    def __repr__(self) -> str:
+        """Unambiguous string representation"""
+        return (
+            f"{self.__class__.__name__}(max_retries={self.max_retries}, backoff_base={self.backoff_base}, "
+            f"backoff_cap={self.backoff_cap}, jitter={self.jitter}, retry_statuses={sorted(self.retry_statuses)})"
+        )
+
+    def is_retryable_status(self, status_code: int, idempotent: bool = True) -> bool:
+        """Check if a response with the given HTTP status code should be retried
+        :param status_code: HTTP status code
+        :param idempotent: Indicates, if the request can be repeated without side effects. Default: True
+        :type status_code: int
+        :type idempotent: bool
+        :return: True, if the request should be retried
+        :rtype: bool
+        """
+        return status_code in self.retry_statuses and (
+            idempotent or status_code in self.non_idempotent_statuses
+        )
+
+    def is_retryable_exception(
+        self, exception: BaseException, idempotent: bool = True
+    ) -> bool:
+        """Check if a request failing with the given connection error or timeout should be retried
+        :param exception: Raised exception
+        :param idempotent: Indicates, if the request can be repeated without side effects. Default: True
+        :type exception: BaseException
+        :type idempotent: bool
+        :return: True, if the request should be retried
+        :rtype: bool
+        """
+        return self.retry_connection_errors and (
+            idempotent or self.is_unsent(exception)
+        )
+
+    @staticmethod
+    def is_unsent(exception: BaseException) -> bool:
+        """Check if a connection error or timeout was raised before the request was sent, e.g. a connect timeout
+        :param exception: Raised exception
+        :type exception: BaseException
+        :return: True, if the server cannot have received the request
+        :rtype: bool
+        """
+        if isinstance(exception, ConnectTimeout):
+            return True
+        if isinstance(exception, RequestsConnectionError) and exception.args:
+            return isinstance(
+                getattr(exception.args[0], "reason", None), NewConnectionError
+            )
+        try:
+            import aiohttp
+        except ImportError:
+            return False
+        return isinstance(exception, aiohttp.ClientConnectorError)
+
+    def delay(self, attempt: int, response: Optional[Response] = None) -> float:
+        """Compute the seconds to wait before the next attempt
+        :param attempt: Number of the failed attempt, starting with 0
+        :param response: Failed response, if one was received
+        :type attempt: int
+        :type response: Optional[Response]
+        :return: Seconds to wait
+        :rtype: float
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return min(self.max_retry_after, retry_after)
+        delay = min(self.backoff_cap, self.backoff_base * 2**attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def retry_after(response: Response) -> Optional[float]:
+        """Read the Retry-After header, given in seconds or as HTTP date
+        :param response: Failed response
+        :type response: Response
+        :return: Seconds to wait or None, if no valid header was sent
+        :rtype: Optional[float]
+        """
+        value = response.headers.get("Retry-After")
+        if not isinstance(value, str):
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            retry_date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_date - datetime.now(retry_date.tzinfo)).total_seconds())
+
+    def record(self, reason: str) -> None:
+        """Count a performed retry
+        :param reason: Reason of the retry, e.g. the HTTP status code or the exception name
+        :type reason: str
+        """
+        with self._lock:
+            self.retry_count += 1
+            self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + 1
+
+    def reset_metrics(self) -> None:
+        """Reset the retry counters"""
+        with self._lock:
+            self.retry_count = 0
+            self.retries_by_reason = dict()
@@ -0,0 +1,159 @@
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple, cast
+
+from requests.adapters import HTTPAdapter
+from requests_oauthlib import OAuth1Session
+
+import ornitho
+
+try:
+    import requests_cache
+
+    class CachedOAuthSession(
+        requests_cache.CacheMixin, OAuth1Session
+    ):  # pragma: no cover
+        """Session with features from both CachedSession and OAuth1Session"""
+
+except ImportError:  # pragma: no cover
+    requests_cache = cast(Any, None)
+
+
+class SessionRegistry(object):
+    """Thread-safe registry of OAuth1 sessions, shared by all API requesters
+
+    Sessions are keyed by credentials, API base and cache settings, so every requester with the same configuration
+    reuses the same connection pool and keeps its TCP/TLS connections alive between calls.
+    """
+
+    def __init__(self) -> None:
+        """Session registry constructor"""
+        self._sessions: Dict[Tuple[Hashable, ...], OAuth1Session] = dict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of open sessions"""
+        return len(self._sessions)
+
+    @staticmethod
+    def key(
+        consumer_key: Optional[str],
+        consumer_secret: Optional[str],
+        user_email: Optional[str],
+        api_base: Optional[str],
+    ) -> Tuple[Hashable, ...]:
+        """Build the registry key for the given credentials and the current cache settings
+        :param consumer_key: Consumer Key
+        :param consumer_secret: Consumer Secret
+        :param user_email: User Mail
+        :param api_base: API base url
+        :type consumer_key: Optional[str]
+        :type consumer_secret: Optional[str]
+        :type user_email: Optional[str]
+        :type api_base: Optional[str]
+        :return: Registry key
+        :rtype: Tuple[Hashable, ...]
+        """
+        return (
+            consumer_key,
+            consumer_secret,
+            user_email,
+            api_base,
+            ornitho.cache_enabled,
+            ornitho.cache_backend,
+            ornitho.cache_name,
+        )
+
+    def get(
+        self,
+        consumer_key: Optional[str],
+        consumer_secret: Optional[str],
+        user_email: Optional[str],
+        api_base: Optional[str],
+    ) -> OAuth1Session:
+        """Return the shared session for the given credentials, creating it on first use
+        :param consumer_key: Consumer Key
+        :param consumer_secret: Consumer Secret
+        :param user_email: User Mail
+        :param api_base: API base url
+        :type consumer_key: Optional[str]
+        :type consumer_secret: Optional[str]
+        :type user_email: Optional[str]
+        :type api_base: Optional[str]
+        :return: Shared session
+        :rtype: OAuth1Session
+        """
+        key = self.key(consumer_key, consumer_secret, user_email, api_base)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self.create_session(consumer_key, consumer_secret)
+                self._sessions[key] = session
+            return session
+
+    def close(self) -> None:
+        """Close all registered sessions and empty the registry"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    @staticmethod
+    def create_session(
+        consumer_key: Optional[str], consumer_secret: Optional[str]
+    ) -> OAuth1Session:
+        """Create a new OAuth1 session, cached if caching is enabled, with a pooled HTTP adapter
+        :param consumer_key: Consumer Key
+        :param consumer_secret: Consumer Secret
+        :type consumer_key: Optional[str]
+        :type consumer_secret: Optional[str]
+        :return: New session
+        :rtype: OAuth1Session
+        """
+        if ornitho.cache_enabled and requests_cache:  # pragma: no cover
+            if ornitho.cache_backend == "redis":
+                import redis
+
+                r = redis.StrictRedis(
+                    host=ornitho.cache_redis_host,
+                    port=ornitho.cache_redis_port,
+                    db=ornitho.cache_redis_db,
+                )
+                session: OAuth1Session = CachedOAuthSession(
+                    client_key=consumer_key,
+                    client_secret=consumer_secret,
+                    cache_name=ornitho.cache_name,
+                    backend=ornitho.cache_backend,
+                    expire_after=ornitho.cache_expire_after,
+                    filter_fn=ornitho.cache_filter_fn,
+                    connection=r,
+                )
+            else:
+                session = CachedOAuthSession(
+                    client_key=consumer_key,
+                    client_secret=consumer_secret,
+                    cache_name=ornitho.cache_name,
+                    backend=ornitho.cache_backend,
+                    expire_after=ornitho.cache_expire_after,
+                    filter_fn=ornitho.cache_filter_fn,
+                )
+        else:
+            if ornitho.cache_enabled:  # pragma: no cover
+                ornitho.logger.warning(
+                    "Cache was enabled but caching dependency is not install. Please install 'requests_cache'"
+                )
+            session = OAuth1Session(
+                client_key=consumer_key, client_secret=consumer_secret
+            )
+
+        adapter = HTTPAdapter(
+            pool_connections=ornitho.pool_connections,
+            pool_maxsize=ornitho.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+
+# Registry used by all API requesters, closed by ornitho.shutdown()
+session_registry = SessionRegistry()
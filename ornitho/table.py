@@ -0,0 +1,267 @@
+import array
+import math
+from typing import Any, Callable, Dict, List, Sequence, Type, Union, cast
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = cast(Any, None)
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = cast(Any, None)
+
+# Value of missing integers in id columns (nullable=False), which are never negative
+MISSING_INT = -1
+# Placeholder of nulls in the buffers of nullable integer columns, the integer value of NumPy's NaT
+NULL_INT = -(2**63)
+
+
+class Column(object):
+    """Typed column, which reads its values directly from the raw data"""
+
+    def __init__(
+        self,
+        typecode: str,
+        extract: Callable[[Dict[str, Any]], Any],
+        timestamp: bool = False,
+        nullable: bool = True,
+    ) -> None:
+        """Column constructor
+        :param typecode: 'q' for integers, 'd' for floats or 'O' for any other object
+        :param extract: Function reading the value from raw data
+        :param timestamp: Indicates, if the integers are unix timestamps in seconds. Default: False
+        :param nullable: Indicates, if missing integers are nulls. Else they are stored as MISSING_INT, which is
+            meant for id columns only. Default: True
+        :type typecode: str
+        :type extract: Callable[[Dict[str, Any]], Any]
+        :type timestamp: bool
+        :type nullable: bool
+        """
+        self.typecode: str = typecode
+        self.extract: Callable[[Dict[str, Any]], Any] = extract
+        self.timestamp: bool = timestamp
+        self.nullable: bool = nullable
+
+    @property
+    def nullable_int(self) -> bool:
+        """Indicates, if this is an integer column, whose missing values are nulls"""
+        return self.typecode == "q" and self.nullable
+
+    @property
+    def missing(self) -> Any:
+        """Value, which is stored if the raw data does not contain this column"""
+        if self.typecode == "q":
+            return NULL_INT if self.nullable else MISSING_INT
+        elif self.typecode == "d":
+            return math.nan
+        return None
+
+    @property
+    def convert(self) -> Callable[[Any], Any]:
+        """Function converting raw values (mostly strings) into the column's type"""
+        if self.typecode == "q":
+            return int
+        elif self.typecode == "d":
+            return float
+        return lambda value: value
+
+    def buffer(self) -> Union[array.array, List[Any]]:
+        """Create an empty buffer for the values of this column"""
+        return array.array(self.typecode) if self.typecode in ("q", "d") else []
+
+
+class TableBuilder(object):
+    """Collects raw data page by page into column buffers and builds a table
+
+    Depending on the backend, the table is a pyarrow.Table ('pyarrow', one record batch per page), a dictionary of
+    NumPy arrays ('numpy') or a dictionary of array.array/list columns ('array'). Missing values of nullable integer
+    columns are nulls (pyarrow), NaT/masked (numpy) or None (array), missing ids are stored as MISSING_INT and
+    missing floats as NaN. Columns without a raw column definition are read via the model's property.
+    """
+
+    def __init__(
+        self,
+        model: Type[Any],
+        columns: Sequence[str],
+        raw_columns: Dict[str, Column],
+        backend: str = "auto",
+    ) -> None:
+        """Table builder constructor
+        :param model: Model class, used for columns without raw column definition
+        :param columns: Names of the columns
+        :param raw_columns: Raw column definitions, keyed by column name
+        :param backend: 'auto' (pyarrow, numpy or array, whichever is installed), 'pyarrow', 'numpy' or 'array'
+        :type model: Type[Any]
+        :type columns: Sequence[str]
+        :type raw_columns: Dict[str, Column]
+        :type backend: str
+        :raise RuntimeError: Selected backend is unknown or not installed
+        :raise ValueError: Model has no property with a column's name
+        """
+        if backend == "auto":
+            backend = (
+                "pyarrow"
+                if pyarrow is not None
+                else "numpy" if numpy is not None else "array"
+            )
+        if (
+            backend not in ("pyarrow", "numpy", "array")
+            or (backend == "pyarrow" and pyarrow is None)
+            or (backend == "numpy" and numpy is None)
+        ):
+            raise RuntimeError(
+                f"Table backend '{backend}' is unknown or not installed!"
+            )
+        self.backend: str = backend
+        self.model: Type[Any] = model
+        self.columns: Dict[str, Column] = dict()
+        for name in columns:
+            if name in raw_columns:
+                self.columns[name] = raw_columns[name]
+            elif isinstance(getattr(model, name, None), property):
+                self.columns[name] = Column("O", self._property_extractor(name))
+            else:
+                raise ValueError(f"{model.__name__} has no column '{name}'")
+        self._buffers: Dict[str, Union[array.array, List[Any]]] = {
+            name: column.buffer() for name, column in self.columns.items()
+        }
+        # Rows of the current buffers, which are null
+        self._nulls: Dict[str, List[int]] = {name: [] for name in self.columns}
+        self._batches: List[Any] = []
+        self.count: int = 0
+
+    def _property_extractor(self, name: str) -> Callable[[Dict[str, Any]], Any]:
+        """Create a function reading a property of the model, without requesting missing fields"""
+
+        def extract(data: Dict[str, Any]) -> Any:
+            instance = self.model.create_from_ornitho_json(data)
+            instance._refreshed = True
+            return getattr(instance, name)
+
+        return extract
+
+    def append_page(self, page: List[Dict[str, Any]]) -> None:
+        """Append the raw data objects of a page to the columns
+        :param page: Raw data objects
+        :type page: List[Dict[str, Any]]
+        """
+        for name, column in self.columns.items():
+            buffer = self._buffers[name]
+            nulls = self._nulls[name]
+            extract = column.extract
+            missing = column.missing
+            convert = column.convert
+            nullable = column.nullable_int
+            for data in page:
+                try:
+                    # None raises a TypeError for integer and float columns
+                    value = convert(extract(data))
+                except (KeyError, IndexError, TypeError, ValueError):
+                    value = missing
+                    if nullable:
+                        nulls.append(len(buffer))
+                buffer.append(value)
+        self.count += len(page)
+        if self.backend == "pyarrow" and len(page) > 0:
+            self._batches.append(self._record_batch())
+
+    def _record_batch(self) -> Any:
+        """Convert the current buffers into a record batch and start new buffers"""
+        arrays = []
+        for name, column in self.columns.items():
+            buffer = self._buffers[name]
+            if isinstance(buffer, array.array):
+                arrow_type = (
+                    pyarrow.timestamp("s", tz="UTC")
+                    if column.timestamp
+                    else (
+                        pyarrow.int64() if column.typecode == "q" else pyarrow.float64()
+                    )
+                )
+                arrays.append(
+                    pyarrow.Array.from_buffers(
+                        arrow_type,
+                        len(buffer),
+                        [
+                            self._validity(len(buffer), self._nulls[name]),
+                            pyarrow.py_buffer(buffer),
+                        ],
+                    )
+                )
+            else:
+                arrays.append(pyarrow.array(buffer))
+            self._buffers[name] = column.buffer()
+            self._nulls[name] = []
+        return pyarrow.RecordBatch.from_arrays(arrays, names=list(self.columns))
+
+    @staticmethod
+    def _validity(length: int, nulls: List[int]) -> Any:
+        """Create the arrow validity bitmap of a column
+        :param length: Number of rows
+        :param nulls: Rows, which are null
+        :type length: int
+        :type nulls: List[int]
+        :return: pyarrow.Buffer or None, if no row is null
+        :rtype: Any
+        """
+        if not nulls:
+            return None
+        bitmap = bytearray(b"\xff" * ((length + 7) // 8))
+        for row in nulls:
+            bitmap[row >> 3] &= ~(1 << (row & 7)) & 0xFF
+        return pyarrow.py_buffer(bitmap)
+
+    def build(self) -> Any:
+        """Build the table of all appended pages
+        :return: pyarrow.Table, dictionary of NumPy arrays or dictionary of array.array/list columns
+        :rtype: Any
+        """
+        if self.backend == "pyarrow":
+            if not self._batches:
+                self._batches.append(self._record_batch())
+            return pyarrow.Table.from_batches(self._batches)
+        if self.backend == "numpy":
+            table: Dict[str, Any] = dict()
+            for name, column in self.columns.items():
+                buffer = self._buffers[name]
+                if isinstance(buffer, array.array):
+                    values = numpy.frombuffer(
+                        buffer, dtype="int64" if column.typecode == "q" else "float64"
+                    )
+                    if column.timestamp:
+                        # NULL_INT is read as NaT
+                        values = values.astype("datetime64[s]")
+                    elif column.nullable_int:
+                        mask = numpy.zeros(len(values), dtype=bool)
+                        mask[self._nulls[name]] = True
+                        values = numpy.ma.masked_array(values, mask=mask)
+                    table[name] = values
+                else:
+                    table[name] = numpy.array(buffer, dtype=object)
+            return table
+        table = dict(self._buffers)
+        for name, column in self.columns.items():
+            if column.nullable_int:
+                with_nulls = list(table[name])
+                for row in self._nulls[name]:
+                    with_nulls[row] = None
+                table[name] = with_nulls
+        return table
+
+
+def raw_value(*path: Union[str, int]) -> Callable[[Dict[str, Any]], Any]:
+    """Create a function reading a nested value from raw data, e.g. raw_value('observers', 0, 'count')
+    :param path: Keys and indices leading to the value
+    :type path: Union[str, int]
+    :return: Function reading the value
+    :rtype: Callable[[Dict[str, Any]], Any]
+    """
+
+    def extract(data: Any) -> Any:
+        for key in path:
+            data = data[key]
+        return data
+
+    return extract
@@ -0,0 +1,14 @@
+# flake8: noqa
+"""
+Offline stand-in for the Biolovision API, to test and benchmark the client end to end without network access
+"""
+
+from ornitho.testing.server import MockBiolovisionServer, RecordedRequest
+from ornitho.testing.synthetic import (
+    synthetic_fields,
+    synthetic_form,
+    synthetic_places,
+    synthetic_sighting,
+    synthetic_sightings,
+    synthetic_species,
+)
@@ -0,0 +1,694 @@
+import copy
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+import ornitho
+from ornitho.json_decoder import BANNERS
+
+# Endpoints, whose diff is served from the recorded modifications, and the key of their IDs
+DIFF_ENDPOINTS = {"observations": "id_sighting", "places": "id_place"}
+
+
+class RecordedRequest(NamedTuple):
+    """Request received by the mock server"""
+
+    method: str
+    path: str
+    params: Dict[str, str]
+    body: Any
+
+
+class Page(NamedTuple):
+    """Page of a paginated response, sent with chunked transfer encoding"""
+
+    payload: Any
+    pagination_key: Optional[str]
+
+
+class Body(NamedTuple):
+    """Response body, which is sent as it is"""
+
+    content: bytes
+    content_type: str
+
+
+class Failure(object):
+    """Injected failure, answered instead of the next matching requests"""
+
+    def __init__(
+        self, status: int, count: int, path: Optional[str], processed: bool = False
+    ) -> None:
+        self.status: int = status
+        self.count: int = count
+        self.path: Optional[str] = path
+        self.processed: bool = processed
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Forwards every request to the mock server"""
+
+    protocol_version = "HTTP/1.1"
+    server: "_HTTPServer"
+
+    def do_GET(self) -> None:
+        self.server.mock.handle(self)
+
+    def do_POST(self) -> None:
+        self.server.mock.handle(self)
+
+    def do_PUT(self) -> None:
+        self.server.mock.handle(self)
+
+    def do_DELETE(self) -> None:
+        self.server.mock.handle(self)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        ornitho.logger.debug(f"Mock server: {format % args}")
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], mock: "MockBiolovisionServer"):
+        super(_HTTPServer, self).__init__(address, _Handler)
+        self.mock: "MockBiolovisionServer" = mock
+
+
+class MockBiolovisionServer(object):
+    """Local HTTP stand-in for the Biolovision API, serving recorded or synthetic data
+
+    The server runs in a background thread and is used via its api_base, e.g. by passing it to APIRequester or by
+    calling configure(). It serves observations (search, get, create, update, delete, diff), forms (search by
+    id_form, create, delete), place diffs and any list endpoint, e.g. places, species and fields. Lists are split into
+    pages of page_size objects, which are sent with chunked transfer encoding and a pagination_key header, like the
+    real API. Latency and failures can be injected, every received request is recorded in requests.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        page_size: int = 1000,
+        chunk_size: int = 65536,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        retry_after: int = 0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Mock server constructor
+        :param host: Host to bind to. Default: '127.0.0.1'
+        :param port: Port to bind to, 0 selects a free port. Default: 0
+        :param page_size: Maximum number of objects per page. Default: 1000
+        :param chunk_size: Size of the chunks of a chunked response in bytes. Default: 65536
+        :param latency: Delay in seconds before each request is answered. Default: 0
+        :param error_rate: Probability, that a request is answered with error_status. Default: 0
+        :param error_status: HTTP status code of random failures. Default: 503
+        :param retry_after: Value of the Retry-After header sent with status 429. Default: 0
+        :param seed: Seed of the random failures
+        :type host: str
+        :type port: int
+        :type page_size: int
+        :type chunk_size: int
+        :type latency: float
+        :type error_rate: float
+        :type error_status: int
+        :type retry_after: int
+        :type seed: Optional[int]
+        """
+        self.host: str = host
+        self.port: int = port
+        self.page_size: int = page_size
+        self.chunk_size: int = chunk_size
+        self.latency: float = latency
+        self.error_rate: float = error_rate
+        self.error_status: int = error_status
+        self.retry_after: int = retry_after
+        self.requests: List[RecordedRequest] = []
+
+        self.sightings: Dict[int, Dict[str, Any]] = dict()
+        self.forms: Dict[int, Dict[str, Any]] = dict()
+        self.resources: Dict[str, List[Dict[str, Any]]] = dict()
+        self.modifications: Dict[str, List[Tuple[datetime, int, str]]] = {
+            endpoint: [] for endpoint in DIFF_ENDPOINTS
+        }
+
+        self._lock = threading.RLock()
+        self._random = random.Random(seed)
+        self._failures: List[Failure] = []
+        self._cursors: Dict[str, Tuple[List[Any], int, str]] = dict()
+        self._next_id: int = 1
+        self._httpd: Optional[_HTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "MockBiolovisionServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def api_base(self) -> str:
+        """API base of the running server, e.g. 'http://127.0.0.1:8080/api/'"""
+        return f"http://{self.host}:{self.port}/api/"
+
+    def start(self) -> "MockBiolovisionServer":
+        """Start serving in a background thread
+        :return: This server
+        :rtype: MockBiolovisionServer
+        """
+        self._httpd = _HTTPServer((self.host, self.port), self)
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="MockBiolovisionServer", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def configure(self) -> None:
+        """Point the ornitho module configuration to this server, using dummy credentials"""
+        ornitho.consumer_key = "mock_consumer_key"
+        ornitho.consumer_secret = "mock_consumer_secret"
+        ornitho.user_email = "mock@example.org"
+        ornitho.user_pw = "mock_password"
+        ornitho.api_base = self.api_base
+
+    # Data
+
+    def add_sightings(self, sightings: Iterable[Dict[str, Any]]) -> None:
+        """Add raw sightings, e.g. recorded search results or synthetic sightings
+        Sightings with an id_form are served as part of their form. The form header is taken from the attached
+        'form' of flattened sightings, if the form is not known yet.
+        :param sightings: Raw sightings
+        :type sightings: Iterable[Dict[str, Any]]
+        """
+        with self._lock:
+            for sighting in sightings:
+                observer = sighting["observers"][0]
+                id_sighting = int(observer["id_sighting"])
+                if "id_form" in observer:
+                    sighting = dict(sighting)
+                    header = sighting.pop("form", None)
+                    id_form = int(observer["id_form"])
+                    if id_form not in self.forms:
+                        self.forms[id_form] = dict(header or {"@id": str(id_form)})
+                self.sightings[id_sighting] = sighting
+                self._next_id = max(self._next_id, id_sighting + 1)
+
+    def add_forms(self, forms: Iterable[Dict[str, Any]]) -> None:
+        """Add raw forms including their sightings, e.g. recorded form search results or synthetic forms
+        :param forms: Raw forms
+        :type forms: Iterable[Dict[str, Any]]
+        """
+        with self._lock:
+            for form in forms:
+                id_form = int(form["@id"])
+                self.forms[id_form] = {
+                    key: value for key, value in form.items() if key != "sightings"
+                }
+                self.add_sightings(
+                    dict(
+                        sighting,
+                        observers=[dict(sighting["observers"][0], id_form=str(id_form))]
+                        + sighting["observers"][1:],
+                    )
+                    for sighting in form.get("sightings", [])
+                )
+                self._next_id = max(self._next_id, id_form + 1)
+
+    def add_resource(self, endpoint: str, objects: Iterable[Dict[str, Any]]) -> None:
+        """Add raw objects served by a list endpoint, e.g. 'places', 'species', 'fields' or 'fields/1'
+        Each object is also served by '<endpoint>/<id>'.
+        :param endpoint: Endpoint, without API base
+        :param objects: Raw objects
+        :type endpoint: str
+        :type objects: Iterable[Dict[str, Any]]
+        """
+        with self._lock:
+            self.resources.setdefault(endpoint, []).extend(objects)
+
+    def modify(
+        self,
+        endpoint: str,
+        id_: int,
+        modification_type: str = "updated",
+        at: Optional[datetime] = None,
+    ) -> None:
+        """Record a modification, which is returned by the diff of the endpoint
+        Modifications made via the API are recorded automatically.
+        :param endpoint: 'observations' or 'places'
+        :param id_: ID of the modified object
+        :param modification_type: 'updated' or 'deleted'. Default: 'updated'
+        :param at: Time of the modification. Default: now
+        :type endpoint: str
+        :type id_: int
+        :type modification_type: str
+        :type at: Optional[datetime]
+        """
+        with self._lock:
+            self.modifications[endpoint].append(
+                (at or datetime.now(), int(id_), modification_type)
+            )
+
+    def load_fixture(self, path: str) -> None:
+        """Load recorded data from a JSON file, written by save_fixture
+        The file contains the keys 'sightings', 'forms', 'resources' and 'modifications', which are all optional.
+        :param path: Path of the fixture
+        :type path: str
+        """
+        with open(path, encoding="utf-8") as fixture_file:
+            fixture = json.load(fixture_file)
+        self.add_sightings(fixture.get("sightings", []))
+        self.add_forms(fixture.get("forms", []))
+        for endpoint, objects in fixture.get("resources", {}).items():
+            self.add_resource(endpoint, objects)
+        for endpoint, modifications in fixture.get("modifications", {}).items():
+            for at, id_, modification_type in modifications:
+                self.modify(
+                    endpoint, id_, modification_type, datetime.fromisoformat(at)
+                )
+
+    def save_fixture(self, path: str) -> None:
+        """Write all data of the server to a JSON file, which can be loaded with load_fixture
+        :param path: Path of the fixture
+        :type path: str
+        """
+        with self._lock:
+            fixture = {
+                "sightings": [
+                    sighting
+                    for sighting in self.sightings.values()
+                    if "id_form" not in sighting["observers"][0]
+                ],
+                "forms": [
+                    dict(form, sightings=self._form_sightings(id_form))
+                    for id_form, form in self.forms.items()
+                ],
+                "resources": self.resources,
+                "modifications": {
+                    endpoint: [
+                        (at.isoformat(), id_, modification_type)
+                        for at, id_, modification_type in modifications
+                    ]
+                    for endpoint, modifications in self.modifications.items()
+                },
+            }
+            with open(path, "w", encoding="utf-8") as fixture_file:
+                json.dump(fixture, fixture_file)
+
+    # Failures
+
+    def fail_next(
+        self,
+        status: int = 503,
+        count: int = 1,
+        path: Optional[str] = None,
+        processed: bool = False,
+    ) -> None:
+        """Answer the next requests with an error
+        :param status: HTTP status code, 0 closes the connection without response. Default: 503
+        :param count: Number of failing requests. Default: 1
+        :param path: Only requests to this endpoint fail, e.g. 'observations/search'. Default: all endpoints
+        :param processed: Indicates, if the requests are processed before the error is sent, e.g. to simulate a
+            timeout after sightings were stored. Default: False
+        :type status: int
+        :type count: int
+        :type path: Optional[str]
+        :type processed: bool
+        """
+        with self._lock:
+            self._failures.append(Failure(status, count, path, processed))
+
+    def _next_failure(self, path: str) -> Optional[Failure]:
+        """Return the injected failure for the request, if any"""
+        with self._lock:
+            for failure in self._failures:
+                if failure.path is None or failure.path == path:
+                    failure.count -= 1
+                    if failure.count <= 0:
+                        self._failures.remove(failure)
+                    return failure
+            if self.error_rate and self._random.random() < self.error_rate:
+                return Failure(self.error_status, 1, None)
+        return None
+
+    # Request handling
+
+    def handle(self, handler: BaseHTTPRequestHandler) -> None:
+        """Answer a request received by the HTTP server
+        :param handler: Request handler
+        :type handler: BaseHTTPRequestHandler
+        """
+        url = urlsplit(handler.path)
+        path = (
+            url.path[len("/api/") :].strip("/") if url.path.startswith("/api/") else ""
+        )
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(handler.headers.get("Content-Length") or 0)
+        raw_body = handler.rfile.read(length) if length else b""
+        body = json.loads(raw_body) if raw_body.strip() else None
+        method = handler.command.lower()
+        with self._lock:
+            self.requests.append(RecordedRequest(method, path, params, body))
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        failure = self._next_failure(path)
+        if failure is not None:
+            if failure.processed:
+                # The error is sent in any case, the outcome of processing only changes the stored data
+                try:
+                    self._route(method, path, params, body)
+                except Exception:
+                    pass
+            if failure.status == 0:
+                handler.close_connection = True
+            else:
+                self._send_error(handler, failure.status)
+            return
+
+        try:
+            response = self._route(method, path, params, body)
+        except KeyError:
+            self._send_error(handler, 404)
+            return
+        except (TypeError, ValueError):
+            self._send_error(handler, 400)
+            return
+        except Exception:
+            ornitho.logger.exception(f"Mock server failed to answer {method} {path}")
+            self._send_error(handler, 500)
+            return
+        if isinstance(response, Page):
+            self._send_chunked(handler, response.payload, response.pagination_key)
+        elif isinstance(response, Body):
+            self._send(handler, response.content, response.content_type)
+        else:
+            self._send(
+                handler,
+                json.dumps(response).encode("utf-8"),
+                "application/json; charset=utf-8",
+            )
+
+    @staticmethod
+    def _send(
+        handler: BaseHTTPRequestHandler, content: bytes, content_type: str
+    ) -> None:
+        handler.send_response(200)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(content)))
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def _send_chunked(
+        self,
+        handler: BaseHTTPRequestHandler,
+        payload: Any,
+        pagination_key: Optional[str],
+    ) -> None:
+        content = json.dumps(payload).encode("utf-8")
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json; charset=utf-8")
+        handler.send_header("Transfer-Encoding", "chunked")
+        if pagination_key:
+            handler.send_header("pagination_key", pagination_key)
+        handler.end_headers()
+        for i in range(0, len(content), self.chunk_size):
+            chunk = content[i : i + self.chunk_size]
+            handler.wfile.write(f"{len(chunk):x}\r\n".encode("ascii") + chunk + b"\r\n")
+        handler.wfile.write(b"0\r\n\r\n")
+
+    def _send_error(self, handler: BaseHTTPRequestHandler, status: int) -> None:
+        content = f"Mock server error {status}".encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "text/html; charset=UTF-8")
+        handler.send_header("Content-Length", str(len(content)))
+        if status == 429:
+            handler.send_header("Retry-After", str(self.retry_after))
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def _route(
+        self, method: str, path: str, params: Dict[str, str], body: Any
+    ) -> Union[Page, Body, Dict[str, Any], List[Dict[str, str]]]:
+        """Compute the response of a request, dictionaries and lists are sent as JSON
+        :raise KeyError: Requested object or endpoint does not exist
+        """
+        if "pagination_key" in params:
+            return self._next_page(params["pagination_key"])
+
+        parts = path.split("/")
+        if path == "observations/search" and method == "post":
+            body = body or dict()
+            if "id_form" in body:
+                return self._form_response(int(body["id_form"]))
+            return self._paginate(self._search(body), "sightings")
+        if path == "observations" and method == "post":
+            return self._create(body)
+        if path == "observations" and method == "get":
+            return self._paginate(list(self.sightings), "sightings")
+        if path.startswith("observations/delete_list/") and method == "post":
+            return self._delete_form(int(parts[2]))
+        if len(parts) == 2 and parts[1] == "diff" and parts[0] in DIFF_ENDPOINTS:
+            return self._diff(parts[0], params)
+        if len(parts) == 2 and parts[0] == "observations" and parts[1].isdigit():
+            return self._observation(method, int(parts[1]), body)
+        if method == "get":
+            if path in self.resources:
+                return self._paginate(list(self.resources[path]), "resource")
+            endpoint, _, id_ = path.rpartition("/")
+            for resource in self.resources.get(endpoint, []):
+                if str(resource.get("id", resource.get("@id"))) == id_:
+                    return {"data": [resource]}
+        raise KeyError(path)
+
+    def _paginate(self, objects: List[Any], kind: str) -> Page:
+        """Start a cursor over the objects and return its first page"""
+        pagination_key = uuid.uuid4().hex
+        with self._lock:
+            self._cursors[pagination_key] = (objects, 0, kind)
+        return self._next_page(pagination_key)
+
+    def _next_page(self, pagination_key: str) -> Page:
+        """Return the next page of a cursor. Every non-empty page has a pagination key, an exhausted cursor returns
+        an empty page without pagination key, like the real API."""
+        with self._lock:
+            if pagination_key not in self._cursors:
+                return Page({"data": []}, None)
+            objects, offset, kind = self._cursors.pop(pagination_key)
+            page = objects[offset : offset + self.page_size]
+            if not page:
+                return Page({"data": []}, None)
+            next_key = uuid.uuid4().hex
+            self._cursors[next_key] = (objects, offset + len(page), kind)
+            if kind == "sightings":
+                return Page(self._sightings_payload(page), next_key)
+            return Page({"data": page}, next_key)
+
+    def _form_sightings(self, id_form: int) -> List[Dict[str, Any]]:
+        return [
+            sighting
+            for sighting in self.sightings.values()
+            if sighting["observers"][0].get("id_form") == str(id_form)
+        ]
+
+    def _sightings_payload(self, ids: List[int]) -> Dict[str, Any]:
+        """Build a search response, sightings of forms are grouped into their forms"""
+        sightings = []
+        forms: Dict[int, Dict[str, Any]] = dict()
+        for id_ in ids:
+            sighting = self.sightings.get(id_)
+            if sighting is None:
+                continue
+            id_form = sighting["observers"][0].get("id_form")
+            if id_form is None:
+                sightings.append(sighting)
+            else:
+                if int(id_form) not in forms:
+                    forms[int(id_form)] = dict(self.forms[int(id_form)], sightings=[])
+                forms[int(id_form)]["sightings"].append(sighting)
+        data: Dict[str, Any] = dict()
+        if sightings:
+            data["sightings"] = sightings
+        if forms:
+            data["forms"] = list(forms.values())
+        return {"data": data}
+
+    def _form_response(self, id_form: int) -> Dict[str, Any]:
+        with self._lock:
+            form = self.forms[id_form]
+            return {
+                "data": {"forms": [dict(form, sightings=self._form_sightings(id_form))]}
+            }
+
+    def _search(self, body: Dict[str, Any]) -> List[int]:
+        """Return the IDs of all sightings matching the search values id_sightings_list, id_species, id_place,
+        id_observer, date_from and date_to. Other search values are ignored."""
+        ids: Optional[set] = None
+        if "id_sightings_list" in body:
+            value = body["id_sightings_list"]
+            values = value.split(",") if isinstance(value, str) else value
+            ids = {int(id_) for id_ in values}
+        filters = [
+            (key, str(body[key]))
+            for key in ("id_species", "id_place")
+            if body.get(key) is not None
+        ]
+        id_observer = body.get("id_observer")
+        date_from = (
+            datetime.strptime(body["date_from"], "%d.%m.%Y").date()
+            if body.get("date_from")
+            else None
+        )
+        date_to = (
+            datetime.strptime(body["date_to"], "%d.%m.%Y").date()
+            if body.get("date_to")
+            else None
+        )
+        result = []
+        with self._lock:
+            for id_ in sorted(ids) if ids is not None else list(self.sightings):
+                sighting = self.sightings.get(id_)
+                if sighting is None:
+                    continue
+                if any(
+                    str(sighting[key[3:]]["@id"]) != value for key, value in filters
+                ):
+                    continue
+                if id_observer is not None and str(
+                    sighting["observers"][0]["@id"]
+                ) != str(id_observer):
+                    continue
+                if date_from or date_to:
+                    day = datetime.fromtimestamp(
+                        int(sighting["date"]["@timestamp"]), timezone.utc
+                    ).date()
+                    if (date_from and day < date_from) or (date_to and day > date_to):
+                        continue
+                result.append(id_)
+        return result
+
+    def _new_id(self) -> int:
+        id_ = self._next_id
+        self._next_id += 1
+        return id_
+
+    def _store_sighting(
+        self, sighting: Dict[str, Any], id_form: Optional[int] = None
+    ) -> int:
+        """Store a sighting sent to the API, assigning a new ID"""
+        sighting = copy.deepcopy(sighting)
+        id_sighting = self._new_id()
+        observer = sighting["observers"][0]
+        observer["id_sighting"] = str(id_sighting)
+        observer["id_universal"] = f"28_{id_sighting}"
+        observer.setdefault("guid", str(uuid.uuid4()))
+        observer.setdefault("version", "0")
+        if id_form is not None:
+            observer["id_form"] = str(id_form)
+        self.sightings[id_sighting] = sighting
+        self.modify("observations", id_sighting)
+        return id_sighting
+
+    def _create(self, body: Dict[str, Any]) -> Body:
+        """Create the sent sightings or forms, answered with their IDs after the success message"""
+        ids = []
+        body = body["data"]
+        with self._lock:
+            for sighting in body.get("sightings", []):
+                id_form = sighting["observers"][0].get("id_form")
+                if id_form is not None and int(id_form) not in self.forms:
+                    raise KeyError(id_form)
+                ids.append(
+                    self._store_sighting(
+                        sighting, int(id_form) if id_form is not None else None
+                    )
+                )
+            for form in body.get("forms", []):
+                id_form = self._new_id()
+                self.forms[id_form] = {
+                    key: value for key, value in form.items() if key != "sightings"
+                }
+                self.forms[id_form].update(
+                    {"@id": str(id_form), "id_form_universal": f"28_{id_form}"}
+                )
+                for sighting in form.get("sightings", []):
+                    ids.append(self._store_sighting(sighting, id_form))
+        return Body(
+            BANNERS[0] + b"\n" + json.dumps({"id": ids}).encode("utf-8"),
+            "application/json; charset=utf-8",
+        )
+
+    def _observation(
+        self, method: str, id_sighting: int, body: Any
+    ) -> Union[Body, Dict[str, Any]]:
+        with self._lock:
+            sighting = self.sightings[id_sighting]
+            if method == "get":
+                if "id_form" in sighting["observers"][0]:
+                    return self._sightings_payload([id_sighting])
+                return {"data": {"sightings": [sighting]}}
+            elif method == "put":
+                updated = body["data"]["sightings"][0]
+                observer = updated["observers"][0]
+                observer["id_sighting"] = str(id_sighting)
+                observer["version"] = str(
+                    int(sighting["observers"][0].get("version", 0)) + 1
+                )
+                self.sightings[id_sighting] = updated
+                self.modify("observations", id_sighting)
+                return {"data": []}
+            elif method == "delete":
+                del self.sightings[id_sighting]
+                self.modify("observations", id_sighting, "deleted")
+                return Body(b"", "text/html; charset=UTF-8")
+        raise KeyError(method)
+
+    def _delete_form(self, id_form: int) -> Body:
+        with self._lock:
+            del self.forms[id_form]
+            for sighting in self._form_sightings(id_form):
+                id_sighting = int(sighting["observers"][0]["id_sighting"])
+                del self.sightings[id_sighting]
+                self.modify("observations", id_sighting, "deleted")
+        return Body(b"", "text/html; charset=UTF-8")
+
+    def _diff(self, endpoint: str, params: Dict[str, str]) -> List[Dict[str, str]]:
+        """Return the last modification of every object since the given date"""
+        since = datetime.fromisoformat(params["date"])
+        only = {"only_modified": "updated", "only_deleted": "deleted"}.get(
+            params.get("modification_type", "all")
+        )
+        latest: Dict[int, str] = dict()
+        with self._lock:
+            for at, id_, modification_type in self.modifications[endpoint]:
+                if at >= since:
+                    latest.pop(id_, None)
+                    latest[id_] = modification_type
+        return [
+            {
+                DIFF_ENDPOINTS[endpoint]: str(id_),
+                "id_universal": f"28_{id_}",
+                "modification_type": modification_type,
+            }
+            for id_, modification_type in latest.items()
+            if only is None or modification_type == only
+        ]
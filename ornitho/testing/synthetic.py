@@ -0,0 +1,277 @@
+import random
+import uuid
+from typing import Any, Dict, List, Optional
+
+# 2020-01-01 00:00:00 UTC, synthetic timings are spread over the following year
+START_TIMESTAMP = 1577836800
+
+
+def synthetic_sighting(
+    id_sighting: int,
+    rng: Optional[random.Random] = None,
+    id_form: Optional[int] = None,
+    id_species: Optional[int] = None,
+    id_place: Optional[int] = None,
+    id_observer: Optional[int] = None,
+    timestamp: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Create raw data of a sighting, shaped like the sightings returned by observations/search
+    Values, which are not given, are drawn from the random generator.
+    :param id_sighting: ID of the sighting
+    :param rng: Random generator. Default: generator seeded with the ID
+    :param id_form: Optional ID of the form, the sighting belongs to
+    :param id_species: ID of the species
+    :param id_place: ID of the place
+    :param id_observer: ID of the observer
+    :param timestamp: Unix timestamp of the sighting
+    :type id_sighting: int
+    :type rng: Optional[random.Random]
+    :type id_form: Optional[int]
+    :type id_species: Optional[int]
+    :type id_place: Optional[int]
+    :type id_observer: Optional[int]
+    :type timestamp: Optional[int]
+    :return: Raw sighting
+    :rtype: Dict[str, Any]
+    """
+    rng = rng or random.Random(id_sighting)
+    id_species = id_species if id_species is not None else rng.randint(1, 500)
+    id_place = id_place if id_place is not None else rng.randint(1, 10000)
+    id_observer = id_observer if id_observer is not None else rng.randint(1, 1000)
+    timestamp = (
+        timestamp
+        if timestamp is not None
+        else START_TIMESTAMP + rng.randint(0, 365 * 24 * 3600)
+    )
+    day_timestamp = timestamp - timestamp % 86400
+    lat = 49.0 + rng.random()
+    lon = 7.0 + rng.random()
+    count = rng.randint(1, 50)
+    observer: Dict[str, Any] = {
+        "@id": str(id_observer),
+        "@uid": str(id_observer + 50000),
+        "traid": str(id_observer),
+        "id_sighting": str(id_sighting),
+        "id_universal": f"28_{id_sighting}",
+        "guid": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "version": "0",
+        "timing": {
+            "@notime": "0",
+            "@offset": "3600",
+            "@timestamp": str(timestamp),
+        },
+        "coord_lat": f"{lat + rng.uniform(-0.001, 0.001):.6f}",
+        "coord_lon": f"{lon + rng.uniform(-0.001, 0.001):.6f}",
+        "altitude": str(rng.randint(0, 1500)),
+        "precision": "precise",
+        "estimation_code": "EXACT_VALUE",
+        "count": str(count),
+        "flight_number": "1",
+        "source": "WEB",
+        "insert_date": str(timestamp + 3600),
+        "atlas_code": {"@id": "3_3", "#text": "A2"},
+        "details": [
+            {"count": str(count - count // 2), "sex": "M", "age": "AD"},
+            {"count": str(count // 2), "sex": "F", "age": "AD"},
+        ],
+        "comment": f"Synthetic sighting {id_sighting}",
+    }
+    if id_form is not None:
+        observer["id_form"] = str(id_form)
+    return {
+        "date": {
+            "@notime": "1",
+            "@offset": "3600",
+            "@timestamp": str(day_timestamp),
+        },
+        "species": {
+            "@id": str(id_species),
+            "taxonomy": "1",
+            "rarity": "common",
+            "category": "B",
+        },
+        "place": {
+            "@id": str(id_place),
+            "id_universal": f"28_{id_place}",
+            "place_type": "place",
+            "name": f"Place {id_place}",
+            "lat": f"{lat:.12f}",
+            "lon": f"{lon:.12f}",
+            "loc_precision": "0",
+        },
+        "observers": [observer],
+    }
+
+
+def synthetic_sightings(
+    count: int, start_id: int = 1, seed: int = 0, **kwargs: Any
+) -> List[Dict[str, Any]]:
+    """Create raw data of several sightings with consecutive IDs, reproducible with the same seed
+    :param count: Number of sightings
+    :param start_id: ID of the first sighting. Default: 1
+    :param seed: Seed of the random generator. Default: 0
+    :param kwargs: Fixed values passed to synthetic_sighting, e.g. id_form=1
+    :type count: int
+    :type start_id: int
+    :type seed: int
+    :type kwargs: Any
+    :return: List of raw sightings
+    :rtype: List[Dict[str, Any]]
+    """
+    rng = random.Random(seed)
+    return [
+        synthetic_sighting(id_sighting, rng=rng, **kwargs)
+        for id_sighting in range(start_id, start_id + count)
+    ]
+
+
+def synthetic_form(
+    id_form: int,
+    sighting_count: int,
+    start_id: int = 1,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Create raw data of a form including its sightings, shaped like the forms returned by observations/search
+    :param id_form: ID of the form
+    :param sighting_count: Number of sightings of the form
+    :param start_id: ID of the first sighting. Default: 1
+    :param seed: Seed of the random generator. Default: 0
+    :type id_form: int
+    :type sighting_count: int
+    :type start_id: int
+    :type seed: int
+    :return: Raw form
+    :rtype: Dict[str, Any]
+    """
+    rng = random.Random(seed)
+    timestamp = START_TIMESTAMP + rng.randint(0, 364) * 86400 + 6 * 3600
+    id_place = rng.randint(1, 10000)
+    id_observer = rng.randint(1, 1000)
+    sightings = synthetic_sightings(
+        sighting_count,
+        start_id=start_id,
+        seed=seed,
+        id_form=id_form,
+        id_place=id_place,
+        id_observer=id_observer,
+        timestamp=timestamp,
+    )
+    return {
+        "@id": str(id_form),
+        "id_form_universal": f"28_{id_form}",
+        "time_start": "06:00:00",
+        "time_stop": "07:00:00",
+        "full_form": "1",
+        "version": "0",
+        "lat": sightings[0]["place"]["lat"] if sightings else "49.5",
+        "lon": sightings[0]["place"]["lon"] if sightings else "7.5",
+        "comment": f"Synthetic form {id_form}",
+        "sightings": sightings,
+    }
+
+
+def synthetic_places(
+    count: int, start_id: int = 1, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """Create raw data of several places with consecutive IDs
+    :param count: Number of places
+    :param start_id: ID of the first place. Default: 1
+    :param seed: Seed of the random generator. Default: 0
+    :type count: int
+    :type start_id: int
+    :type seed: int
+    :return: List of raw places
+    :rtype: List[Dict[str, Any]]
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            "id": str(id_place),
+            "id_commune": str(rng.randint(1, 3000)),
+            "id_region": str(rng.randint(1, 40)),
+            "name": f"Place {id_place}",
+            "coord_lat": f"{49.0 + rng.random():.6f}",
+            "coord_lon": f"{7.0 + rng.random():.6f}",
+            "altitude": str(rng.randint(0, 1500)),
+            "visible": "1",
+            "is_private": "0",
+            "place_type": "place",
+            "loc_precision": "0",
+        }
+        for id_place in range(start_id, start_id + count)
+    ]
+
+
+def synthetic_species(
+    count: int, start_id: int = 1, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """Create raw data of several species with consecutive IDs
+    :param count: Number of species
+    :param start_id: ID of the first species. Default: 1
+    :param seed: Seed of the random generator. Default: 0
+    :type count: int
+    :type start_id: int
+    :type seed: int
+    :return: List of raw species
+    :rtype: List[Dict[str, Any]]
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            "id": str(id_species),
+            "id_taxo_group": str(rng.randint(1, 10)),
+            "sys_order": str(id_species),
+            "sempach_id_family": str(rng.randint(1, 100)),
+            "category_1": "C",
+            "rarity": "common",
+            "atlas_start": "0",
+            "atlas_end": "0",
+            "latin_name": f"Species {id_species}",
+            "french_name": f"Espèce {id_species}",
+            "french_name_plur": f"Espèces {id_species}",
+            "german_name": f"Art {id_species}",
+            "german_name_plur": f"Arten {id_species}",
+            "english_name": f"Species {id_species}",
+            "english_name_plur": f"Species {id_species}",
+        }
+        for id_species in range(start_id, start_id + count)
+    ]
+
+
+def synthetic_fields(
+    count: int, options: int = 3, start_id: int = 1
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Create raw data of several fields and their options
+    :param count: Number of fields
+    :param options: Number of options per field. Default: 3
+    :param start_id: ID of the first field. Default: 1
+    :type count: int
+    :type options: int
+    :type start_id: int
+    :return: Dictionary of endpoints ('fields' and 'fields/<id>') and their raw data
+    :rtype: Dict[str, List[Dict[str, Any]]]
+    """
+    resources: Dict[str, List[Dict[str, Any]]] = {"fields": []}
+    for id_field in range(start_id, start_id + count):
+        resources["fields"].append(
+            {
+                "id": str(id_field),
+                "group": "OBS",
+                "name": f"FIELD_{id_field}",
+                "text": f"Field {id_field}",
+                "default": "0",
+                "mandatory": "0",
+                "empty_choice": "1",
+            }
+        )
+        resources[f"fields/{id_field}"] = [
+            {
+                "id": f"{id_field}_{value}",
+                "name": f"OPTION_{value}",
+                "text": f"Option {value}",
+                "value": str(value),
+                "order_id": str(value),
+            }
+            for value in range(1, options + 1)
+        ]
+    return resources
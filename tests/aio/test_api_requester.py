@@ -0,0 +1,186 @@
+import asyncio
+from unittest import TestCase, mock
+from unittest.mock import MagicMock, Mock
+
+import ornitho
+from ornitho import APIException, AuthenticationException, RetryPolicy
+from ornitho.aio import AsyncAPIRequester
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+class FakeAioResponse:
+    def __init__(self, status, headers, content):
+        self.status = status
+        self.reason = "OK"
+        self.headers = headers
+        self.content = content
+        self.charset = "utf-8"
+        self.url = "https://ornitho.test/api/test"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def read(self):
+        return self.content
+
+
+class FakeAioSession:
+    def __init__(self, response):
+        self.response = response
+        self.request = Mock(return_value=response)
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def json_response(text, status=200, pagination_key=None):
+    headers = {"Content-Type": "application/json; charset=utf-8"}
+    if pagination_key:
+        headers["pagination_key"] = pagination_key
+        headers["Transfer-Encoding"] = "chunked"
+    return FakeAioResponse(status, headers, text.encode("utf-8"))
+
+
+class TestAsyncAPIRequester(TestCase):
+    def setUp(self):
+        self.requester = AsyncAPIRequester(
+            api_base="https://ornitho.test/api/", max_concurrency=2
+        )
+
+    def test_no_sync_session(self):
+        with mock.patch("ornitho.api_requester.session_registry") as registry:
+            requester = AsyncAPIRequester()
+        registry.get.assert_not_called()
+        self.assertIsNone(requester.session)
+        self.assertEqual("ORNITHO_CONSUMER_KEY", requester.auth.client.client_key)
+
+    def test_send(self):
+        session = FakeAioSession(
+            json_response('{"data": [{"id": "1"}]}', pagination_key="pk")
+        )
+        self.requester.session = session
+        response, pk = asyncio.run(
+            self.requester.request_raw(method="get", url="test", params={"a": 1})
+        )
+        self.assertEqual({"data": [{"id": "1"}]}, response)
+        self.assertEqual("pk", pk)
+
+        method, url = session.request.call_args[0]
+        self.assertEqual("GET", method)
+        self.assertEqual(
+            "https://ornitho.test/api/test?user_email=ORNITHO_USER_EMAIL&user_pw=ORNITHO_USER_PW&a=1",
+            url,
+        )
+        self.assertTrue(
+            session.request.call_args[1]["headers"]["Authorization"].startswith(
+                "OAuth "
+            )
+        )
+
+    def test_send_rate_limiter(self):
+        session = FakeAioSession(json_response('{"data": []}'))
+        self.requester.session = session
+        rate_limiter = ornitho.RateLimiter(max_in_flight=1)
+
+        def request(*args, **kwargs):
+            # The in-flight slot is held while the request is sent
+            self.assertFalse(rate_limiter._in_flight.acquire(blocking=False))
+            return session.response
+
+        session.request.side_effect = request
+        with mock.patch(
+            "ornitho.aio.api_requester.get_rate_limiter", return_value=rate_limiter
+        ):
+            asyncio.run(self.requester.request_raw(method="get", url="test"))
+        session.request.assert_called_once()
+        self.assertTrue(rate_limiter._in_flight.acquire(blocking=False))
+
+    def test_request_raw_error(self):
+        # Case 1: error without retries
+        self.requester.session = FakeAioSession(json_response("", status=401))
+        self.assertRaises(
+            AuthenticationException,
+            lambda: asyncio.run(self.requester.request_raw(method="get", url="test")),
+        )
+
+        # Case 2: retry after error
+        self.requester.send = MagicMock(
+            side_effect=[
+                asyncio.sleep(0, result=Mock(status_code=503)),
+                asyncio.sleep(0, result=Mock(status_code=200)),
+            ]
+        )
+        self.requester.handle_response = MagicMock(return_value=({"data": []}, None))
+        response, pk = asyncio.run(
+            self.requester.request_raw(
+                method="get",
+                url="test",
+                retries=1,
+                retry_policy=RetryPolicy(backoff_base=0),
+            )
+        )
+        self.assertEqual({"data": []}, response)
+        self.assertEqual(2, self.requester.send.call_count)
+
+    def test_request(self):
+        # Case 1: request all
+        async def fake_request_raw(**kwargs):
+            if kwargs["pagination_key"] is None:
+                return {"data": [{"id": "1"}]}, "pk_1"
+            elif kwargs["pagination_key"] == "pk_1":
+                return {"data": [{"id": "2"}]}, "pk_2"
+            return {"data": []}, "pk_3"
+
+        self.requester.request_raw = fake_request_raw
+        response, pk = asyncio.run(
+            self.requester.request(method="get", url="test", request_all=True)
+        )
+        self.assertEqual([{"id": "1"}, {"id": "2"}], response)
+        self.assertEqual("pk_1", pk)
+
+        # Case 2: only first page
+        response, pk = asyncio.run(self.requester.request(method="get", url="test"))
+        self.assertEqual([{"id": "1"}], response)
+
+        # Case 3: bytes
+        async def fake_bytes_request_raw(**kwargs):
+            return b"BYTES", None
+
+        self.requester.request_raw = fake_bytes_request_raw
+        response, pk = asyncio.run(self.requester.request(method="get", url="test"))
+        self.assertEqual(b"BYTES", response)
+
+        # Case 4: bytes on following page
+        async def fake_mixed_request_raw(**kwargs):
+            if kwargs["pagination_key"] is None:
+                return {"data": [{"id": "1"}]}, "pk_1"
+            return b"BYTES", None
+
+        self.requester.request_raw = fake_mixed_request_raw
+        self.assertRaises(
+            APIException,
+            lambda: asyncio.run(
+                self.requester.request(method="get", url="test", request_all=True)
+            ),
+        )
+
+    def test_close(self):
+        session = FakeAioSession(None)
+        self.requester.session = session
+
+        async def use_requester():
+            async with self.requester as requester:
+                self.assertEqual(self.requester, requester)
+
+        asyncio.run(use_requester())
+        self.assertTrue(session.closed)
+        self.assertIsNone(self.requester.session)
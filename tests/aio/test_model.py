@@ -0,0 +1,121 @@
+import asyncio
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import ornitho
+from ornitho import aio
+from ornitho.api_exception import ObjectNotFoundException
+from ornitho.model.abstract import (
+    CreateableModel,
+    DeletableModel,
+    ListableModel,
+    SearchableModel,
+)
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+class TestAioModel(TestCase):
+    class MyModel(ListableModel, SearchableModel, CreateableModel, DeletableModel):
+        ENDPOINT = "my_model"
+
+        @classmethod
+        def create(cls, **kwargs):
+            pass
+
+    def setUp(self):
+        self.requester = aio.AsyncAPIRequester()
+
+    def fake_request(self, response, pk=None):
+        async def request(**kwargs):
+            return response, pk
+
+        self.requester.request = MagicMock(side_effect=request)
+
+    def test_get(self):
+        self.fake_request([{"id": "1", "foo": "bar"}])
+        model = asyncio.run(aio.get(self.requester, self.MyModel, 1))
+        self.assertEqual(1, model.id_)
+        self.assertEqual({"id": "1", "foo": "bar"}, model._raw_data)
+        self.assertEqual("my_model/1", self.requester.request.call_args[1]["url"])
+
+    def test_gather_get(self):
+        async def request(**kwargs):
+            return [{"id": kwargs["url"].split("/")[1]}], None
+
+        self.requester.request = MagicMock(side_effect=request)
+        models = asyncio.run(aio.gather_get(self.requester, self.MyModel, [3, 1, 2]))
+        self.assertEqual([3, 1, 2], [model.id_ for model in models])
+
+    def test_refresh(self):
+        # Case 1: refreshed
+        model = self.MyModel.create_from_ornitho_json({"id": "1"})
+        self.fake_request([{"id": "1", "foo": "bar"}])
+        asyncio.run(aio.refresh(self.requester, model))
+        self.assertEqual({"id": "1"}, model._previous)
+        self.assertEqual({"id": "1", "foo": "bar"}, model._raw_data)
+
+        # Case 2: nothing found
+        self.fake_request([])
+        self.assertRaises(
+            ObjectNotFoundException,
+            lambda: asyncio.run(aio.refresh(self.requester, model)),
+        )
+
+        # Case 3: nulled object
+        self.fake_request([{"id": None}])
+        self.assertRaises(
+            ObjectNotFoundException,
+            lambda: asyncio.run(aio.refresh(self.requester, model)),
+        )
+
+        # Case 4: own refresh method, models are left out of the async API
+        for instance in [ornitho.Form(1), ornitho.Field(1), ornitho.FieldOption("1_1")]:
+            with self.subTest(model=type(instance).__name__):
+                with self.assertRaises(TypeError):
+                    asyncio.run(aio.refresh(self.requester, instance))
+                self.assertRaises(
+                    TypeError,
+                    lambda: asyncio.run(
+                        aio.get(self.requester, type(instance), instance.id_)
+                    ),
+                )
+
+    def test_list(self):
+        self.fake_request([{"id": "1"}, {"id": "2"}], "pk")
+        models, pk = asyncio.run(
+            aio.list_(self.requester, self.MyModel, request_all=True, foo="bar")
+        )
+        self.assertEqual([1, 2], [model.id_ for model in models])
+        self.assertEqual("pk", pk)
+        self.assertEqual("get", self.requester.request.call_args[1]["method"])
+        self.assertEqual({"foo": "bar"}, self.requester.request.call_args[1]["params"])
+
+    def test_search(self):
+        self.fake_request([{"id": "1"}, {"id": "2"}], "pk")
+        models, pk = asyncio.run(aio.search(self.requester, self.MyModel, foo="bar"))
+        self.assertEqual([1, 2], [model.id_ for model in models])
+        self.assertEqual("pk", pk)
+        self.assertEqual("my_model/search", self.requester.request.call_args[1]["url"])
+        self.assertEqual({"foo": "bar"}, self.requester.request.call_args[1]["body"])
+
+    def test_create_in_ornitho(self):
+        self.fake_request([{"id": [1]}])
+        id_ = asyncio.run(
+            aio.create_in_ornitho(self.requester, self.MyModel, {"foo": "bar"})
+        )
+        self.assertEqual(1, id_)
+        self.assertEqual(
+            {"data": {"foo": "bar"}}, self.requester.request.call_args[1]["body"]
+        )
+        self.assertFalse(self.requester.request.call_args[1]["idempotent"])
+
+    def test_delete(self):
+        self.fake_request("")
+        asyncio.run(aio.delete(self.requester, self.MyModel(1)))
+        self.assertEqual("DELETE", self.requester.request.call_args[1]["method"])
+        self.assertEqual("my_model/1", self.requester.request.call_args[1]["url"])
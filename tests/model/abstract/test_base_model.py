@@ -51,6 +51,22 @@ class TestBaseModel(TestCase):
         self.MyModel.refresh.assert_called()
         self.assertEqual(1, model.id_)
 
+    def test_get_many(self):
+        def fake_get(id_, short_version=False, retries=0):
+            if id_ == 3:
+                raise ObjectNotFoundException("Not found")
+            return self.MyModel.create_from_ornitho_json({"id": str(id_)})
+
+        with mock.patch.object(self.MyModel, "get", side_effect=fake_get) as get:
+            models, failures = self.MyModel.get_many(
+                [2, 1, 3, 2], max_workers=2, retries=1
+            )
+            self.assertEqual([2, 1], [model.id_ for model in models])
+            self.assertEqual([3], list(failures.keys()))
+            self.assertIsInstance(failures[3], ObjectNotFoundException)
+            self.assertEqual(3, get.call_count)
+            get.assert_called_with(3, short_version=False, retries=1)
+
     @mock.patch.object(ornitho.api_requester.APIRequester, "request", fake_request)
     def test_request(self):
         model = self.MyModel.request(method="get", url=self.MyModel.ENDPOINT)[0]
@@ -0,0 +1,110 @@
+from datetime import datetime
+from unittest import TestCase, mock
+
+import ornitho
+from ornitho import CompactModel, Observation, Precision, compact_model
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+class TestCompactModel(TestCase):
+    def setUp(self):
+        self.observation_json = {
+            "species": {"@id": "94"},
+            "observers": [
+                {
+                    "@id": "1",
+                    "id_sighting": "12345",
+                    "precision": "precise",
+                    "count": "3",
+                    "timing": {"@timestamp": "1573888500"},
+                }
+            ],
+        }
+        self.compact_class = Observation.compact(
+            ["id_species", "count", "timing", "precision", "comment"]
+        )
+
+    def test_compact_model(self):
+        self.assertTrue(issubclass(self.compact_class, CompactModel))
+        self.assertEqual("CompactObservation", self.compact_class.__name__)
+        self.assertEqual(
+            self.compact_class,
+            compact_model(
+                Observation, ["id_species", "count", "timing", "precision", "comment"]
+            ),
+        )
+        self.assertEqual(
+            ("id_species",), compact_model(Observation, ["id_", "id_species"]).FIELDS
+        )
+        self.assertRaises(ValueError, lambda: Observation.compact(["unknown"]))
+
+    @mock.patch.object(Observation, "refresh")
+    def test_create_from_ornitho_json(self, mock_refresh):
+        observation = self.compact_class.create_from_ornitho_json(self.observation_json)
+        self.assertEqual(12345, observation.id_)
+        self.assertEqual(94, observation.id_species)
+        self.assertEqual(3, observation.count)
+        self.assertEqual(
+            datetime.fromtimestamp(1573888500).astimezone(), observation.timing
+        )
+        self.assertEqual(Precision.PRECISE, observation.precision)
+        self.assertIsNone(observation.comment)
+        mock_refresh.assert_not_called()
+
+        self.assertFalse(hasattr(observation, "__dict__"))
+        self.assertRaises(AttributeError, lambda: setattr(observation, "other", 1))
+        self.assertEqual(
+            observation,
+            self.compact_class.create_from_ornitho_json(self.observation_json),
+        )
+        self.assertEqual(
+            {
+                "id_": 12345,
+                "id_species": 94,
+                "count": 3,
+                "timing": observation.timing,
+                "precision": Precision.PRECISE,
+                "comment": None,
+            },
+            observation.as_dict(),
+        )
+        self.assertTrue(repr(observation).startswith("CompactObservation(id_=12345"))
+
+    def test_from_model(self):
+        full_observation = Observation.create_from_ornitho_json(self.observation_json)
+        observation = self.compact_class.from_model(full_observation)
+        self.assertEqual(3, observation.count)
+        self.assertFalse(full_observation._refreshed)
+
+    @mock.patch.object(Observation, "refresh")
+    def test_sparse_sighting(self, mock_refresh):
+        observation = self.compact_class.create_from_ornitho_json(
+            {
+                "species": {"@id": "94"},
+                "observers": [
+                    {"id_sighting": "12345", "count": "", "timing": None},
+                ],
+            }
+        )
+        self.assertEqual(12345, observation.id_)
+        self.assertEqual(94, observation.id_species)
+        self.assertIsNone(observation.count)
+        self.assertIsNone(observation.timing)
+        self.assertIsNone(observation.precision)
+        mock_refresh.assert_not_called()
+
+    def test_to_model(self):
+        observation = self.compact_class.create_from_ornitho_json(self.observation_json)
+        model = observation.to_model()
+        self.assertIsInstance(model, Observation)
+        self.assertEqual(12345, model.id_)
+        self.assertEqual({}, model._raw_data)
+
+        compact_class = Observation.compact(["count"], keep_raw_data=True)
+        observation = compact_class.create_from_ornitho_json(self.observation_json)
+        self.assertEqual(self.observation_json, observation.to_model()._raw_data)
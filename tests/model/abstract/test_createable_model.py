@@ -23,3 +23,14 @@ class TestCreateableModel(TestCase):
     def test_create_in_ornitho(self):
         returned_id = self.MyModel.create_in_ornitho({"my_data": 123})
         self.assertEqual(1, returned_id)
+
+    def test_create_many_in_ornitho(self):
+        with mock.patch.object(
+            self.MyModel, "request", return_value=[{"id": [1, 2]}]
+        ) as request:
+            returned_ids = self.MyModel.create_many_in_ornitho({"sightings": [{}, {}]})
+            self.assertEqual([1, 2], returned_ids)
+            self.assertEqual(
+                {"data": {"sightings": [{}, {}]}}, request.call_args[1]["body"]
+            )
+            self.assertFalse(request.call_args[1]["idempotent"])
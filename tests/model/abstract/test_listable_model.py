@@ -1,3 +1,5 @@
+import os
+import tempfile
 from unittest import TestCase, mock
 
 import ornitho
@@ -26,6 +28,12 @@ class TestListableModel(TestCase):
     def fake_request(**kwargs):
         return [[{"id": "1"}, {"id": "2"}], "paginationKey"]
 
+    # noinspection PyUnusedLocal
+    @staticmethod
+    def fake_iter_pages(**kwargs):
+        yield [{"id": "1"}, {"id": "2"}], "paginationKey"
+        yield [{"id": "3"}], None
+
     @mock.patch.object(ornitho.api_requester.APIRequester, "request", fake_request)
     def test_list(self):
         models, pk = self.MyModel.list()
@@ -40,3 +48,53 @@ class TestListableModel(TestCase):
         self.assertEqual(len(models), 2)
         self.assertEqual(models[0].id_, 1)
         self.assertEqual(models[1].id_, 2)
+
+    def test_iter_all(self):
+        with mock.patch.object(
+            ornitho.api_requester.APIRequester,
+            "iter_pages",
+            side_effect=self.fake_iter_pages,
+        ) as iter_pages:
+            iterator = self.MyModel.iter_all(pagination_key="pk", filter="value")
+            iter_pages.assert_not_called()
+            models = list(iterator)
+            self.assertEqual([1, 2, 3], [model.id_ for model in models])
+            self.assertEqual("paginationKey", iterator.pagination_key)
+            self.assertEqual("get", iter_pages.call_args[1]["method"])
+            self.assertEqual("pk", iter_pages.call_args[1]["pagination_key"])
+
+    def test_iter_all_checkpoint(self):
+        def fake_iter_pages(**kwargs):
+            if kwargs["pagination_key"] is None:
+                yield [{"id": "1"}, {"id": "2"}], "paginationKey"
+            yield [{"id": "3"}], None
+
+        with tempfile.TemporaryDirectory() as directory, mock.patch.object(
+            ornitho.api_requester.APIRequester,
+            "iter_pages",
+            side_effect=fake_iter_pages,
+        ) as iter_pages:
+            path = os.path.join(directory, "checkpoint.json")
+            iterator = self.MyModel.iter_all(checkpoint=path, filter="value")
+            self.assertEqual([1, 2, 3], [next(iterator).id_ for _ in range(3)])
+            # Interrupted while consuming the second page
+            self.assertRaises(
+                ValueError, self.MyModel.iter_all, checkpoint=path, filter="other"
+            )
+
+            # The stored last page is emitted again, without requesting further pages
+            iterator = self.MyModel.iter_all(checkpoint=path, filter="value")
+            self.assertEqual(2, iterator.count)
+            self.assertEqual([3], [model.id_ for model in iterator])
+            self.assertEqual(3, iterator.count)
+            self.assertEqual(1, iter_pages.call_count)
+            self.assertFalse(os.path.exists(path))
+
+            iterator = self.MyModel.iter_all(checkpoint=path, filter="value")
+            self.assertEqual(1, next(iterator).id_)
+            iterator.close()
+            iterator = self.MyModel.iter_all(checkpoint=path, filter="value")
+            self.assertEqual(1, iterator.count)
+            self.assertEqual([2, 3], [model.id_ for model in iterator])
+            self.assertEqual("paginationKey", iter_pages.call_args[1]["pagination_key"])
+            self.assertFalse(os.path.exists(path))
@@ -0,0 +1,76 @@
+from itertools import islice
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from ornitho import APIException
+from ornitho.model.abstract import BaseModel, ModelIterator
+
+
+class TestModelIterator(TestCase):
+    class MyModel(BaseModel):
+        ENDPOINT = "my_model"
+
+    def test_iterate(self):
+        pages = iter(
+            [
+                ([{"id": "1"}, {"id": "2"}], "pk_1"),
+                ([{"id": "3"}], "pk_2"),
+                ([], "pk_3"),
+            ]
+        )
+        iterator = ModelIterator(self.MyModel, pages)
+        self.assertEqual(iterator, iter(iterator))
+        self.assertIsNone(iterator.pagination_key)
+
+        first = next(iterator)
+        self.assertIsInstance(first, self.MyModel)
+        self.assertEqual(1, first.id_)
+        self.assertIsNone(iterator.pagination_key)
+        self.assertEqual("pk_1", iterator.next_pagination_key)
+
+        next(iterator)
+        self.assertEqual(2, iterator.page_position)
+
+        third = next(iterator)
+        self.assertEqual(3, third.id_)
+        self.assertEqual("pk_1", iterator.pagination_key)
+        self.assertEqual("pk_2", iterator.next_pagination_key)
+        self.assertEqual(1, iterator.page_position)
+        self.assertEqual(3, iterator.count)
+
+        self.assertRaises(StopIteration, lambda: next(iterator))
+
+    def test_lazy(self):
+        pages = MagicMock()
+        pages.__next__.side_effect = [
+            ([{"id": "1"}, {"id": "2"}], "pk_1"),
+            ([{"id": "3"}], None),
+        ]
+        models = list(islice(ModelIterator(self.MyModel, pages, "pk_0"), 2))
+        self.assertEqual([1, 2], [model.id_ for model in models])
+        self.assertEqual(1, pages.__next__.call_count)
+
+    def test_bytes(self):
+        iterator = ModelIterator(self.MyModel, iter([(b"BYTES", None)]))
+        self.assertRaises(APIException, lambda: next(iterator))
+
+    def test_page(self):
+        pages = MagicMock()
+        pages.__next__.side_effect = [([{"id": "4"}], None)]
+        iterator = ModelIterator(
+            self.MyModel,
+            pages,
+            "pk_1",
+            5,
+            page=[{"id": "2"}, {"id": "3"}],
+            page_position=1,
+        )
+        self.assertEqual(6, iterator.count)
+        self.assertIsNone(iterator.pagination_key)
+        self.assertEqual([3, 4], [model.id_ for model in iterator])
+        self.assertEqual(8, iterator.count)
+        self.assertEqual(2, pages.__next__.call_count)
+
+        iterator = ModelIterator(self.MyModel, pages, None, 1, page=[{"id": "2"}])
+        self.assertEqual([2], [model.id_ for model in iterator])
+        self.assertEqual(2, pages.__next__.call_count)
@@ -26,6 +26,12 @@ class TestSearchableModel(TestCase):
     def fake_request(**kwargs):
         return [[{"id": "1"}, {"id": "2"}], "paginationKey"]
 
+    # noinspection PyUnusedLocal
+    @staticmethod
+    def fake_iter_pages(**kwargs):
+        yield [{"id": "1"}, {"id": "2"}], "paginationKey"
+        yield [{"id": "3"}], None
+
     @mock.patch.object(ornitho.api_requester.APIRequester, "request", fake_request)
     def test_search(self):
         models, pk = self.MyModel.search()
@@ -40,3 +46,17 @@ class TestSearchableModel(TestCase):
         self.assertEqual(len(models), 2)
         self.assertEqual(models[0].id_, 1)
         self.assertEqual(models[1].id_, 2)
+
+    def test_iter_search(self):
+        with mock.patch.object(
+            ornitho.api_requester.APIRequester,
+            "iter_pages",
+            side_effect=self.fake_iter_pages,
+        ) as iter_pages:
+            iterator = self.MyModel.iter_search(pagination_key="pk", filter="value")
+            iter_pages.assert_not_called()
+            models = list(iterator)
+            self.assertEqual([1, 2, 3], [model.id_ for model in models])
+            self.assertEqual("paginationKey", iterator.pagination_key)
+            self.assertEqual("post", iter_pages.call_args[1]["method"])
+            self.assertEqual("pk", iter_pages.call_args[1]["pagination_key"])
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 import ornitho
 from ornitho import Form, Place, Protocol
 from ornitho.api_exception import APIException
+from ornitho.testing import MockBiolovisionServer, synthetic_form
 
 ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
 ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
@@ -152,6 +153,73 @@ class TestForm(TestCase):
             lambda: self.form.refresh(),
         )
 
+    @mock.patch("ornitho.model.form.APIRequester")
+    def test_search(self, mock_requester):
+        mock_requester.return_value.__enter__.return_value.request.return_value = (
+            [self.form_json, {"id": "1"}],
+            "pk",
+        )
+        forms, pk = Form.search(id_species=1)
+        self.assertEqual("pk", pk)
+        self.assertEqual(1, len(forms))
+        self.assertEqual(self.form.id_, forms[0].id_)
+        self.assertEqual(len(self.form_json["sightings"]), len(forms[0].observations))
+        mock_requester.return_value.__enter__.return_value.request.assert_called_with(
+            method="post",
+            url="observations/search",
+            request_all=False,
+            pagination_key=None,
+            short_version=False,
+            body={"id_species": 1},
+            retries=0,
+            flatten_forms=False,
+        )
+
+    def test_merge_forms(self):
+        raw_forms = [
+            {"@id": "1", "sightings": [{"id": "a"}, {"id": "b"}]},
+            {"id": "2"},
+            {"@id": "1", "sightings": [{"id": "c"}]},
+            {"@id": "3", "sightings": [{"id": "d"}]},
+        ]
+        merged = Form.merge_forms(raw_forms)
+        self.assertEqual(["1", "3"], [raw_form["@id"] for raw_form in merged])
+        self.assertEqual(
+            [{"id": "a"}, {"id": "b"}, {"id": "c"}], merged[0]["sightings"]
+        )
+        self.assertEqual(2, len(raw_forms[0]["sightings"]))
+
+    def test_search_all_form_spanning_pages(self):
+        with MockBiolovisionServer(page_size=3) as server, mock.patch.object(
+            ornitho, "api_base", server.api_base
+        ):
+            server.add_forms(
+                [
+                    synthetic_form(1, 4, start_id=1),
+                    synthetic_form(2, 2, start_id=10),
+                ]
+            )
+            forms = Form.search_all(period_choice="all")
+        self.assertEqual([1, 2], [form.id_ for form in forms])
+        self.assertEqual(
+            [1, 2, 3, 4], [observation.id_ for observation in forms[0].observations]
+        )
+        self.assertEqual(
+            [10, 11], [observation.id_ for observation in forms[1].observations]
+        )
+
+    @mock.patch.object(Form, "search")
+    def test_search_all(self, mock_search):
+        mock_search.return_value = ([self.form], None)
+        self.assertEqual([self.form], Form.search_all(id_species=1))
+        mock_search.assert_called_with(
+            request_all=True,
+            pagination_key=None,
+            short_version=False,
+            retries=0,
+            id_species=1,
+        )
+
     def test_id_form_universal(self):
         self.assertEqual(
             self.form_json["id_form_universal"],
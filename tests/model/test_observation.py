@@ -1,5 +1,6 @@
+import array
 import uuid
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from unittest import TestCase, mock
 from unittest.mock import MagicMock
 
@@ -10,7 +11,9 @@ from ornitho import (
     APIException,
     Detail,
     EstimationCode,
+    GatewayTimeoutException,
     ModificationType,
+    ObjectNotFoundException,
     Observation,
     Precision,
     Relation,
@@ -1023,6 +1026,106 @@ class TestObservation(TestCase):
             retries=0,
         )
 
+    def test_search_to_table(self):
+        with mock.patch(
+            "ornitho.model.observation.APIRequester.iter_pages",
+            return_value=iter([([self.observation_json], "pk"), ([], None)]),
+        ) as iter_pages:
+            table = Observation.search_to_table(backend="array", id_species=94)
+            self.assertEqual({"id_species": 94}, iter_pages.call_args[1]["body"])
+            self.assertEqual(array.array("q", [94]), table["id_species"])
+            self.assertEqual(list(Observation.TABLE_DEFAULT_COLUMNS), list(table))
+
+    def test_split_period(self):
+        self.assertEqual(
+            [
+                (date(2020, 1, 1), date(2020, 1, 7)),
+                (date(2020, 1, 8), date(2020, 1, 10)),
+            ],
+            Observation.split_period(date(2020, 1, 1), date(2020, 1, 10), 7),
+        )
+        self.assertEqual(
+            [], Observation.split_period(date(2020, 1, 2), date(2020, 1, 1), 7)
+        )
+
+    def test_search_partitioned(self):
+        def fake_search_all(**kwargs):
+            if kwargs["date_to"] - kwargs["date_from"] > timedelta(days=2):
+                raise GatewayTimeoutException("Timeout")
+            # Observation 1 is found by every search
+            return [
+                Observation.create_from_ornitho_json(
+                    {"observers": [{"id_sighting": str(id_)}]}
+                )
+                for id_ in (kwargs["date_from"].day * 10 + kwargs["id_taxo_group"], 1)
+            ]
+
+        with mock.patch.object(
+            Observation, "search_all", side_effect=fake_search_all
+        ) as search_all:
+            observations = Observation.search_partitioned(
+                date(2020, 1, 1),
+                datetime(2020, 1, 10, 12),
+                split_by={"id_taxo_group": [1, 2]},
+                only_with_picture=True,
+            )
+            # Per taxo group: 1.-7. (timeout), 8.-10., 1.-4. (timeout), 5.-7., 1.-2., 3.-4.
+            self.assertEqual(12, search_all.call_count)
+            self.assertEqual("range", search_all.call_args[1]["period_choice"])
+            self.assertTrue(search_all.call_args[1]["only_with_picture"])
+        self.assertEqual(
+            [11, 1, 31, 51, 81, 12, 32, 52, 82], [obs.id_ for obs in observations]
+        )
+
+        with mock.patch.object(
+            Observation,
+            "search_all",
+            side_effect=GatewayTimeoutException("Timeout"),
+        ):
+            self.assertRaises(
+                GatewayTimeoutException,
+                Observation.search_partitioned,
+                date(2020, 1, 1),
+                date(2020, 1, 3),
+            )
+
+        with mock.patch.object(Observation, "search_all") as search_all:
+            with self.assertRaisesRegex(ValueError, "id_taxo_group"):
+                Observation.search_partitioned(
+                    date(2020, 1, 1),
+                    date(2020, 1, 3),
+                    split_by={"id_taxo_group": [1, 2]},
+                    id_taxo_group=1,
+                )
+            search_all.assert_not_called()
+
+    def test_get_many(self):
+        def fake_search_all(**kwargs):
+            if 2001 in kwargs["id_sightings_list"]:
+                raise APIException("Error")
+            return [
+                Observation.create_from_ornitho_json(
+                    {"observers": [{"id_sighting": str(id_)}]}
+                )
+                for id_ in kwargs["id_sightings_list"]
+                if id_ != 2
+            ]
+
+        with mock.patch.object(
+            Observation, "search_all", side_effect=fake_search_all
+        ) as search_all:
+            observations, failures = Observation.get_many(
+                [3, "1", "2", 2, 1] + list(range(4, 2002))
+            )
+            self.assertEqual(3, search_all.call_count)
+            self.assertEqual(
+                [3, 1] + list(range(4, 2001)), [obs.id_ for obs in observations]
+            )
+            self.assertEqual([2001, "2"], list(failures.keys()))
+            self.assertIsInstance(failures["2"], ObjectNotFoundException)
+            self.assertIsInstance(failures[2001], APIException)
+            self.assertEqual("all", search_all.call_args_list[0][1]["period_choice"])
+
     def test_diff(self):
         Observation.request = MagicMock(
             return_value=[
@@ -1043,24 +1146,6 @@ class TestObservation(TestCase):
                 },
             ]
         )
-        Observation.search = MagicMock(
-            return_value=[
-                [
-                    {
-                        "id_sighting": "1",
-                        "id_universal": "1",
-                        "modification_type": "updated",
-                    },
-                    {
-                        "id_sighting": "3",
-                        "id_universal": "3",
-                        "modification_type": "updated",
-                    },
-                ],
-                "key",
-            ]
-        )
-
         # Case 1: without retrieving
         date = datetime.now() - timedelta(hours=1)
         observations = Observation.diff(
@@ -1093,19 +1178,22 @@ class TestObservation(TestCase):
         date = datetime.now().astimezone(pytz.timezone("Asia/Tokyo")) - timedelta(
             hours=1
         )
-        observations = Observation.diff(
-            date, only_protocol=mock_protocol, retrieve_observations=True
-        )
+        with mock.patch.object(
+            Observation,
+            "search_all",
+            return_value=[
+                Observation.create_from_ornitho_json(
+                    {"observers": [{"id_sighting": id_}]}
+                )
+                for id_ in ("3", "1")
+            ],
+        ) as search_all:
+            observations = Observation.diff(
+                date, only_protocol=mock_protocol, retrieve_observations=True
+            )
         self.assertEqual(len(observations[ModificationType.ONLY_MODIFIED]), 2)
         self.assertEqual(len(observations[ModificationType.ONLY_DELETED]), 1)
-        self.assertEqual(
-            observations[ModificationType.ONLY_MODIFIED][0],
-            {
-                "id_sighting": "1",
-                "id_universal": "1",
-                "modification_type": "updated",
-            },
-        )
+        self.assertEqual(1, observations[ModificationType.ONLY_MODIFIED][0].id_)
         Observation.request.assert_called_with(
             method="get",
             url="observations/diff",
@@ -1118,8 +1206,59 @@ class TestObservation(TestCase):
             },
             retries=0,
         )
-        Observation.search.assert_called_with(
-            period_choice="all", id_sightings_list=[1, 3]
+        search_all.assert_called_with(
+            retries=0, period_choice="all", id_sightings_list=[1, 3]
+        )
+
+    def test_iter_retrieve(self):
+        def fake_search_all(**kwargs):
+            return [
+                Observation.create_from_ornitho_json(
+                    {"observers": [{"id_sighting": str(id_)}]}
+                )
+                for id_ in kwargs["id_sightings_list"]
+            ]
+
+        with mock.patch.object(
+            Observation, "search_all", side_effect=fake_search_all
+        ) as search_all:
+            chunks = list(
+                Observation.iter_retrieve(list(range(5)), max_workers=2, chunk_size=2)
+            )
+            self.assertEqual(3, search_all.call_count)
+            self.assertEqual(
+                list(range(5)),
+                sorted(obs.id_ for chunk in chunks for obs in chunk),
+            )
+            self.assertEqual([], list(Observation.iter_retrieve([])))
+
+        with mock.patch.object(
+            Observation, "search_all", side_effect=APIException("Error")
+        ):
+            self.assertRaises(
+                APIException, list, Observation.iter_retrieve([1, 2], chunk_size=1)
+            )
+
+    def test_iter_diff(self):
+        with mock.patch.object(
+            Observation, "diff_ids", return_value=([1], [2])
+        ) as diff_ids, mock.patch.object(
+            Observation,
+            "search_all",
+            return_value=[
+                Observation.create_from_ornitho_json(
+                    {"observers": [{"id_sighting": "1"}]}
+                )
+            ],
+        ):
+            date = datetime.now() - timedelta(hours=1)
+            observations = list(Observation.iter_diff(date, id_taxo_group=1))
+            self.assertEqual(date, diff_ids.call_args[0][0])
+            self.assertEqual(1, diff_ids.call_args[1]["id_taxo_group"])
+        self.assertEqual([2, 1], [obs.id_ for obs in observations])
+        self.assertEqual(
+            [ModificationType.ONLY_DELETED, ModificationType.ONLY_MODIFIED],
+            [obs.modification_type for obs in observations],
         )
 
     @mock.patch("ornitho.model.observation.CreateableModel.create_in_ornitho")
@@ -219,3 +219,32 @@ class TestPlace(TestCase):
             },
             retries=0,
         )
+
+    def test_iter_diff(self):
+        with mock.patch.object(
+            Place, "diff_ids", return_value=([3, 4], [2])
+        ) as diff_ids, mock.patch.object(
+            Place, "get", side_effect=lambda id_, retries: Place(id_)
+        ) as get:
+            places = list(Place.iter_diff(datetime.now(), retries=1, max_workers=2))
+            self.assertEqual(1, diff_ids.call_args[1]["retries"])
+            self.assertEqual(2, get.call_count)
+            get.assert_any_call(3, retries=1)
+        self.assertEqual(2, places[0].id_)
+        self.assertEqual(ModificationType.ONLY_DELETED, places[0].modification_type)
+        self.assertEqual([3, 4], sorted(place.id_ for place in places[1:]))
+        self.assertEqual(
+            {ModificationType.ONLY_MODIFIED},
+            {place.modification_type for place in places[1:]},
+        )
+
+    def test_diff_retrieve_failure(self):
+        with mock.patch.object(
+            Place, "diff_ids", return_value=([3], [])
+        ), mock.patch.object(Place, "get", side_effect=ornitho.APIException("Error")):
+            self.assertRaises(
+                ornitho.APIException,
+                Place.diff,
+                datetime.now(),
+                retrieve_places=True,
+            )
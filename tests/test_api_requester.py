@@ -1,9 +1,10 @@
 import json
 from datetime import datetime
-from unittest import TestCase
+from unittest import TestCase, mock
 from unittest.mock import MagicMock, Mock
 
 import pytz
+from requests.exceptions import ConnectionError, Timeout
 
 import ornitho
 from ornitho import (
@@ -12,7 +13,9 @@ from ornitho import (
     APIRequester,
     AuthenticationException,
     BadGatewayException,
+    ContentTypeException,
     GatewayTimeoutException,
+    RetryPolicy,
     ServiceUnavailableException,
 )
 
@@ -27,6 +30,9 @@ class TestAPIRequester(TestCase):
     def setUp(self):
         self.requester = APIRequester()
 
+    def tearDown(self):
+        ornitho.shutdown()
+
     def test_missing_config(self):
         ornitho.consumer_key = None
         self.assertRaises(RuntimeError, lambda: APIRequester())
@@ -58,9 +64,27 @@ class TestAPIRequester(TestCase):
         self.requester.close.assert_called()
 
     def test_close(self):
+        # Case 1: shared session stays open
         self.requester.session = Mock()
         self.requester.close()
-        self.requester.session.close.assert_called()
+        self.requester.session.close.assert_not_called()
+
+        # Case 2: own session is closed
+        requester = APIRequester(pooled=False)
+        requester.session = Mock()
+        requester.close()
+        requester.session.close.assert_called()
+
+    def test_pooled_session(self):
+        self.assertEqual(APIRequester().session, self.requester.session)
+        self.assertNotEqual(
+            APIRequester(api_base="OTHER_API_BASE").session, self.requester.session
+        )
+        self.assertNotEqual(APIRequester(pooled=False).session, self.requester.session)
+
+        ornitho.session_pooling = False
+        self.assertNotEqual(APIRequester().session, self.requester.session)
+        ornitho.session_pooling = True
 
     def test_request(self):
         # Case 1: no data key
@@ -154,6 +178,81 @@ class TestAPIRequester(TestCase):
         self.assertEqual(response, [])
         self.assertEqual(pk, None)
 
+        # Case 9: many pages, without hitting the recursion limit
+        self.requester.request_raw = MagicMock(
+            side_effect=[[{"data": [{"id": f"{i}"}]}, f"pk_{i}"] for i in range(2000)]
+            + [[{"data": []}, "pk_2000"]]
+        )
+        response, pk = self.requester.request(
+            method="get", url="test", request_all=True
+        )
+        self.assertEqual(2000, len(response))
+        self.assertEqual({"id": "1999"}, response[-1])
+        self.assertEqual(pk, "pk_0")
+
+    def test_iter_pages(self):
+        # Case 1: all pages
+        self.requester.request_raw = MagicMock(
+            side_effect=[
+                [{"data": [{"id": "1"}, {"id": "2"}]}, "pk_1"],
+                [{"data": [{"id": "3"}]}, "pk_2"],
+                [{"data": []}, "pk_3"],
+            ]
+        )
+        pages = list(self.requester.iter_pages(method="get", url="test"))
+        self.assertEqual(
+            [
+                ([{"id": "1"}, {"id": "2"}], "pk_1"),
+                ([{"id": "3"}], "pk_2"),
+                ([], "pk_3"),
+            ],
+            pages,
+        )
+        self.assertEqual(
+            "pk_2", self.requester.request_raw.call_args[1]["pagination_key"]
+        )
+
+        # Case 2: only one page
+        self.requester.request_raw = MagicMock(
+            return_value=[{"data": [{"id": "1"}]}, "pk_1"]
+        )
+        pages = list(
+            self.requester.iter_pages(method="get", url="test", request_all=False)
+        )
+        self.assertEqual([([{"id": "1"}], "pk_1")], pages)
+
+        # Case 3: pages are requested lazily
+        self.requester.request_raw = MagicMock(
+            return_value=[{"data": [{"id": "1"}]}, "pk_1"]
+        )
+        pages_iterator = self.requester.iter_pages(method="get", url="test")
+        next(pages_iterator)
+        next(pages_iterator)
+        self.assertEqual(2, self.requester.request_raw.call_count)
+
+        # Case 4: bytes on first page
+        self.requester.request_raw = MagicMock(return_value=[b"BYTES", None])
+        pages = list(self.requester.iter_pages(method="get", url="test"))
+        self.assertEqual([(b"BYTES", None)], pages)
+
+    def test_iter_request(self):
+        # Case 1: data objects of all pages
+        self.requester.request_raw = MagicMock(
+            side_effect=[
+                [{"data": [{"id": "1"}, {"id": "2"}]}, "pk_1"],
+                [{"data": [{"id": "3"}]}, None],
+            ]
+        )
+        response = list(self.requester.iter_request(method="get", url="test"))
+        self.assertEqual([{"id": "1"}, {"id": "2"}, {"id": "3"}], response)
+
+        # Case 2: bytes
+        self.requester.request_raw = MagicMock(return_value=[b"BYTES", None])
+        self.assertRaises(
+            APIException,
+            lambda: list(self.requester.iter_request(method="get", url="test")),
+        )
+
     def test_handle_error_response(self):
         self.assertRaises(
             AuthenticationException,
@@ -201,7 +300,7 @@ class TestAPIRequester(TestCase):
                     "Content-Length": 23,
                     "Transfer-Encoding": "chunked",
                 },
-                text='{"data": [{"id": "1"}]}',
+                content=b'{"data": [{"id": "1"}]}',
             )
         )
         response, pk = self.requester.request_raw(
@@ -222,7 +321,7 @@ class TestAPIRequester(TestCase):
                     "Content-Type": "application/json; charset=utf-8",
                     "Content-Length": 23,
                 },
-                text='{"data": [{"id": "1"}]}',
+                content=b'{"data": [{"id": "1"}]}',
             )
         )
         response, pk = self.requester.request_raw(
@@ -292,7 +391,7 @@ class TestAPIRequester(TestCase):
                     "Content-Length": 23,
                     "Transfer-Encoding": "chunked",
                 },
-                text='{"data": [{"id": "1"}]}',
+                content=b'{"data": [{"id": "1"}]}',
             )
         )
         test_date = datetime.now().date()
@@ -310,6 +409,7 @@ class TestAPIRequester(TestCase):
             f"ORNITHO_API_BASEtest?user_email=ORNITHO_USER_EMAIL&user_pw=ORNITHO_USER_PW&pagination_key=key&short_version=1&test={test_date.strftime('%d.%m.%Y')}",
             data=None,
             headers=APIRequester.request_headers(),
+            stream=False,
         )
 
         # Case 8: Unaware datetime as parameter
@@ -322,7 +422,7 @@ class TestAPIRequester(TestCase):
                     "Content-Length": 23,
                     "Transfer-Encoding": "chunked",
                 },
-                text='{"data": [{"id": "1"}]}',
+                content=b'{"data": [{"id": "1"}]}',
             )
         )
         test_date = datetime.now()
@@ -340,6 +440,7 @@ class TestAPIRequester(TestCase):
             f"ORNITHO_API_BASEtest?user_email=ORNITHO_USER_EMAIL&user_pw=ORNITHO_USER_PW&pagination_key=key&short_version=1&test={test_date.replace(microsecond=0).strftime('%d.%m.%Y')}",
             data=None,
             headers=APIRequester.request_headers(),
+            stream=False,
         )
 
         # Case 10: Date as body parameter
@@ -352,7 +453,7 @@ class TestAPIRequester(TestCase):
                     "Content-Length": 23,
                     "Transfer-Encoding": "chunked",
                 },
-                text='{"data": [{"id": "1"}]}',
+                content=b'{"data": [{"id": "1"}]}',
             )
         )
         test_date = datetime.now().date()
@@ -370,6 +471,7 @@ class TestAPIRequester(TestCase):
             f"ORNITHO_API_BASEtest?user_email=ORNITHO_USER_EMAIL&user_pw=ORNITHO_USER_PW&pagination_key=key&short_version=1",
             data=json.dumps({"test": test_date.strftime("%d.%m.%Y")}),
             headers=APIRequester.request_headers(),
+            stream=False,
         )
 
         # Case 11: Aware datetime as parameter
@@ -382,7 +484,7 @@ class TestAPIRequester(TestCase):
                     "Content-Length": 23,
                     "Transfer-Encoding": "chunked",
                 },
-                text='{"data": [{"id": "1"}]}',
+                content=b'{"data": [{"id": "1"}]}',
             )
         )
         test_date = datetime.now(pytz.timezone("Europe/Berlin"))
@@ -400,6 +502,7 @@ class TestAPIRequester(TestCase):
             f"ORNITHO_API_BASEtest?user_email=ORNITHO_USER_EMAIL&user_pw=ORNITHO_USER_PW&pagination_key=key&short_version=1&test={test_date.replace(microsecond=0).astimezone(datetime.now().astimezone().tzinfo).replace(tzinfo=None).strftime('%d.%m.%Y')}",
             data=None,
             headers=APIRequester.request_headers(),
+            stream=False,
         )
 
         # Case 12: Unaware datetime as body parameter
@@ -412,7 +515,7 @@ class TestAPIRequester(TestCase):
                     "Content-Length": 23,
                     "Transfer-Encoding": "chunked",
                 },
-                text='{"data": [{"id": "1"}]}',
+                content=b'{"data": [{"id": "1"}]}',
             )
         )
         test_date = datetime.now()
@@ -432,6 +535,7 @@ class TestAPIRequester(TestCase):
                 {"test": test_date.replace(microsecond=0).strftime("%d.%m.%Y")}
             ),
             headers=APIRequester.request_headers(),
+            stream=False,
         )
 
         # Case 13: Aware datetime as body parameter
@@ -444,7 +548,7 @@ class TestAPIRequester(TestCase):
                     "Content-Length": 23,
                     "Transfer-Encoding": "chunked",
                 },
-                text='{"data": [{"id": "1"}]}',
+                content=b'{"data": [{"id": "1"}]}',
             )
         )
         test_date = datetime.now(pytz.timezone("Europe/Berlin"))
@@ -464,6 +568,7 @@ class TestAPIRequester(TestCase):
                 {"test": test_date.replace(microsecond=0).strftime("%d.%m.%Y")}
             ),
             headers=APIRequester.request_headers(),
+            stream=False,
         )
 
         # Case 14: HTML Content Type
@@ -497,7 +602,7 @@ class TestAPIRequester(TestCase):
                     "Content-Length": 23,
                     "Transfer-Encoding": "chunked",
                 },
-                text='{"data": [{"id": "1"}]}',
+                content=b'{"data": [{"id": "1"}]}',
             )
         )
         test_bool = True
@@ -515,6 +620,7 @@ class TestAPIRequester(TestCase):
             f"ORNITHO_API_BASEtest?user_email=ORNITHO_USER_EMAIL&user_pw=ORNITHO_USER_PW&pagination_key=key&short_version=1&test={1 if test_bool else 0}",
             data=None,
             headers=APIRequester.request_headers(),
+            stream=False,
         )
 
         # Case 16: First Line is not part of the JSON response (success)
@@ -528,7 +634,7 @@ class TestAPIRequester(TestCase):
                     "Content-Length": 43,
                     "Transfer-Encoding": "chunked",
                 },
-                text='API message : Ihre Beobachtungsdaten wurden erfolgreich übermittelt, vielen Dank!\n{"data": [{"id": "1"}]}',
+                content='API message : Ihre Beobachtungsdaten wurden erfolgreich übermittelt, vielen Dank!\n{"data": [{"id": "1"}]}'.encode(),
             )
         )
         response, pk = self.requester.request_raw(
@@ -544,6 +650,7 @@ class TestAPIRequester(TestCase):
             f"ORNITHO_API_BASEtest?user_email=ORNITHO_USER_EMAIL&user_pw=ORNITHO_USER_PW&pagination_key=key&short_version=1",
             data=None,
             headers=APIRequester.request_headers(),
+            stream=False,
         )
 
         # Case 17: First Line is not part of the JSON response (error)
@@ -556,7 +663,7 @@ class TestAPIRequester(TestCase):
                     "Content-Length": 43,
                     "Transfer-Encoding": "chunked",
                 },
-                text='A very stupid line!\n{"data": [{"id": "1"}]}',
+                content=b'A very stupid line!\n{"data": [{"id": "1"}]}',
             )
         )
         self.assertRaises(
@@ -568,3 +675,176 @@ class TestAPIRequester(TestCase):
                 short_version=True,
             ),
         )
+
+    @mock.patch("ornitho.api_requester.time.sleep")
+    def test_request_raw_retry(self, mock_sleep):
+        ok_response = Mock(
+            status_code=200,
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            content=b'{"data": [{"id": "1"}]}',
+        )
+        policy = RetryPolicy(backoff_base=1, jitter=False)
+
+        # Case 1: retryable status and connection error
+        self.requester.session.request = MagicMock(
+            side_effect=[
+                Mock(status_code=503, headers={}),
+                ConnectionError("reset"),
+                ok_response,
+            ]
+        )
+        response, pk = self.requester.request_raw(
+            method="get", url="test", retries=2, retry_policy=policy
+        )
+        self.assertEqual({"data": [{"id": "1"}]}, response)
+        self.assertEqual([mock.call(1), mock.call(2)], mock_sleep.call_args_list)
+        self.assertEqual(2, policy.retry_count)
+        self.assertEqual({"503": 1, "ConnectionError": 1}, policy.retries_by_reason)
+
+        # Case 2: fatal status is not retried
+        self.requester.session.request = MagicMock(
+            return_value=Mock(status_code=401, headers={})
+        )
+        self.assertRaises(
+            AuthenticationException,
+            lambda: self.requester.request_raw(
+                method="get", url="test", retries=2, retry_policy=policy
+            ),
+        )
+        self.assertEqual(1, self.requester.session.request.call_count)
+
+        # Case 3: retries exhausted
+        self.requester.session.request = MagicMock(
+            return_value=Mock(status_code=502, headers={})
+        )
+        self.assertRaises(
+            BadGatewayException,
+            lambda: self.requester.request_raw(
+                method="get", url="test", retries=1, retry_policy=policy
+            ),
+        )
+        self.assertEqual(2, self.requester.session.request.call_count)
+
+        # Case 4: global policy with Retry-After header
+        mock_sleep.reset_mock()
+        ornitho.retry_policy = RetryPolicy(max_retries=1)
+        self.requester.session.request = MagicMock(
+            side_effect=[
+                Mock(status_code=429, headers={"Retry-After": "7"}),
+                ok_response,
+            ]
+        )
+        self.requester.request_raw(method="get", url="test")
+        mock_sleep.assert_called_once_with(7.0)
+        ornitho.retry_policy = RetryPolicy()
+
+        # Case 5: connection error without retries
+        self.requester.session.request = MagicMock(side_effect=Timeout("timeout"))
+        self.assertRaises(
+            Timeout, lambda: self.requester.request_raw(method="get", url="test")
+        )
+
+    def test_extract_data(self):
+        form = {
+            "@id": "1",
+            "sightings": [
+                {"id": "1", "date": {"@timestamp": "1584918000"}},
+                {"id": "2", "date": {"@timestamp": "1584918000"}},
+            ],
+        }
+        responds = {"data": {"sightings": [{"id": "3"}], "forms": [form]}}
+
+        # Case 1: forms are kept
+        self.assertEqual(
+            [{"id": "3"}, form],
+            APIRequester.extract_data(responds, flatten_forms=False),
+        )
+        self.assertNotIn("form", form["sightings"][0])
+
+        # Case 2: sightings share one form header, the form keeps its sightings
+        data = APIRequester.extract_data(responds)
+        self.assertEqual(["3", "1", "2"], [ele["id"] for ele in data])
+        self.assertIs(data[1]["form"], data[2]["form"])
+        self.assertEqual(
+            {"@id": "1", "day": {"@timestamp": "1584918000"}}, data[1]["form"]
+        )
+        self.assertEqual(2, len(form["sightings"]))
+        self.assertNotIn("form", form["sightings"][0])
+        self.assertIsNot(data[1]["date"], data[1]["form"]["day"])
+
+    def test_iter_stream(self):
+        pages = [
+            json.dumps(
+                {
+                    "data": {
+                        "sightings": [{"id": "1"}, {"id": "2"}],
+                        "forms": [
+                            {
+                                "id": "10",
+                                "sightings": [
+                                    {"id": "3", "date": {"@timestamp": "1"}},
+                                    {"id": "4", "date": {"@timestamp": "1"}},
+                                ],
+                            }
+                        ],
+                    }
+                }
+            ).encode(),
+            b'{"data": []}',
+        ]
+        responses = [
+            Mock(
+                status_code=200,
+                headers={
+                    "pagination_key": "key",
+                    "Content-Type": "application/json; charset=utf-8",
+                    "Transfer-Encoding": "chunked",
+                },
+                iter_content=Mock(
+                    side_effect=lambda chunk_size, page=page: (
+                        page[i : i + 5] for i in range(0, len(page), 5)
+                    )
+                ),
+            )
+            for page in pages
+        ]
+        self.requester.session.request = MagicMock(side_effect=responses)
+
+        # Case 1: all pages
+        data = list(self.requester.iter_request(method="get", url="test", stream=True))
+        self.assertEqual(["1", "2", "3", "4"], [ele["id"] for ele in data])
+        self.assertEqual({"id": "10", "day": {"@timestamp": "1"}}, data[2]["form"])
+        self.assertEqual(2, self.requester.session.request.call_count)
+        self.assertEqual(
+            "key",
+            self.requester.session.request.call_args[0][1].split("pagination_key=")[1],
+        )
+        responses[0].close.assert_called_once_with()
+        self.assertTrue(self.requester.session.request.call_args[1]["stream"])
+
+        # Case 2: no JSON
+        self.requester.session.request = MagicMock(
+            return_value=Mock(status_code=200, headers={"Content-Type": "text/html"})
+        )
+        self.assertRaises(
+            ContentTypeException,
+            lambda: list(self.requester.iter_stream(method="get", url="test")),
+        )
+
+        # Case 3: error responses are closed, after their body is read for the exception
+        error_response = Mock(status_code=500, content=b"error")
+        self.requester.session.request = MagicMock(return_value=error_response)
+        self.assertRaises(
+            APIHttpException,
+            lambda: list(self.requester.iter_stream(method="get", url="test")),
+        )
+        error_response.close.assert_called_once_with()
+
+        # Case 4: retried error responses are closed as well
+        retried_response = Mock(status_code=503, headers={}, content=b"")
+        self.requester.session.request = MagicMock(
+            side_effect=[retried_response, responses[1]]
+        )
+        with mock.patch("ornitho.api_requester.time.sleep"):
+            list(self.requester.iter_stream(method="get", url="test", retries=1))
+        retried_response.close.assert_called_once_with()
@@ -0,0 +1,77 @@
+from unittest import TestCase, mock
+
+import ornitho
+from ornitho import APIException, BulkCreateReport, Observation
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+class TestBulkCreateReport(TestCase):
+    def setUp(self):
+        self.observations = []
+        for count in range(1, 6):
+            observation = Observation()
+            observation.count = count
+            self.observations.append(observation)
+        self.fail_counts = {3}
+
+    def fake_create_many_in_ornitho(self, data, retries):
+        counts = [
+            int(sighting["observers"][0]["count"]) for sighting in data["sightings"]
+        ]
+        if self.fail_counts.intersection(counts):
+            raise APIException("Error")
+        return [str(count * 100) for count in counts]
+
+    def test_send_and_retry(self):
+        with mock.patch.object(
+            Observation,
+            "raw_data_trim_field_ids",
+            autospec=True,
+            side_effect=lambda observation: observation._raw_data,
+        ) as raw_data_trim_field_ids, mock.patch.object(
+            Observation,
+            "create_many_in_ornitho",
+            side_effect=self.fake_create_many_in_ornitho,
+        ) as create_many_in_ornitho:
+            report = Observation.create_many(
+                self.observations, chunk_size=2, max_in_flight=2
+            )
+            self.assertEqual(3, create_many_in_ornitho.call_count)
+            self.assertFalse(report.succeeded)
+            self.assertEqual([1], list(report.failures.keys()))
+            self.assertIsInstance(report.failures[1], APIException)
+            self.assertEqual(self.observations[2:4], report.failed)
+            self.assertEqual(
+                self.observations[:2] + self.observations[4:], report.created
+            )
+            self.assertEqual([100, 200, None, None, 500], report.ids)
+
+            self.fail_counts = set()
+            self.assertIs(report, report.retry())
+            self.assertEqual(4, create_many_in_ornitho.call_count)
+            self.assertEqual(
+                [3, 4],
+                [
+                    int(sighting["observers"][0]["count"])
+                    for sighting in create_many_in_ornitho.call_args[1]["data"][
+                        "sightings"
+                    ]
+                ],
+            )
+            # Serialised only once
+            self.assertEqual(5, raw_data_trim_field_ids.call_count)
+        self.assertTrue(report.succeeded)
+        self.assertEqual({}, report.failures)
+        self.assertEqual([], report.failed)
+        self.assertEqual([100, 200, 300, 400, 500], report.ids)
+
+    def test_id_mismatch(self):
+        with mock.patch.object(Observation, "create_many_in_ornitho", return_value=[1]):
+            report = BulkCreateReport(self.observations[:2]).send()
+        self.assertTrue(report.succeeded)
+        self.assertEqual([None, None], report.ids)
@@ -0,0 +1,119 @@
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from unittest import TestCase, mock
+
+import ornitho
+from ornitho import Catalog, Field, Species
+from ornitho.catalog import CATALOG_VERSION
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+class TestCatalog(TestCase):
+    def setUp(self):
+        self.tables = {
+            "taxo_groups": [{"id": "1", "name": "Vögel"}],
+            "families": [{"id": "2", "id_taxo_group": "1"}],
+            "species": [
+                {
+                    "id": "3",
+                    "latin_name": "Anas platyrhynchos",
+                    "german_name": "Stock|ente",
+                    "euring_id_species": {"#text": "1860"},
+                    "dda_id_species": "101",
+                },
+                {"id": "4", "latin_name": "Anas crecca"},
+            ],
+            "territorial_units": [{"id": "5", "name": "Berlin"}],
+            "local_admin_units": [{"id": "6", "name": "Mitte"}],
+            "fields": [{"id": "7", "name": "ACCURACY"}],
+        }
+        self.field_options = {
+            "7": [
+                {"id": "7_1", "id_field": "7", "name": "EXACT"},
+                {"id": "7_2", "id_field": "7", "name": "APPROXIMATE"},
+            ]
+        }
+        self.catalog = Catalog(tables=self.tables, field_options=self.field_options)
+
+    def test_lookups(self):
+        self.assertEqual(7, len(self.catalog))
+        self.assertEqual(1, self.catalog.taxo_group(1).id_)
+        self.assertEqual(2, self.catalog.family(2).id_)
+        self.assertEqual(5, self.catalog.territorial_unit(5).id_)
+        self.assertEqual(6, self.catalog.local_admin_unit(6).id_)
+        self.assertIsNone(self.catalog.species(99))
+
+        species = self.catalog.species(3)
+        self.assertIsInstance(species, Species)
+        self.assertEqual(
+            species, self.catalog.species_by_latin_name("anas PLATYRHYNCHOS")
+        )
+        self.assertEqual(species, self.catalog.species_by_german_name("Stockente"))
+        self.assertEqual(species, self.catalog.species_by_german_name("Stock|ente"))
+        self.assertEqual(species, self.catalog.species_by_german_name("STOCKENTE"))
+        self.assertEqual(species, self.catalog.species_by_euring_id(1860))
+        self.assertEqual(species, self.catalog.species_by_dda_id(101))
+        self.assertEqual(4, self.catalog.species_by_latin_name("Anas crecca").id_)
+
+        field = self.catalog.field(7)
+        self.assertIsInstance(field, Field)
+        self.assertEqual(["7_1", "7_2"], [option.id_ for option in field.options])
+        self.assertEqual("EXACT", self.catalog.field_option("7_1").name)
+        self.assertEqual("7_2", self.catalog.field_option_by_name("APPROXIMATE").id_)
+        self.assertEqual("7_1", self.catalog.field_option_by_name("EXACT", 7).id_)
+        self.assertIsNone(self.catalog.field_option_by_name("EXACT", 8))
+
+    @mock.patch("ornitho.catalog.APIRequester")
+    def test_fetch(self, mock_requester):
+        def request(method, url, request_all=False, retries=0):
+            if url.startswith("fields/"):
+                return self.field_options[url.split("/")[1]], None
+            return self.tables[url], None
+
+        mock_requester.return_value.__enter__.return_value.request.side_effect = request
+        catalog = Catalog.fetch()
+        self.assertEqual(self.tables, catalog.tables)
+        self.assertEqual(self.field_options, catalog.field_options)
+
+    def test_save_and_from_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "catalog.json")
+            self.catalog.save(path)
+            catalog = Catalog.from_file(path)
+            self.assertEqual(self.catalog.created, catalog.created)
+            self.assertEqual(self.tables, catalog.tables)
+            self.assertEqual(3, catalog.species_by_euring_id(1860).id_)
+
+            with open(path, "r") as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            self.assertEqual(CATALOG_VERSION, snapshot["version"])
+            self.assertEqual(ornitho.__version__, snapshot["ornitho_version"])
+
+            snapshot["version"] = CATALOG_VERSION + 1
+            with open(path, "w") as snapshot_file:
+                json.dump(snapshot, snapshot_file)
+            self.assertRaises(ValueError, Catalog.from_file, path)
+
+    @mock.patch.object(Catalog, "fetch")
+    def test_from_snapshot(self, mock_fetch):
+        mock_fetch.return_value = self.catalog
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "catalog.json")
+            Catalog.from_snapshot(path)
+            self.assertTrue(os.path.exists(path))
+            self.assertEqual(1, mock_fetch.call_count)
+
+            Catalog.from_snapshot(path, max_age=timedelta(days=1))
+            self.assertEqual(1, mock_fetch.call_count)
+
+            self.catalog.created = datetime.now().astimezone() - timedelta(days=2)
+            self.catalog.save(path)
+            Catalog.from_snapshot(path, max_age=timedelta(days=1))
+            self.assertEqual(2, mock_fetch.call_count)
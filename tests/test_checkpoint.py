@@ -0,0 +1,127 @@
+import json
+import os
+import tempfile
+from contextlib import ExitStack
+from datetime import date
+from itertools import islice
+from unittest import TestCase, mock
+
+import ornitho
+from ornitho import APIException, Checkpoint, Observation
+from ornitho.checkpoint import CHECKPOINT_VERSION
+from ornitho.testing import MockBiolovisionServer, synthetic_sightings
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+class TestCheckpoint(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "checkpoint.json")
+        self.checkpoint = Checkpoint(
+            self.path,
+            {"url": "observations/search", "body": {"date": date(2020, 1, 1)}},
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_save(self):
+        self.assertEqual(("pk", 0, [], 0), self.checkpoint.load("pk"))
+        self.checkpoint.save("pk2", 10, [{"id": "11"}, {"id": "12"}], 1)
+        self.assertEqual(
+            ("pk2", 10, [{"id": "11"}, {"id": "12"}], 1), self.checkpoint.load()
+        )
+        with open(self.path) as checkpoint_file:
+            self.assertEqual(
+                {
+                    "version": CHECKPOINT_VERSION,
+                    "query": {
+                        "url": "observations/search",
+                        "body": {"date": "2020-01-01"},
+                    },
+                    "pagination_key": "pk2",
+                    "records_emitted": 10,
+                    "page": [{"id": "11"}, {"id": "12"}],
+                    "page_consumed": 1,
+                },
+                json.load(checkpoint_file),
+            )
+        self.checkpoint.remove()
+        self.assertFalse(os.path.exists(self.path))
+        self.checkpoint.remove()
+
+    def test_load_other_query(self):
+        self.checkpoint.save("pk", 1)
+        self.assertRaises(
+            ValueError, Checkpoint(self.path, {"url": "observations"}).load
+        )
+
+    def test_load_other_version(self):
+        with open(self.path, "w") as checkpoint_file:
+            json.dump({"version": CHECKPOINT_VERSION + 1}, checkpoint_file)
+        self.assertRaises(ValueError, self.checkpoint.load)
+
+
+class TestCheckpointMockServer(TestCase):
+    def setUp(self):
+        self.server = MockBiolovisionServer(page_size=100)
+        self.server.add_sightings(synthetic_sightings(230))
+        self.server.start()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "checkpoint.json")
+        self.patches = ExitStack()
+        self.patches.enter_context(
+            mock.patch.object(ornitho, "api_base", self.server.api_base)
+        )
+
+    def tearDown(self):
+        self.patches.close()
+        self.directory.cleanup()
+        self.server.stop()
+
+    def iter_search(self):
+        return Observation.iter_search(checkpoint=self.path, period_choice="all")
+
+    def test_resume(self):
+        with self.iter_search() as iterator:
+            first = [observation.id_ for observation in islice(iterator, 120)]
+        self.assertEqual(list(range(1, 121)), first)
+
+        iterator = self.iter_search()
+        self.assertEqual(120, iterator.count)
+        rest = [observation.id_ for observation in iterator]
+        self.assertEqual(list(range(121, 231)), rest)
+        self.assertEqual(230, iterator.count)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_resume_without_close(self):
+        iterator = self.iter_search()
+        self.assertEqual(120, len(list(islice(iterator, 120))))
+        # Records consumed of the stored page since it was received are emitted again
+        rest = [observation.id_ for observation in self.iter_search()]
+        self.assertEqual(list(range(101, 231)), rest)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_resume_at_end_of_page(self):
+        with self.iter_search() as iterator:
+            self.assertEqual(100, len(list(islice(iterator, 100))))
+        rest = [observation.id_ for observation in self.iter_search()]
+        self.assertEqual(list(range(101, 231)), rest)
+
+    def test_resume_expired(self):
+        with self.iter_search() as iterator:
+            self.assertEqual(120, len(list(islice(iterator, 120))))
+        self.server._cursors.clear()
+
+        iterator = self.iter_search()
+        self.assertEqual(
+            list(range(121, 201)),
+            [observation.id_ for observation in islice(iterator, 80)],
+        )
+        self.assertRaises(APIException, next, iterator)
+        self.assertTrue(os.path.exists(self.path))
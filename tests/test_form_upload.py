@@ -0,0 +1,134 @@
+import json
+import os
+import tempfile
+import uuid
+from datetime import datetime
+from unittest import TestCase, mock
+
+import ornitho
+from ornitho import APIException, Form, FormUpload, Observation
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+class TestFormUpload(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.journal = os.path.join(self.directory.name, "journal.json")
+        self.observations = []
+        for count in range(5):
+            observation = Observation()
+            observation.count = count
+            self.observations.append(observation)
+        self.observations[0].guid = uuid.UUID("9dbe3de1-2ca2-4c1e-9f5c-7b1d6ee7bd01")
+        # GUIDs received by ornitho
+        self.landed = []
+        self.failing_count = None
+        self.create_form = mock.Mock(return_value=Form(446171))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def fake_create_in_ornitho(self, data, retries):
+        sightings = data["sightings"]
+        if any(
+            sighting["observers"][0]["count"] == str(self.failing_count)
+            for sighting in sightings
+        ):
+            raise APIException("Error")
+        self.landed += [sighting["observers"][0]["guid"] for sighting in sightings]
+        return 1
+
+    def fake_refresh(self, form, retries=0):
+        form._raw_data = {
+            "sightings": [{"observers": [{"guid": guid}]} for guid in self.landed]
+        }
+        return form
+
+    def run_upload(self):
+        with mock.patch.object(
+            Observation,
+            "raw_data_trim_field_ids",
+            autospec=True,
+            side_effect=lambda observation: observation._raw_data,
+        ), mock.patch.object(
+            Observation, "create_in_ornitho", side_effect=self.fake_create_in_ornitho
+        ) as create_in_ornitho, mock.patch.object(
+            Form, "refresh", autospec=True, side_effect=self.fake_refresh
+        ) as refresh:
+            upload = FormUpload(
+                self.journal, self.observations, chunk_size=2, max_in_flight=2
+            )
+            try:
+                return upload.run(self.create_form)
+            finally:
+                self.create_in_ornitho_calls = create_in_ornitho.call_count
+                self.refresh_calls = refresh.call_count
+
+    def test_run(self):
+        form = self.run_upload()
+        self.assertEqual(446171, form.id_)
+        self.assertEqual(3, self.create_in_ornitho_calls)
+        self.assertEqual(1, self.refresh_calls)
+        self.assertEqual(5, len(set(self.landed)))
+        self.assertIn("9dbe3de1-2ca2-4c1e-9f5c-7b1d6ee7bd01", self.landed)
+        for observation in self.observations:
+            self.assertEqual(446171, observation.id_form)
+        self.assertFalse(os.path.exists(self.journal))
+
+    def test_resume(self):
+        self.failing_count = 2
+        self.assertRaises(APIException, self.run_upload)
+        self.assertEqual(3, len(self.landed))
+        with open(self.journal) as journal_file:
+            journal = json.load(journal_file)
+        self.assertEqual(446171, journal["form_id"])
+        self.assertEqual(5, len(journal["guids"]))
+        self.assertEqual(
+            ["sent", "sending", "sent"], [chunk["state"] for chunk in journal["chunks"]]
+        )
+
+        # New observation objects, e.g. after a crash, get the journaled GUIDs
+        guids = [str(observation.guid) for observation in self.observations]
+        for observation in self.observations:
+            del observation._raw_data["observers"][0]["guid"]
+        self.failing_count = None
+        form = self.run_upload()
+        self.assertEqual(446171, form.id_)
+        self.create_form.assert_called_once()
+        # Only the missing chunk is sent, verified before and after
+        self.assertEqual(1, self.create_in_ornitho_calls)
+        self.assertEqual(2, self.refresh_calls)
+        self.assertEqual(sorted(guids), sorted(self.landed))
+        self.assertFalse(os.path.exists(self.journal))
+
+    def test_load_other_observations(self):
+        self.failing_count = 2
+        self.assertRaises(APIException, self.run_upload)
+        self.assertRaises(
+            ValueError, FormUpload(self.journal, self.observations[:4]).load
+        )
+        self.observations[1].guid = uuid.uuid4()
+        self.assertRaises(ValueError, FormUpload(self.journal, self.observations).load)
+
+    @mock.patch.object(FormUpload, "run")
+    def test_form_upload(self, run):
+        with mock.patch.object(Form, "create_empty") as create_empty:
+            Form.upload(
+                self.journal,
+                datetime.now().time(),
+                datetime.now().time(),
+                self.observations,
+                protocol="PROTOCOL",
+                max_in_flight=8,
+            )
+            run.call_args[0][0]()
+            self.assertEqual("PROTOCOL", create_empty.call_args[1]["protocol"])
+            self.assertIs(
+                self.observations[0],
+                create_empty.call_args[1]["template_observation"],
+            )
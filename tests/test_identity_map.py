@@ -0,0 +1,86 @@
+from unittest import TestCase, mock
+from unittest.mock import Mock
+
+import ornitho
+from ornitho import IdentityMap, Observation, Species
+
+
+class TestIdentityMap(TestCase):
+    def setUp(self):
+        self.identity_map = IdentityMap()
+        ornitho.identity_map_enabled = True
+
+    def tearDown(self):
+        ornitho.identity_map_enabled = False
+        ornitho.identity_map_maxsize = 10000
+        ornitho.identity_map_ttl = 600
+        ornitho.identity_map.clear()
+
+    def test_get_or_create(self):
+        factory = Mock(side_effect=lambda: Species(1))
+        species = self.identity_map.get_or_create(Species, 1, factory)
+        self.assertEqual(
+            species, self.identity_map.get_or_create(Species, "1", factory)
+        )
+        self.assertEqual(1, factory.call_count)
+        self.assertEqual(1, self.identity_map.hits)
+        self.assertEqual(1, self.identity_map.misses)
+        self.assertNotEqual(
+            species, self.identity_map.get_or_create(Observation, 1, Observation)
+        )
+
+        ornitho.identity_map_enabled = False
+        self.assertNotEqual(
+            species, self.identity_map.get_or_create(Species, 1, factory)
+        )
+        self.assertEqual(2, factory.call_count)
+
+    def test_lru(self):
+        ornitho.identity_map_maxsize = 2
+        self.identity_map.add(Species, 1, Species(1))
+        self.identity_map.add(Species, 2, Species(2))
+        self.identity_map.get(Species, 1)
+        self.identity_map.add(Species, 3, Species(3))
+        self.assertEqual(2, len(self.identity_map))
+        self.assertIsNotNone(self.identity_map.get(Species, 1))
+        self.assertIsNone(self.identity_map.get(Species, 2))
+
+    def test_ttl(self):
+        ornitho.identity_map_ttl = 10
+        with mock.patch("ornitho.identity_map.time.monotonic", return_value=100):
+            self.identity_map.add(Species, 1, Species(1))
+        with mock.patch("ornitho.identity_map.time.monotonic", return_value=105):
+            self.assertIsNotNone(self.identity_map.get(Species, 1))
+        with mock.patch("ornitho.identity_map.time.monotonic", return_value=111):
+            self.assertIsNone(self.identity_map.get(Species, 1))
+        self.assertEqual(0, len(self.identity_map))
+
+    def test_add(self):
+        species = Species(1)
+        self.assertEqual(species, self.identity_map.add(Species, 1, species))
+        self.assertEqual(species, self.identity_map.add(Species, 1, Species(1)))
+
+    def test_clear(self):
+        self.identity_map.get_or_create(Species, 1, lambda: Species(1))
+        self.identity_map.clear()
+        self.assertEqual(0, len(self.identity_map))
+        self.assertEqual(0, self.identity_map.misses)
+
+    def test_shared_species(self):
+        observations = [
+            Observation.create_from_ornitho_json(
+                {
+                    "observers": [{"id_sighting": str(i), "@id": "7", "count": str(i)}],
+                    "species": {"@id": "42", "name": "Foo"},
+                }
+            )
+            for i in range(3)
+        ]
+        self.assertEqual(1, len({id(obs.species) for obs in observations}))
+        # The observer record holds sighting specific values and is not shared
+        self.assertEqual(3, len({id(obs.observer) for obs in observations}))
+        self.assertEqual(
+            ["0", "1", "2"], [obs.observer._raw_data["count"] for obs in observations]
+        )
+        self.assertEqual(7, observations[2].observer.id_)
+        self.assertEqual(42, observations[2].species.id_)
@@ -0,0 +1,297 @@
+import math
+import sys
+from unittest import TestCase, mock
+from unittest.mock import MagicMock, Mock
+
+from requests.exceptions import ConnectionError
+
+import ornitho
+from ornitho import (
+    APIRequester,
+    Hooks,
+    MetricsCollector,
+    OpenTelemetryAdapter,
+    PrometheusAdapter,
+    RequestEvent,
+    RetryPolicy,
+)
+from ornitho.aio import AsyncAPIRequester
+from ornitho.instrumentation import EndpointMetrics, endpoint_name
+from ornitho.testing import MockBiolovisionServer, synthetic_sightings
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+def event(status=200, latency=0.1, method="get", endpoint="places/{id}"):
+    request_event = RequestEvent(method, endpoint, request_bytes=10)
+    request_event.status = status
+    request_event.latency = latency
+    request_event.response_bytes = 100
+    return request_event
+
+
+class TestEndpointName(TestCase):
+    def test_endpoint_name(self):
+        self.assertEqual("observations/{id}", endpoint_name("observations/123"))
+        self.assertEqual(
+            "observations/search",
+            endpoint_name(
+                "https://ornitho.de/api/observations/search?user_pw=secret",
+                "https://ornitho.de/api/",
+            ),
+        )
+        self.assertEqual("fields/{id}", endpoint_name("/fields/3/"))
+
+
+class TestHooks(TestCase):
+    def test_register(self):
+        hooks = Hooks()
+        self.assertFalse(hooks.active)
+        callback = MagicMock()
+        self.assertEqual(callback, hooks.register("on_page", callback))
+        self.assertTrue(hooks.active)
+        request_event = RequestEvent("get", "places")
+        hooks.emit("on_page", request_event)
+        hooks.emit("on_retry", request_event)
+        callback.assert_called_once_with(request_event)
+
+        hooks.unregister("on_page", callback)
+        self.assertFalse(hooks.active)
+        self.assertRaises(ValueError, lambda: hooks.register("unknown", callback))
+
+    def test_add_remove(self):
+        hooks = Hooks()
+        collector = MetricsCollector()
+        hooks.add(collector)
+        hooks.emit("after_response", event())
+        hooks.emit("before_request", event())
+        self.assertEqual(1, collector.get("GET", "places/{id}").count)
+        hooks.remove(collector)
+        self.assertFalse(hooks.active)
+        hooks.add(collector)
+        hooks.clear()
+        self.assertFalse(hooks.active)
+
+    def test_failing_callback(self):
+        hooks = Hooks()
+        callback = MagicMock()
+        hooks.register("after_response", MagicMock(side_effect=ValueError("broken")))
+        hooks.register("after_response", callback)
+        hooks.emit("after_response", event())
+        callback.assert_called_once()
+
+
+class TestRequestEvent(TestCase):
+    def test_received(self):
+        request_event = RequestEvent("post", "observations/search")
+        self.assertEqual("POST", request_event.method)
+        self.assertEqual("unknown", request_event.label)
+        request_event.received(
+            Mock(status_code=200, headers={"Content-Length": "23"}), 0.5
+        )
+        self.assertEqual(23, request_event.response_bytes)
+        self.assertEqual("200", request_event.label)
+
+        request_event = RequestEvent("get", "places")
+        request_event.received(Mock(status_code=200, headers={}, content=b"[]"), 0.5)
+        self.assertEqual(2, request_event.response_bytes)
+        request_event = RequestEvent("get", "places")
+        request_event.received(Mock(status_code=200, headers={}), 0.5, stream=True)
+        self.assertIsNone(request_event.response_bytes)
+
+        request_event.status = None
+        request_event.exception = ConnectionError()
+        self.assertEqual("ConnectionError", request_event.label)
+        self.assertIn("places", repr(request_event))
+
+
+class TestMetricsCollector(TestCase):
+    def test_collect(self):
+        collector = MetricsCollector(buckets=(0.1, 1.0, math.inf))
+        collector.after_response(event(latency=0.05))
+        collector.after_response(event(latency=0.5))
+        collector.after_response(event(status=503, latency=2.0))
+        retry = event(status=503)
+        retry.reason = "503"
+        collector.on_retry(retry)
+        page = RequestEvent("get", "places/{id}", page=2)
+        page.records = 7
+        collector.on_page(page)
+
+        metrics = collector.get("get", "places/{id}")
+        self.assertEqual(3, metrics.count)
+        self.assertEqual(1, metrics.errors)
+        self.assertEqual(1, metrics.retries)
+        self.assertEqual({"503": 1}, metrics.retry_reasons)
+        self.assertEqual({"200": 2, "503": 1}, metrics.statuses)
+        self.assertEqual(1, metrics.pages)
+        self.assertEqual(7, metrics.records)
+        self.assertEqual(2, metrics.max_page)
+        self.assertEqual(30, metrics.request_bytes)
+        self.assertEqual(300, metrics.response_bytes)
+        self.assertEqual([1, 1, 1], metrics.histogram)
+        self.assertAlmostEqual(0.85, metrics.latency_mean)
+        self.assertEqual(0.1, metrics.quantile(0.3))
+        self.assertEqual(1.0, metrics.quantile(0.5))
+        self.assertEqual(2.0, metrics.quantile(0.95))
+        self.assertIn("GET places/{id}", collector.report())
+        self.assertIn("count=3", repr(metrics))
+
+        collector.reset()
+        self.assertEqual({}, collector.endpoints)
+        self.assertEqual(0.0, EndpointMetrics().quantile(0.5))
+        self.assertEqual(0.0, EndpointMetrics().latency_mean)
+
+
+class TestAdapters(TestCase):
+    def test_prometheus(self):
+        prometheus_client = MagicMock()
+        with mock.patch.dict(sys.modules, {"prometheus_client": prometheus_client}):
+            adapter = PrometheusAdapter(registry="REGISTRY")
+        self.assertEqual(
+            "REGISTRY", prometheus_client.Histogram.call_args[1]["registry"]
+        )
+        adapter.after_response(event())
+        adapter.duration.labels.assert_called_with("GET", "places/{id}", "200")
+        adapter.duration.labels().observe.assert_called_with(0.1)
+        adapter.response_bytes.labels().inc.assert_called_with(100)
+
+        retry = event(status=None)
+        retry.exception = ConnectionError()
+        adapter.on_retry(retry)
+        adapter.retries.labels.assert_called_with(
+            "GET", "places/{id}", "ConnectionError"
+        )
+
+        page = event()
+        page.records = 5
+        adapter.on_page(page)
+        adapter.records.labels().inc.assert_called_with(5)
+
+    def test_open_telemetry(self):
+        meter = MagicMock()
+        adapter = OpenTelemetryAdapter(meter)
+        adapter.after_response(event())
+        adapter.duration.record.assert_called_with(
+            0.1,
+            {
+                "http.request.method": "GET",
+                "ornitho.endpoint": "places/{id}",
+                "http.response.status_code": 200,
+            },
+        )
+
+        retry = event(status=None)
+        retry.exception = ConnectionError()
+        adapter.on_retry(retry)
+        adapter.retries.add.assert_called_with(
+            1,
+            {
+                "http.request.method": "GET",
+                "ornitho.endpoint": "places/{id}",
+                "error.type": "ConnectionError",
+                "ornitho.retry.reason": "ConnectionError",
+            },
+        )
+
+        page = event()
+        page.records = 5
+        adapter.on_page(page)
+        adapter.records.add.assert_called_with(5, adapter.attributes(page))
+
+        metrics = MagicMock()
+        with mock.patch.dict(
+            sys.modules,
+            {"opentelemetry": MagicMock(metrics=metrics)},
+        ):
+            OpenTelemetryAdapter()
+        metrics.get_meter.assert_called_with("ornitho", ornitho.__version__)
+
+
+class TestRequesterInstrumentation(TestCase):
+    def setUp(self):
+        self.hooks = Hooks()
+        self.collector = self.hooks.add(MetricsCollector())
+        self.events = []
+        for name in ("before_request", "after_response", "on_retry", "on_page"):
+            self.hooks.register(
+                name, lambda request_event, name=name: self.events.append(name)
+            )
+
+    def test_send(self):
+        requester = APIRequester(
+            hooks=self.hooks, retry_policy=RetryPolicy(backoff_base=0, jitter=False)
+        )
+        requester.session.request = MagicMock(
+            side_effect=[
+                ConnectionError("reset"),
+                Mock(status_code=503, headers={}, content=b""),
+                Mock(
+                    status_code=200,
+                    headers={"Content-Type": "application/json; charset=utf-8"},
+                    content=b'{"data": [{"id": "1"}]}',
+                ),
+            ]
+        )
+        with mock.patch("ornitho.api_requester.time.sleep"):
+            requester.request_raw(
+                method="post", url="places/1", body={"a": "b"}, retries=2
+            )
+        self.assertEqual(
+            ["before_request", "after_response", "on_retry"] * 2
+            + ["before_request", "after_response"],
+            self.events,
+        )
+        metrics = self.collector.get("POST", "places/{id}")
+        self.assertEqual(3, metrics.count)
+        self.assertEqual(2, metrics.errors)
+        self.assertEqual({"ConnectionError": 1, "503": 1}, metrics.retry_reasons)
+        self.assertEqual(3 * len('{"a": "b"}'), metrics.request_bytes)
+        self.assertEqual(23, metrics.response_bytes)
+
+    def test_default_hooks(self):
+        self.assertIs(ornitho.hooks, APIRequester().hooks)
+        with mock.patch.object(ornitho, "hooks", self.hooks):
+            requester = APIRequester()
+            self.assertIs(self.hooks, requester.hooks)
+            self.assertIs(self.hooks, AsyncAPIRequester().hooks)
+        requester.session.request = MagicMock(
+            return_value=Mock(
+                status_code=200,
+                headers={"Content-Type": "application/json; charset=utf-8"},
+                content=b'{"data": []}',
+            )
+        )
+        requester.request_raw(method="get", url="places")
+        self.assertEqual(["before_request", "after_response"], self.events)
+        self.assertEqual(1, self.collector.get("GET", "places").count)
+
+    def test_pages(self):
+        with MockBiolovisionServer(page_size=3) as server:
+            server.add_sightings(synthetic_sightings(7))
+            with APIRequester(api_base=server.api_base, hooks=self.hooks) as requester:
+                data, pk = requester.request(
+                    method="post",
+                    url="observations/search",
+                    body={"period_choice": "all"},
+                    request_all=True,
+                )
+                self.assertEqual(7, len(data))
+                items = list(
+                    requester.iter_stream(
+                        method="post",
+                        url="observations/search",
+                        body={"period_choice": "all"},
+                    )
+                )
+                self.assertEqual(7, len(items))
+        metrics = self.collector.get("POST", "observations/search")
+        self.assertEqual(8, metrics.count)
+        self.assertEqual(8, metrics.pages)
+        self.assertEqual(14, metrics.records)
+        self.assertEqual(3, metrics.max_page)
+        self.assertGreater(metrics.response_bytes, 0)
@@ -0,0 +1,109 @@
+import json
+from unittest import TestCase, mock
+
+import ornitho
+from ornitho import APIException, json_decoder
+
+
+class TestJsonDecoder(TestCase):
+    def tearDown(self):
+        ornitho.json_backend = "auto"
+
+    def test_backend(self):
+        ornitho.json_backend = "json"
+        self.assertEqual(json.loads, json_decoder.backend())
+
+        ornitho.json_backend = "auto"
+        with mock.patch("ornitho.json_decoder.orjson", None), mock.patch(
+            "ornitho.json_decoder.ujson", None
+        ):
+            self.assertEqual(json.loads, json_decoder.backend())
+        orjson = mock.Mock()
+        with mock.patch("ornitho.json_decoder.orjson", orjson):
+            self.assertEqual(orjson.loads, json_decoder.backend())
+
+        ornitho.json_backend = "ujson"
+        with mock.patch("ornitho.json_decoder.ujson", None):
+            self.assertRaises(RuntimeError, json_decoder.backend)
+
+    def test_strip_banner(self):
+        banner = json_decoder.BANNERS[0]
+        self.assertEqual(b'{"data": []}', json_decoder.strip_banner(b'{"data": []}'))
+        self.assertEqual(
+            b'{"data": []}', json_decoder.strip_banner(banner + b'\n{"data": []}')
+        )
+        self.assertEqual(b"", json_decoder.strip_banner(banner))
+        self.assertEqual(
+            b'{"banner": "' + banner + b'"}',
+            json_decoder.strip_banner(b'{"banner": "' + banner + b'"}'),
+        )
+
+    def test_loads(self):
+        self.assertEqual(
+            {"data": [{"id": "1"}]}, json_decoder.loads(b'{"data": [{"id": "1"}]}')
+        )
+        self.assertEqual({}, json_decoder.loads(b""))
+        self.assertEqual(
+            {"data": []},
+            json_decoder.loads(json_decoder.BANNERS[0] + b'\n{"data": []}'),
+        )
+        self.assertRaises(APIException, json_decoder.loads, b"no json")
+
+        # Fallback to the standard library
+        orjson = mock.Mock()
+        orjson.loads.side_effect = ValueError("NaN")
+        with mock.patch("ornitho.json_decoder.orjson", orjson):
+            self.assertEqual({"value": 1}, json_decoder.loads(b'{"value": 1}'))
+
+    def test_iter_items(self):
+        document = (
+            b'{"data": {"sightings": [{"id": 1, "nested": {"id": 2}}, {"id": 3.5}]}}'
+        )
+        chunks = [document[i : i + 3] for i in range(0, len(document), 3)]
+        self.assertEqual(
+            [
+                ("data.sightings.item", {"id": 1, "nested": {"id": 2}}, None),
+                ("data.sightings.item", {"id": 3.5}, None),
+            ],
+            list(json_decoder.iter_items(chunks, {"data.sightings.item"})),
+        )
+        self.assertRaises(
+            APIException,
+            lambda: list(json_decoder.iter_items([b'{"data": [}'], {"data.item"})),
+        )
+
+        # Objects within parents
+        document = (
+            b'{"data": {"forms": [{"id": "1", "protocol": {"name": "x", "ids": [1]}, '
+            b'"sightings": [{"id": 2}, {"id": 3}], "comment": "late"}, '
+            b'{"id": "4", "sightings": [{"id": 5}]}]}}'
+        )
+        chunks = [document[i : i + 3] for i in range(0, len(document), 3)]
+        items = []
+        for prefix, item, header in json_decoder.iter_items(
+            chunks, {"data.forms.item.sightings.item"}, {"data.forms.item"}
+        ):
+            # The header holds the members preceding the sightings, when a sighting is yielded
+            items.append((item, dict(header)))
+        self.assertEqual(
+            [
+                ({"id": 2}, {"id": "1", "protocol": {"name": "x", "ids": [1]}}),
+                ({"id": 3}, {"id": "1", "protocol": {"name": "x", "ids": [1]}}),
+                ({"id": 5}, {"id": "4"}),
+            ],
+            items,
+        )
+        headers = [
+            header
+            for _, _, header in json_decoder.iter_items(
+                [document], {"data.forms.item.sightings.item"}, {"data.forms.item"}
+            )
+        ]
+        self.assertIs(headers[0], headers[1])
+        self.assertEqual("late", headers[0]["comment"])
+
+        with mock.patch("ornitho.json_decoder.ijson", None):
+            self.assertRaises(
+                RuntimeError,
+                lambda: list(json_decoder.iter_items([document], {"item"})),
+            )
@@ -0,0 +1,144 @@
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+from unittest import TestCase, mock
+
+import ornitho
+from ornitho import ModificationType, Observation, ObservationMirror
+from ornitho.testing import MockBiolovisionServer, synthetic_sightings
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+def sighting(id_, id_species=94, count=1):
+    return {
+        "species": {"@id": str(id_species)},
+        "place": {"@id": "7"},
+        "observers": [
+            {
+                "@id": "3",
+                "id_sighting": str(id_),
+                "timing": {"@timestamp": str(1573858800 + id_)},
+                "count": str(count),
+            }
+        ],
+    }
+
+
+class TestObservationMirror(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.mirror = ObservationMirror(
+            os.path.join(self.directory.name, "mirror.db"), chunk_size=2
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def load(self):
+        with mock.patch(
+            "ornitho.mirror.APIRequester.iter_pages",
+            return_value=iter(
+                [([sighting(1), sighting(2)], "pk"), ([sighting(3, 95)], None)]
+            ),
+        ) as iter_pages:
+            self.assertEqual(
+                3, self.mirror.load(period_choice="all", date_from=date(2019, 11, 1))
+            )
+            self.assertEqual(
+                {"period_choice": "all", "date_from": date(2019, 11, 1)},
+                iter_pages.call_args[1]["body"],
+            )
+        self.assertEqual(
+            {"period_choice": "all", "date_from": "01.11.2019"},
+            self.mirror.load_filters,
+        )
+
+    def test_load(self):
+        self.assertIsNone(self.mirror.high_water_mark)
+        self.load()
+        self.assertEqual(3, len(self.mirror))
+        self.assertIn(2, self.mirror)
+        self.assertNotIn(4, self.mirror)
+        self.assertIsNotNone(self.mirror.high_water_mark)
+
+        observation = self.mirror.get(1)
+        self.assertIsInstance(observation, Observation)
+        self.assertEqual(94, observation.id_species)
+        self.assertIsNone(self.mirror.get(4))
+
+    def test_search(self):
+        self.load()
+        self.assertEqual([1, 2], [obs.id_ for obs in self.mirror.search(id_species=94)])
+        self.assertEqual([3], [obs.id_ for obs in self.mirror.search(id_species=95)])
+        self.assertEqual(
+            [2, 3],
+            [
+                obs.id_
+                for obs in self.mirror.search(
+                    id_observer=3,
+                    date_from=datetime.fromtimestamp(1573858802),
+                )
+            ],
+        )
+        self.assertEqual([], self.mirror.search(id_place=8))
+
+    def test_sync(self):
+        self.assertRaises(RuntimeError, self.mirror.sync)
+        self.load()
+        high_water_mark = self.mirror.high_water_mark
+        with mock.patch.object(
+            Observation, "diff_ids", return_value=([1, 4, 2], [3])
+        ) as diff_ids, mock.patch(
+            "ornitho.mirror.APIRequester.request",
+            side_effect=[([sighting(1, count=5), sighting(4)], None), ([], None)],
+        ) as request:
+            result = self.mirror.sync()
+            self.assertEqual(high_water_mark, diff_ids.call_args[1]["date"])
+            self.assertEqual(
+                {
+                    "period_choice": "all",
+                    "date_from": "01.11.2019",
+                    "id_sightings_list": [1, 4],
+                },
+                request.call_args_list[0][1]["body"],
+            )
+            self.assertTrue(request.call_args_list[0][1]["request_all"])
+
+        self.assertEqual(
+            {
+                ModificationType.ONLY_MODIFIED: [1, 4, 2],
+                ModificationType.ONLY_DELETED: [3],
+            },
+            result,
+        )
+        self.assertEqual(5, self.mirror.get(1).count)
+        self.assertIn(4, self.mirror)
+        # Not found by the search anymore
+        self.assertNotIn(2, self.mirror)
+        self.assertNotIn(3, self.mirror)
+        self.assertGreaterEqual(self.mirror.high_water_mark, high_water_mark)
+
+    def test_sync_scope(self):
+        # Other test modules replace Observation.request with a mock
+        base_request = next(
+            base.__dict__["request"]
+            for base in Observation.__mro__[1:]
+            if "request" in base.__dict__
+        )
+        with MockBiolovisionServer() as server, mock.patch.object(
+            ornitho, "api_base", server.api_base
+        ), mock.patch.object(Observation, "request", base_request):
+            server.add_sightings(synthetic_sightings(3, id_species=94))
+            server.add_sightings(synthetic_sightings(2, start_id=10, id_species=95))
+            self.assertEqual(3, self.mirror.load(period_choice="all", id_species=94))
+
+            later = datetime.now() + timedelta(seconds=2)
+            server.modify("observations", 1, at=later)
+            server.modify("observations", 10, at=later)
+            self.mirror.sync()
+        self.assertEqual([1, 2, 3], sorted(obs.id_ for obs in self.mirror.search()))
@@ -0,0 +1,155 @@
+import logging
+import os
+import tempfile
+from unittest import TestCase, mock
+from unittest.mock import MagicMock
+
+import ornitho
+from ornitho import APIRequester
+from ornitho.payload_log import (
+    Summary,
+    dump_payload,
+    response_extension,
+    summarize,
+    tee_payload,
+)
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+class TestSummarize(TestCase):
+    def test_summarize(self):
+        body = {
+            "data": {
+                "forms": [
+                    {"sightings": [{"id": i} for i in range(128)], "comment": "x" * 100}
+                ]
+            },
+            "ids": [1, 2],
+            "filter": {"a": {"b": {"c": 1}}},
+        }
+        self.assertEqual(
+            "{'data': {'forms': [{2 keys}]}, 'ids': [1, 2], 'filter': {'a': {'b': {1 keys}}}}",
+            summarize(body),
+        )
+        body["data"]["forms"] = body["data"]["forms"][0]
+        self.assertEqual(
+            "{'sightings': [128 items], 'comment': 'xxxxxxxxx...(102 chars)}",
+            summarize(body["data"]["forms"], max_length=10),
+        )
+        self.assertEqual("None", str(Summary(None)))
+        self.assertEqual("[4 items]", repr(Summary((1, 2, 3, 4))))
+
+    def test_lazy(self):
+        with mock.patch.object(
+            ornitho.logger, "isEnabledFor", return_value=False
+        ), mock.patch("ornitho.payload_log.summarize") as mock_summarize:
+            APIRequester().prepare_request(
+                method="post", url="observations", body={"data": [1, 2, 3, 4]}
+            )
+        mock_summarize.assert_not_called()
+
+    def test_log_request(self):
+        with self.assertLogs(ornitho.logger, logging.INFO) as logs:
+            APIRequester().prepare_request(
+                method="post",
+                url="observations",
+                body={"data": {"sightings": [{"id": i} for i in range(128)]}},
+            )
+        self.assertIn("body={'data': {'sightings': [128 items]}}", logs.output[0])
+        self.assertEqual("post", logs.records[0].ornitho_method)
+        self.assertGreater(logs.records[0].ornitho_body_bytes, 1000)
+
+
+class TestDumpPayload(TestCase):
+    def test_dump_payload(self):
+        self.assertIsNone(dump_payload("get", "places", "response", b"[]"))
+        with tempfile.TemporaryDirectory() as directory:
+            path = dump_payload(
+                "GET", "places/{id}?x=1", "response", "[]", directory=directory
+            )
+            self.assertTrue(path.endswith("-get-places_id-response.json"))
+            with open(path) as payload_file:
+                self.assertEqual("[]", payload_file.read())
+
+    def test_tee_payload(self):
+        self.assertEqual([b"[", b"]"], list(tee_payload([b"[", b"]"], "get", "x", "r")))
+        with tempfile.TemporaryDirectory() as directory:
+            chunks = tee_payload(
+                iter([b'{"data": ', b"[]}"]),
+                "get",
+                "places",
+                "response",
+                directory=directory,
+            )
+            self.assertEqual([b'{"data": ', b"[]}"], list(chunks))
+            files = os.listdir(directory)
+            self.assertEqual(1, len(files))
+            with open(os.path.join(directory, files[0]), "rb") as payload_file:
+                self.assertEqual(b'{"data": []}', payload_file.read())
+
+    def test_response_extension(self):
+        self.assertEqual(
+            "json",
+            response_extension({"Content-Type": "application/json; charset=utf-8"}),
+        )
+        self.assertEqual("pdf", response_extension({"Content-Type": "application/pdf"}))
+        self.assertEqual(
+            "html", response_extension({"Content-Type": "text/html; charset=UTF-8"})
+        )
+        self.assertEqual("bin", response_extension({}))
+
+    def test_requester(self):
+        requester = APIRequester()
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch("ornitho.log_payload_dir", directory):
+                requester.prepare_request(
+                    method="post", url="observations/search", body={"a": "b"}
+                )
+                requester.handle_response(
+                    "post",
+                    MagicMock(
+                        url="ORNITHO_API_BASEobservations/search?user_pw=secret",
+                        headers={"Content-Type": "application/json"},
+                        content=b'{"data": []}',
+                    ),
+                )
+            files = sorted(os.listdir(directory))
+            self.assertEqual(2, len(files))
+            self.assertTrue(files[0].endswith("-post-observations_search-request.json"))
+            self.assertTrue(
+                files[1].endswith("-post-observations_search-response.json")
+            )
+
+    def test_requester_stream(self):
+        requester = APIRequester()
+        content = b'{"data": [{"id": "1"}, {"id": "2"}]}'
+        requester.session.request = MagicMock(
+            return_value=MagicMock(
+                status_code=200,
+                url="ORNITHO_API_BASEobservations/search?user_pw=secret",
+                headers={"Content-Type": "application/json"},
+                iter_content=MagicMock(
+                    return_value=(content[i : i + 4] for i in range(0, len(content), 4))
+                ),
+            )
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch("ornitho.log_payload_dir", directory):
+                data = list(
+                    requester.iter_stream(
+                        "post", "observations/search", request_all=False
+                    )
+                )
+            self.assertEqual(["1", "2"], [item["id"] for item in data])
+            files = sorted(os.listdir(directory))
+            self.assertEqual(1, len(files))
+            self.assertTrue(
+                files[0].endswith("-post-observations_search-response.json")
+            )
+            with open(os.path.join(directory, files[0]), "rb") as payload_file:
+                self.assertEqual(content, payload_file.read())
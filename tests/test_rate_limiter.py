@@ -0,0 +1,157 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+from unittest.mock import MagicMock, Mock
+
+import ornitho
+from ornitho import (
+    APIRequester,
+    RateLimiter,
+    RedisRateLimiter,
+    SQLiteRateLimiter,
+    get_rate_limiter,
+)
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+class TestRateLimiter(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        ornitho.rate_limit_name = "ornitho_rate_limit"
+        ornitho.rate_limit = None
+        ornitho.rate_limit_burst = 1
+        ornitho.max_in_flight = None
+        ornitho.rate_limit_backend = "memory"
+        ornitho.rate_limit_lease_timeout = 300.0
+
+    def test_take_token(self):
+        # Full bucket
+        self.assertEqual((1.0, 10.0, 0.0), RateLimiter.take_token(2, None, 10, 2, 2))
+        # Empty bucket, next token in 0.5 seconds
+        self.assertEqual((-1.0, 10.0, 0.5), RateLimiter.take_token(0, 10, 10, 2, 2))
+        # Refilled bucket, limited by burst
+        self.assertEqual((1.0, 20.0, 0.0), RateLimiter.take_token(-1, 10, 20, 2, 2))
+
+    @mock.patch("ornitho.rate_limiter.time")
+    def test_reserve(self, mock_time):
+        mock_time.monotonic.return_value = 100
+        rate_limiter = RateLimiter(rate=2, burst=2)
+        self.assertEqual([0, 0, 0.5, 1.0], [rate_limiter.reserve() for _ in range(4)])
+        mock_time.monotonic.return_value = 102
+        self.assertEqual(0, rate_limiter.reserve())
+        self.assertEqual(0, RateLimiter().reserve())
+
+    @mock.patch("ornitho.rate_limiter.time")
+    def test_limit(self, mock_time):
+        mock_time.monotonic.return_value = 100
+        rate_limiter = RateLimiter(rate=1, max_in_flight=1)
+        with rate_limiter.limit():
+            self.assertFalse(rate_limiter._in_flight.acquire(blocking=False))
+        with rate_limiter.limit():
+            pass
+        mock_time.sleep.assert_called_once_with(1.0)
+        self.assertTrue(rate_limiter._in_flight.acquire(blocking=False))
+
+    @mock.patch("ornitho.rate_limiter.time")
+    def test_sqlite_rate_limiter(self, mock_time):
+        mock_time.time.return_value = 100
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "rate_limit.sqlite")
+            rate_limiter = SQLiteRateLimiter(path, rate=2, burst=1, max_in_flight=1)
+            other_process = SQLiteRateLimiter(path, rate=2, burst=1, max_in_flight=1)
+            self.assertEqual(0, rate_limiter.reserve())
+            self.assertEqual(0.5, other_process.reserve())
+
+            lease = rate_limiter.enter()
+            mock_time.sleep.side_effect = lambda delay: rate_limiter.leave(lease)
+            other_lease = other_process.enter()
+            mock_time.sleep.assert_called_once_with(SQLiteRateLimiter.POLL_INTERVAL)
+            self.assertNotEqual(lease, other_lease)
+            other_process.leave(other_lease)
+
+    @mock.patch("ornitho.rate_limiter.time")
+    def test_sqlite_rate_limiter_lease_timeout(self, mock_time):
+        mock_time.time.return_value = 100
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "rate_limit.sqlite")
+            crashed_process = SQLiteRateLimiter(path, max_in_flight=1, lease_timeout=30)
+            other_process = SQLiteRateLimiter(path, max_in_flight=1, lease_timeout=30)
+
+            # The crashed process never leaves its slot, which is freed after the lease timeout
+            crashed_process.enter()
+            mock_time.time.side_effect = [110, 130, 131]
+            other_process.enter()
+            mock_time.sleep.assert_called_once_with(SQLiteRateLimiter.POLL_INTERVAL)
+
+    @mock.patch("ornitho.rate_limiter.time")
+    def test_redis_rate_limiter(self, mock_time):
+        mock_time.time.return_value = 100
+        connection = Mock()
+        take_token = Mock(return_value=b"0.25")
+        enter = Mock(side_effect=[0, 1])
+        connection.register_script.side_effect = [take_token, enter]
+        rate_limiter = RedisRateLimiter(
+            "limit", rate=4, max_in_flight=1, connection=connection, lease_timeout=30
+        )
+        self.assertEqual(0.25, rate_limiter.reserve())
+        lease = rate_limiter.enter()
+        mock_time.sleep.assert_called_once_with(RedisRateLimiter.POLL_INTERVAL)
+        enter.assert_called_with(keys=["limit:in_flight"], args=[1, 100, 30, lease])
+        rate_limiter.leave(lease)
+        connection.zrem.assert_called_once_with("limit:in_flight", lease)
+
+    def test_get_rate_limiter(self):
+        self.assertIsNone(get_rate_limiter())
+        ornitho.rate_limit = 5
+        rate_limiter = get_rate_limiter()
+        self.assertIsInstance(rate_limiter, RateLimiter)
+        self.assertEqual(5, rate_limiter.rate)
+        self.assertEqual(rate_limiter, get_rate_limiter())
+        ornitho.max_in_flight = 2
+        self.assertNotEqual(rate_limiter, get_rate_limiter())
+        ornitho.rate_limit_backend = "sqlite"
+        ornitho.rate_limit_name = os.path.join(self.tmp_dir.name, "ornitho_rate_limit")
+        ornitho.rate_limit_lease_timeout = 60
+        self.assertEqual(60, get_rate_limiter().lease_timeout)
+        ornitho.rate_limit_backend = "unknown"
+        self.assertRaises(RuntimeError, get_rate_limiter)
+
+    @mock.patch("ornitho.api_requester.get_rate_limiter")
+    def test_request_raw(self, mock_get_rate_limiter):
+        requester = APIRequester(pooled=False)
+        requester.session.request = MagicMock(
+            return_value=Mock(
+                status_code=200,
+                headers={"Content-Type": "application/json; charset=utf-8"},
+                content=b'{"data": []}',
+            )
+        )
+        requester.request_raw(method="get", url="test")
+        rate_limiter = mock_get_rate_limiter.return_value
+        rate_limiter.acquire.assert_called_once_with()
+        rate_limiter.release.assert_called_once_with(rate_limiter.acquire.return_value)
+
+    @mock.patch("ornitho.api_requester.get_rate_limiter")
+    def test_send_stream(self, mock_get_rate_limiter):
+        rate_limiter = mock_get_rate_limiter.return_value
+        rate_limiter.acquire.return_value = "lease"
+        response = Mock(status_code=200, headers={})
+        close = response.close
+        requester = APIRequester(pooled=False)
+        requester.session.request = MagicMock(return_value=response)
+
+        # The in-flight slot of a streamed response is held until it is closed
+        self.assertIs(response, requester.send("get", "test", None, stream=True))
+        rate_limiter.release.assert_not_called()
+        response.close()
+        response.close()
+        close.assert_called_with()
+        rate_limiter.release.assert_called_once_with("lease")
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    ConnectTimeout,
+    ReadTimeout,
+)
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from ornitho import RetryPolicy
+
+
+class TestRetryPolicy(TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(backoff_base=0.5, backoff_cap=4, jitter=False)
+
+    def test_is_retryable(self):
+        self.assertTrue(self.policy.is_retryable_status(503))
+        self.assertTrue(self.policy.is_retryable_status(429))
+        self.assertFalse(self.policy.is_retryable_status(401))
+        self.assertFalse(self.policy.is_retryable_status(404))
+        self.assertTrue(self.policy.is_retryable_exception(ConnectionError()))
+        self.assertFalse(
+            RetryPolicy(retry_connection_errors=False).is_retryable_exception(
+                ConnectionError()
+            )
+        )
+        self.assertTrue(RetryPolicy(retry_statuses=[500]).is_retryable_status(500))
+
+    def test_is_retryable_non_idempotent(self):
+        self.assertTrue(self.policy.is_retryable_status(429, idempotent=False))
+        self.assertTrue(self.policy.is_retryable_status(503, idempotent=False))
+        self.assertFalse(self.policy.is_retryable_status(502, idempotent=False))
+        self.assertFalse(self.policy.is_retryable_status(504, idempotent=False))
+
+        refused = RequestsConnectionError(
+            MaxRetryError(None, "url", NewConnectionError(None, "refused"))
+        )
+        self.assertTrue(self.policy.is_retryable_exception(ConnectTimeout(), False))
+        self.assertTrue(self.policy.is_retryable_exception(refused, False))
+        self.assertFalse(self.policy.is_retryable_exception(ReadTimeout(), False))
+        self.assertFalse(
+            self.policy.is_retryable_exception(RequestsConnectionError(), False)
+        )
+        self.assertTrue(self.policy.is_retryable_exception(ReadTimeout()))
+
+    def test_delay(self):
+        self.assertEqual(
+            [0.5, 1, 2, 4, 4], [self.policy.delay(attempt) for attempt in range(5)]
+        )
+        jitter_policy = RetryPolicy(backoff_base=1, backoff_cap=2)
+        for attempt in range(5):
+            self.assertTrue(0 <= jitter_policy.delay(attempt) <= 2)
+
+        response = Mock(headers={"Retry-After": "10"})
+        self.assertEqual(10, self.policy.delay(0, response))
+        self.assertEqual(
+            0.5, RetryPolicy(jitter=False, respect_retry_after=False).delay(0, response)
+        )
+        self.assertEqual(0.5, self.policy.delay(0, Mock(headers={})))
+
+    def test_delay_max_retry_after(self):
+        response = Mock(headers={"Retry-After": "86400"})
+        self.assertEqual(300, self.policy.delay(0, response))
+        self.assertEqual(60, RetryPolicy(max_retry_after=60).delay(0, response))
+        retry_date = datetime.now(timezone.utc) + timedelta(days=1)
+        self.assertEqual(
+            60,
+            RetryPolicy(max_retry_after=60).delay(
+                0, Mock(headers={"Retry-After": format_datetime(retry_date)})
+            ),
+        )
+
+    def test_retry_after(self):
+        retry_date = datetime.now(timezone.utc) + timedelta(seconds=60)
+        retry_after = RetryPolicy.retry_after(
+            Mock(headers={"Retry-After": format_datetime(retry_date)})
+        )
+        self.assertTrue(55 < retry_after <= 60)
+        self.assertIsNone(
+            RetryPolicy.retry_after(Mock(headers={"Retry-After": "soon"}))
+        )
+
+    def test_metrics(self):
+        self.policy.record("503")
+        self.policy.record("503")
+        self.policy.record("ConnectionError")
+        self.assertEqual(3, self.policy.retry_count)
+        self.assertEqual(
+            {"503": 2, "ConnectionError": 1}, self.policy.retries_by_reason
+        )
+        self.policy.reset_metrics()
+        self.assertEqual(0, self.policy.retry_count)
+        self.assertEqual({}, self.policy.retries_by_reason)
@@ -0,0 +1,45 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import ornitho
+from ornitho import SessionRegistry
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+class TestSessionRegistry(TestCase):
+    def setUp(self):
+        self.registry = SessionRegistry()
+
+    def test_get(self):
+        session = self.registry.get("KEY", "SECRET", "MAIL", "BASE")
+        self.assertEqual(session, self.registry.get("KEY", "SECRET", "MAIL", "BASE"))
+        self.assertNotEqual(
+            session, self.registry.get("KEY", "SECRET", "OTHER_MAIL", "BASE")
+        )
+        self.assertEqual(2, len(self.registry))
+
+    def test_close(self):
+        session = self.registry.get("KEY", "SECRET", "MAIL", "BASE")
+        session.close = Mock()
+        self.registry.close()
+        session.close.assert_called()
+        self.assertEqual(0, len(self.registry))
+        self.assertNotEqual(session, self.registry.get("KEY", "SECRET", "MAIL", "BASE"))
+
+    def test_create_session(self):
+        ornitho.pool_maxsize = 42
+        session = SessionRegistry.create_session("KEY", "SECRET")
+        self.assertEqual(42, session.get_adapter("https://example.org")._pool_maxsize)
+        ornitho.pool_maxsize = 10
+
+    def test_shutdown(self):
+        session = ornitho.session_registry.get("KEY", "SECRET", "MAIL", "BASE")
+        session.close = Mock()
+        ornitho.shutdown()
+        session.close.assert_called()
+        self.assertEqual(0, len(ornitho.session_registry))
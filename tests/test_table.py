@@ -0,0 +1,129 @@
+import array
+import math
+from unittest import TestCase, skipUnless
+
+import ornitho
+from ornitho import Observation
+from ornitho.table import MISSING_INT, Column, TableBuilder, numpy, pyarrow, raw_value
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+class TestTableBuilder(TestCase):
+    def setUp(self):
+        self.raw_columns = {
+            "id_": Column(
+                "q", raw_value("observers", 0, "id_sighting"), nullable=False
+            ),
+            "id_form": Column(
+                "q", raw_value("observers", 0, "id_form"), nullable=False
+            ),
+            "timing": Column(
+                "q", raw_value("observers", 0, "timing", "@timestamp"), timestamp=True
+            ),
+            "coord_lat": Column("d", raw_value("observers", 0, "coord_lat")),
+            "count": Column("q", raw_value("observers", 0, "count")),
+        }
+        self.pages = [
+            [
+                {
+                    "observers": [
+                        {
+                            "id_sighting": "1",
+                            "timing": {"@timestamp": "1573858800"},
+                            "coord_lat": "51.5",
+                            "altitude": "10",
+                            "count": "0",
+                        }
+                    ]
+                },
+                {"observers": [{"id_sighting": "2", "id_form": "7"}]},
+            ],
+            [],
+            [{"observers": [{"id_sighting": "3", "coord_lat": "52.0"}]}],
+        ]
+
+    def build(self, backend, columns=("id_", "timing", "coord_lat")):
+        builder = TableBuilder(Observation, columns, self.raw_columns, backend)
+        for page in self.pages:
+            builder.append_page(page)
+        self.assertEqual(3, builder.count)
+        return builder.build()
+
+    def test_raw_value(self):
+        self.assertEqual("1", raw_value("a", 0, "b")({"a": [{"b": "1"}]}))
+
+    def test_array(self):
+        table = self.build("array")
+        self.assertEqual(array.array("q", [1, 2, 3]), table["id_"])
+        self.assertEqual([1573858800, None, None], table["timing"])
+        self.assertEqual(51.5, table["coord_lat"][0])
+        self.assertTrue(math.isnan(table["coord_lat"][1]))
+
+    def test_missing_values(self):
+        table = self.build("array", columns=("id_form", "timing", "count"))
+        self.assertEqual(
+            array.array("q", [MISSING_INT, 7, MISSING_INT]), table["id_form"]
+        )
+        self.assertEqual([None, None], table["timing"][1:])
+        self.assertEqual([0, None, None], table["count"])
+
+    @skipUnless(numpy is not None, "numpy is not installed")
+    def test_numpy_missing_values(self):
+        table = self.build("numpy", columns=("id_form", "timing", "count"))
+        self.assertEqual([MISSING_INT, 7, MISSING_INT], table["id_form"].tolist())
+        self.assertEqual([False, True, True], numpy.isnat(table["timing"]).tolist())
+        self.assertEqual([0, None, None], table["count"].tolist())
+
+    @skipUnless(pyarrow is not None, "pyarrow is not installed")
+    def test_pyarrow_missing_values(self):
+        table = self.build("pyarrow", columns=("id_form", "timing", "count"))
+        self.assertEqual(
+            [MISSING_INT, 7, MISSING_INT], table.column("id_form").to_pylist()
+        )
+        self.assertEqual(2, table.column("timing").null_count)
+        self.assertEqual([None, None], table.column("timing").to_pylist()[1:])
+        self.assertEqual([0, None, None], table.column("count").to_pylist())
+
+    def test_property_column(self):
+        table = self.build("array", columns=("id_", "altitude"))
+        self.assertEqual([10, None, None], table["altitude"])
+
+    def test_unknown_column(self):
+        self.assertRaises(
+            ValueError, TableBuilder, Observation, ["unknown"], {}, "array"
+        )
+
+    def test_unknown_backend(self):
+        self.assertRaises(
+            RuntimeError, TableBuilder, Observation, ["id_"], self.raw_columns, "csv"
+        )
+
+    @skipUnless(numpy is not None, "numpy is not installed")
+    def test_numpy(self):
+        table = self.build("numpy")
+        self.assertEqual([1, 2, 3], table["id_"].tolist())
+        self.assertEqual("int64", table["id_"].dtype.name)
+        self.assertEqual(
+            numpy.datetime64("2019-11-15T23:00:00", "s"), table["timing"][0]
+        )
+        self.assertEqual(52.0, table["coord_lat"][2])
+
+    @skipUnless(pyarrow is not None, "pyarrow is not installed")
+    def test_pyarrow(self):
+        table = self.build("pyarrow")
+        self.assertEqual(3, table.num_rows)
+        self.assertEqual(2, len(table.to_batches()))
+        self.assertEqual([1, 2, 3], table.column("id_").to_pylist())
+        self.assertEqual(pyarrow.timestamp("s", tz="UTC"), table.schema.field(1).type)
+        self.assertEqual(52.0, table.column("coord_lat").to_pylist()[2])
+
+    @skipUnless(pyarrow is not None, "pyarrow is not installed")
+    def test_pyarrow_empty(self):
+        self.pages = []
+        builder = TableBuilder(Observation, ["id_"], self.raw_columns, "pyarrow")
+        self.assertEqual(0, builder.build().num_rows)
@@ -0,0 +1,225 @@
+import os
+import tempfile
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from unittest import TestCase, mock
+
+import requests
+
+import ornitho
+from ornitho import APIRequester, Field, Form, Observation, Place, RetryPolicy
+from ornitho.api_exception import ObjectNotFoundException, ServiceUnavailableException
+from ornitho.testing import (
+    MockBiolovisionServer,
+    synthetic_fields,
+    synthetic_form,
+    synthetic_places,
+    synthetic_sightings,
+)
+
+ornitho.consumer_key = "ORNITHO_CONSUMER_KEY"
+ornitho.consumer_secret = "ORNITHO_CONSUMER_SECRET"
+ornitho.user_email = "ORNITHO_USER_EMAIL"
+ornitho.user_pw = "ORNITHO_USER_PW"
+ornitho.api_base = "ORNITHO_API_BASE"
+
+
+def original(model, name):
+    """Other test modules replace model methods with mocks, patch the method of the base class back in"""
+    for base in model.__mro__[1:]:
+        if name in base.__dict__:
+            return mock.patch.object(model, name, base.__dict__[name])
+
+
+class TestMockBiolovisionServer(TestCase):
+    def setUp(self):
+        self.server = MockBiolovisionServer(page_size=3, chunk_size=64, seed=1)
+        self.server.add_sightings(synthetic_sightings(7))
+        self.server.add_forms([synthetic_form(100, 4, start_id=50)])
+        self.server.add_resource("places", synthetic_places(5))
+        for endpoint, objects in synthetic_fields(2).items():
+            self.server.add_resource(endpoint, objects)
+        self.server.start()
+        self.patches = ExitStack()
+        self.patches.enter_context(
+            mock.patch.object(ornitho, "api_base", self.server.api_base)
+        )
+        for model, name in (
+            (Observation, "request"),
+            (Observation, "get"),
+            (Place, "request"),
+            (Place, "get"),
+            (Field, "list_all"),
+        ):
+            self.patches.enter_context(original(model, name))
+        self.requester = APIRequester(
+            retry_policy=RetryPolicy(backoff_base=0.0, jitter=False)
+        )
+
+    def tearDown(self):
+        self.requester.close()
+        self.patches.close()
+        self.server.stop()
+
+    def test_search_pagination(self):
+        data, pk = self.requester.request(
+            method="post",
+            url="observations/search",
+            body={"period_choice": "all"},
+            request_all=True,
+        )
+        self.assertEqual(11, len(data))
+        self.assertEqual(
+            list(range(1, 8)) + list(range(50, 54)),
+            [int(sighting["observers"][0]["id_sighting"]) for sighting in data],
+        )
+        # Sightings of the form are flattened, each with the form attached
+        self.assertEqual("100", data[-1]["form"]["@id"])
+        # 4 pages and an empty page, closing the cursor
+        self.assertEqual(5, len(self.server.requests))
+        self.assertNotIn("pagination_key", self.server.requests[0].params)
+        self.assertEqual(pk, self.server.requests[1].params["pagination_key"])
+
+        pages = list(
+            self.requester.iter_pages(
+                method="post",
+                url="observations/search",
+                body={"id_sightings_list": [2, 5, 51, 999]},
+            )
+        )
+        self.assertEqual([3, 0], [len(page) for page, _ in pages])
+
+    def test_search_stream(self):
+        body = {"period_choice": "all"}
+        data = list(
+            self.requester.iter_request(
+                method="post", url="observations/search", body=body
+            )
+        )
+        streamed = list(
+            self.requester.iter_request(
+                method="post", url="observations/search", body=body, stream=True
+            )
+        )
+        # Sightings of forms are streamed one by one, with the same form header
+        self.assertEqual(data, streamed)
+        self.assertIs(streamed[-1]["form"], streamed[-2]["form"])
+
+    def test_search_filter(self):
+        id_place = Observation.get(50).place.id_
+        self.assertEqual(
+            [50, 51, 52, 53],
+            [o.id_ for o in Observation.search_all(id_place=id_place)],
+        )
+        day = Observation.get(3).timing.date()
+        observations = Observation.search_all(date_from=day, date_to=day)
+        self.assertIn(3, [observation.id_ for observation in observations])
+
+    def test_form(self):
+        form = Form.get(100)
+        self.assertEqual(4, len(form.observations))
+        self.assertEqual(100, Observation.get(51).id_form)
+        with self.assertRaises(ObjectNotFoundException):
+            Form.get(101)
+
+    def test_create_update_delete(self):
+        since = datetime.now() - timedelta(seconds=1)
+        observation = Observation.get(1)
+        observation._raw_data["observers"][0].pop("id_sighting")
+        id_ = Observation.create_in_ornitho(
+            data={"sightings": [observation.raw_data_trim_field_ids()]}
+        )
+        self.assertEqual(101, id_)
+        Observation.get(2).update()
+        Observation(3).delete()
+        self.assertNotIn(3, self.server.sightings)
+        self.assertEqual(([101, 2], [3]), Observation.diff_ids(date=since))
+        self.assertEqual(
+            ([], []), Observation.diff_ids(date=datetime.now() + timedelta(seconds=1))
+        )
+
+    def test_resources(self):
+        self.assertEqual(5, len(Place.list_all()))
+        self.assertEqual("Place 2", Place.get(2).name)
+        self.assertEqual([1, 2, 3], [o.value for o in Field.get(1).options])
+        self.server.modify("places", 4, "deleted")
+        self.assertEqual(
+            ([], [4]), Place.diff_ids(date=datetime.now() - timedelta(minutes=1))
+        )
+        with self.assertRaises(ObjectNotFoundException):
+            Place.get(6)
+
+    def test_fail_next(self):
+        self.server.fail_next(503, count=2, path="places/1")
+        self.assertEqual(1, Place.get(1, retries=2).id_)
+        self.assertEqual(3, len(self.server.requests))
+
+        self.server.fail_next(503)
+        with self.assertRaises(ServiceUnavailableException):
+            Place.get(1)
+
+        self.server.fail_next(0)
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.requester.request(method="get", url="places/1", retries=0)
+        self.assertEqual(
+            1, len(self.requester.request(method="get", url="places/1")[0])
+        )
+
+    def test_fail_next_processed(self):
+        sighting = synthetic_sightings(1)[0]
+        count = len(self.server.sightings)
+
+        # The create is stored, but the response is lost: it is not repeated
+        self.server.fail_next(0, path="observations", processed=True)
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            Observation.create_many_in_ornitho({"sightings": [sighting]}, retries=3)
+        self.assertEqual(count + 1, len(self.server.sightings))
+        self.assertEqual(
+            1,
+            len(
+                [
+                    request
+                    for request in self.server.requests
+                    if request.method == "post"
+                ]
+            ),
+        )
+
+        # The create is rejected before it is processed: it is repeated
+        self.server.fail_next(503, path="observations")
+        with mock.patch("ornitho.api_requester.time.sleep"):
+            ids = Observation.create_many_in_ornitho(
+                {"sightings": [sighting]}, retries=1
+            )
+        self.assertEqual(1, len(ids))
+        self.assertEqual(count + 2, len(self.server.sightings))
+
+        # Idempotent requests are repeated
+        self.server.fail_next(0, path="places/1", processed=True)
+        self.assertEqual(
+            1, len(self.requester.request(method="get", url="places/1", retries=1)[0])
+        )
+
+    def test_error_rate_and_latency(self):
+        self.server.error_rate = 1.0
+        self.server.error_status = 429
+        with self.assertRaises(ornitho.APIHttpException):
+            Place.get(1, retries=1)
+        self.assertEqual(2, len(self.server.requests))
+        self.server.error_rate = 0.0
+        self.server.latency = 0.05
+        started = datetime.now()
+        Place.get(1)
+        self.assertGreaterEqual(datetime.now() - started, timedelta(seconds=0.05))
+
+    def test_fixture(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "fixture.json")
+            self.server.modify("places", 4)
+            self.server.save_fixture(path)
+            with MockBiolovisionServer() as server:
+                server.load_fixture(path)
+                self.assertEqual(self.server.sightings, server.sightings)
+                self.assertEqual(self.server.forms, server.forms)
+                self.assertEqual(self.server.resources, server.resources)
+                self.assertEqual(self.server.modifications, server.modifications)